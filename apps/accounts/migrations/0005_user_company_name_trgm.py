@@ -0,0 +1,20 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:06
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_alter_user_role'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['company_name'], name='accounts_company_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 
@@ -48,6 +49,10 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Typo-tolerant producer name search (pg_trgm)
+            GinIndex(fields=['company_name'], opclasses=['gin_trgm_ops'], name='accounts_company_name_trgm'),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
@@ -2,7 +2,11 @@
 Tests for password reset functionality
 """
 import json
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.core import mail
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
@@ -10,6 +14,8 @@ from django.utils.http import urlsafe_base64_encode
 from django.utils.encoding import force_bytes
 from rest_framework import status
 from rest_framework.test import APIClient
+from apps.booths.models import Booth
+from apps.core.utils import generate_unique_slug
 from .models import User
 
 
@@ -253,3 +259,41 @@ class PasswordResetWebViewTestCase(TestCase):
         self.assertEqual(response.status_code, 302)  # Redirect to login
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password('newpassword123'))
+
+
+class BoothSlugAllocationTestCase(TestCase):
+    """Test booth slug allocation at producer signup"""
+
+    def create_producer(self, username, company_name='Seoul Pictures'):
+        return User.objects.create_user(
+            username=username,
+            email=f'{username}@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name=company_name
+        )
+
+    def test_crowded_name_takes_one_lookup(self):
+        """The next suffix comes from one query, however many are taken"""
+        for i in range(5):
+            self.create_producer(f'producer{i}')
+        Booth.objects.filter(slug='seoul-pictures-4').update(slug='seoul-pictures-40')
+        Booth.objects.filter(slug='seoul-pictures-3').update(slug='seoul-pictures-x')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(generate_unique_slug(Booth, 'Seoul Pictures'), 'seoul-pictures-41')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(generate_unique_slug(Booth, 'Busan Studio'), 'busan-studio')
+
+    def test_signup_slugs(self):
+        """Producers with the same company name get suffixed booth slugs"""
+        slugs = [self.create_producer(f'producer{i}').booth_slug for i in range(3)]
+        self.assertEqual(slugs, ['seoul-pictures', 'seoul-pictures-1', 'seoul-pictures-2'])
+
+    def test_concurrent_signup_retries(self):
+        """A slug taken between lookup and insert is reallocated"""
+        self.create_producer('first')
+        with mock.patch('apps.core.utils.generate_unique_slug', side_effect=['seoul-pictures', 'seoul-pictures-1']):
+            producer = self.create_producer('second')
+        self.assertEqual(producer.booth_slug, 'seoul-pictures-1')
+        self.assertEqual(Booth.objects.get(producer=producer).slug, 'seoul-pictures-1')
@@ -2,12 +2,13 @@
 API URL routing for booth endpoints
 """
 from django.urls import path
-from .api_views import BoothDetailView, BoothContentsView
+from .api_views import BoothListView, BoothDetailView, BoothContentsView
 
 app_name = 'booths_api'
 
 urlpatterns = [
-    # Public booth profile
+    # Public booth listing and profile
+    path('', BoothListView.as_view(), name='booth_list'),
     path('<slug:slug>/', BoothDetailView.as_view(), name='booth_detail'),
     path('<slug:slug>/contents/', BoothContentsView.as_view(), name='booth_contents'),
 ]
@@ -1,20 +1,84 @@
 """
 API views for public booth profiles
 """
+from django.db.models import Max
+from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.db.models import F
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.constants import CONTENT_STATUS_PUBLIC
+from apps.core.cache_policy import public_cache_policy
+from apps.core.conditional import is_conditional, latest, make_etag, not_modified, set_validators
+from apps.core.counters import viewer_key
+from apps.core.serializers import apply_sparse_fieldset
+from apps.contents.filters import GENRE_MODE_ALL, GENRE_MODE_ANY, GENRE_MODES, parse_genres
 from apps.contents.serializers import ContentPublicSerializer
 from .models import Booth
 from .serializers import BoothPublicSerializer
 
 
+# Directory ordering values and the ranking behind them (active boosts always first)
+BOOTH_ORDERINGS = {
+    'trending': '-trending_score',
+    'views': '-view_count',
+    '-created_at': '-created_at',
+}
+
+
+@extend_schema(tags=['Booth - Public'])
+@method_decorator(public_cache_policy(), name='get')
+class BoothListView(APIView):
+    """Public booth directory"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('ordering', str, description='Sort by: trending (default), views, -created_at. Boosted booths come first'),
+            OpenApiParameter('country', str, description="Producer's country (case-insensitive)"),
+            OpenApiParameter('genre', str, description='Genre tag(s); repeat or comma-separate'),
+            OpenApiParameter('genre_mode', str, description='all (default): booth has every genre; any: at least one'),
+            OpenApiParameter('pagination', str, description='page (default), cursor or estimated'),
+        ],
+        responses={
+            200: BoothPublicSerializer(many=True),
+            400: OpenApiResponse(description='Invalid filter')
+        }
+    )
+    def get(self, request):
+        """List booths, boosted first, then hottest (or most viewed / newest)"""
+        genre_mode = request.query_params.get('genre_mode', GENRE_MODE_ALL)
+        if genre_mode not in GENRE_MODES:
+            return error_response(
+                message=f"Invalid genre_mode. Must be one of: {', '.join(GENRE_MODES)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        ordering = BOOTH_ORDERINGS.get(request.query_params.get('ordering'), BOOTH_ORDERINGS['trending'])
+        queryset = Booth.objects.select_related('producer').order_by('-is_boosted', ordering, '-id')
+
+        country = request.query_params.get('country', '').strip().lower()
+        if country:
+            queryset = queryset.filter(country=country)
+        genres = parse_genres(request.query_params)
+        if genres:
+            if genre_mode == GENRE_MODE_ANY:
+                queryset = queryset.filter(genre_tags__overlap=genres)
+            else:
+                queryset = queryset.filter(genre_tags__contains=genres)
+
+        return paginated_response(
+            queryset,
+            BoothPublicSerializer,
+            request,
+            message="Booths retrieved successfully"
+        )
+
+
 @extend_schema(tags=['Booth - Public'])
+@method_decorator(public_cache_policy(), name='get')
 class BoothDetailView(APIView):
     """Public booth profile view"""
     permission_classes = [AllowAny]
@@ -26,7 +90,11 @@ class BoothDetailView(APIView):
         }
     )
     def get(self, request, slug):
-        """Get booth profile by slug"""
+        """Get booth profile by slug (304 responses are not counted as views)"""
+        response = booth_not_modified(request, slug, 'detail')
+        if response is not None:
+            return response
+
         try:
             booth = Booth.objects.select_related('producer').get(slug=slug)
         except Booth.DoesNotExist:
@@ -35,23 +103,29 @@ class BoothDetailView(APIView):
                 status_code=status.HTTP_404_NOT_FOUND
             )
 
-        # Increment view count (atomic)
-        Booth.objects.filter(pk=booth.pk).update(view_count=F('view_count') + 1)
-        booth.refresh_from_db(fields=['view_count'])
+        # Increment view count (buffered)
+        booth.increment_view_count(viewer_key(request))
 
         serializer = BoothPublicSerializer(booth)
-        return success_response(
+        response = success_response(
             data=serializer.data,
             message="Booth profile retrieved successfully"
         )
+        return set_validators(response, *booth_validators(
+            request, 'detail', booth.pk, booth.updated_at, booth.producer.updated_at
+        ))
 
 
 @extend_schema(tags=['Booth - Public'])
+@method_decorator(public_cache_policy(), name='get')
 class BoothContentsView(APIView):
     """List all public contents from a booth"""
     permission_classes = [AllowAny]
 
     @extend_schema(
+        parameters=[
+            OpenApiParameter('fields', str, description='Comma-separated response fields to return (id is always included)'),
+        ],
         responses={
             200: ContentPublicSerializer(many=True),
             404: OpenApiResponse(description='Booth not found')
@@ -59,8 +133,14 @@ class BoothContentsView(APIView):
     )
     def get(self, request, slug):
         """Get all public contents from booth"""
+        response = booth_not_modified(request, slug, 'contents')
+        if response is not None:
+            return response
+
         try:
-            booth = Booth.objects.select_related('producer').get(slug=slug)
+            booth = Booth.objects.select_related('producer').annotate(
+                contents_updated_at=Max('producer__contents__updated_at')
+            ).get(slug=slug)
         except Booth.DoesNotExist:
             return error_response(
                 message="Booth not found",
@@ -70,11 +150,51 @@ class BoothContentsView(APIView):
         # Get public contents from this producer
         queryset = booth.producer.contents.filter(
             status=CONTENT_STATUS_PUBLIC
-        ).order_by('-created_at')
+        ).select_related('producer').defer('search_vector').order_by('-created_at')
 
-        return paginated_response(
+        try:
+            queryset, fields = apply_sparse_fieldset(queryset, ContentPublicSerializer, request)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        response = paginated_response(
             queryset,
             ContentPublicSerializer,
             request,
-            message=f"Contents from {booth.slug} retrieved successfully"
+            message=f"Contents from {booth.slug} retrieved successfully",
+            serializer_kwargs={'fields': fields}
         )
+        return set_validators(response, *booth_validators(
+            request, 'contents', booth.pk, booth.updated_at, booth.producer.updated_at,
+            booth.contents_updated_at
+        ))
+
+
+def booth_validators(request, kind, pk, updated_at, producer_updated_at, contents_updated_at=None):
+    """
+    (ETag, Last-Modified) of a booth payload
+
+    Count changes touch the booth's updated_at; the contents list also
+    follows the newest updated_at among the producer's contents. Query
+    parameters (page, fields) are part of the URL the client revalidates,
+    so they need no part here.
+    """
+    return (
+        make_etag(request, 'booth', kind, pk, updated_at, producer_updated_at, contents_updated_at),
+        latest(updated_at, producer_updated_at, contents_updated_at),
+    )
+
+
+def booth_not_modified(request, slug, kind):
+    """304 from a single slug lookup when the client's copy is current"""
+    if not is_conditional(request):
+        return None
+    booths = Booth.objects.filter(slug=slug)
+    fields = ['pk', 'updated_at', 'producer__updated_at']
+    if kind == 'contents':
+        booths = booths.annotate(contents_updated_at=Max('producer__contents__updated_at'))
+        fields.append('contents_updated_at')
+    version = booths.values_list(*fields).first()
+    if version is None:
+        return None
+    return not_modified(request, *booth_validators(request, kind, *version))
@@ -0,0 +1,18 @@
+"""
+Clear lapsed booth boosts (run frequently, e.g. every minute)
+
+The booth directory ranks on is_boosted alone, so a boost stays on top
+until this job clears it.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.booths.models import Booth
+
+
+class Command(BaseCommand):
+    help = 'Turn off boosts whose expiry has passed'
+
+    def handle(self, *args, **options):
+        expired = Booth.expire_boosts()
+
+        self.stdout.write(self.style.SUCCESS(f'Expired {expired} booth boosts'))
@@ -0,0 +1,15 @@
+"""
+Repair drifted Booth.public_content_count values (run periodically, e.g. daily)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.booths.models import Booth
+
+
+class Command(BaseCommand):
+    help = "Recount booths' public contents and fix the ones that drifted"
+
+    def handle(self, *args, **options):
+        repaired = Booth.reconcile_public_content_counts()
+
+        self.stdout.write(self.style.SUCCESS(f'Repaired public content counts of {repaired} booths'))
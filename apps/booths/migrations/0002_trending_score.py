@@ -0,0 +1,22 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booths', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booth',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, help_text="Sum of the producer's public content trending scores", verbose_name='Trending score'),
+        ),
+        migrations.AddIndex(
+            model_name='booth',
+            index=models.Index(fields=['-trending_score', '-id'], name='booths_boot_trendin_d228d1_idx'),
+        ),
+    ]
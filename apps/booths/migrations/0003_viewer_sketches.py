@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booths', '0002_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoothViewerSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('registers', models.BinaryField(verbose_name='Registers')),
+                ('booth', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='viewer_sketches', to='booths.booth', verbose_name='Booth')),
+            ],
+            options={
+                'verbose_name': 'Booth viewer sketch',
+                'verbose_name_plural': 'Booth viewer sketches',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='boothviewersketch',
+            constraint=models.UniqueConstraint(fields=('booth', 'date'), name='unique_booth_viewer_sketch_date'),
+        ),
+    ]
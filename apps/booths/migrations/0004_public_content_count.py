@@ -0,0 +1,30 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:35
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_public_contents(apps, schema_editor):
+    Booth = apps.get_model('booths', 'Booth')
+    Content = apps.get_model('contents', 'Content')
+    counts = Content.objects.filter(
+        producer=models.OuterRef('producer'), status='public'
+    ).order_by().values('producer').annotate(n=models.Count('pk')).values('n')[:1]
+    Booth.objects.update(public_content_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booths', '0003_viewer_sketches'),
+        ('contents', '0011_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booth',
+            name='public_content_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Maintained by Content.save; repaired by reconcile_booth_counts', verbose_name='Public content count'),
+        ),
+        migrations.RunPython(count_public_contents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:38
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def copy_producer_fields(apps, schema_editor):
+    Booth = apps.get_model('booths', 'Booth')
+    booths = list(Booth.objects.select_related('producer'))
+    for booth in booths:
+        booth.country = (booth.producer.country or '').strip().lower()
+        booth.genre_tags = [tag for tag in booth.producer.genre_tags or [] if isinstance(tag, str)]
+    Booth.objects.bulk_update(booths, ['country', 'genre_tags'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booths', '0004_public_content_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booth',
+            name='booths_boot_trendin_d228d1_idx',
+        ),
+        migrations.AddField(
+            model_name='booth',
+            name='country',
+            field=models.CharField(blank=True, editable=False, help_text="Producer's country, lowercased", max_length=100, verbose_name='Country'),
+        ),
+        migrations.AddField(
+            model_name='booth',
+            name='genre_tags',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, editable=False, help_text="Producer's genre tags", size=None, verbose_name='Genre tags'),
+        ),
+        migrations.RunPython(copy_producer_fields, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='booth',
+            index=models.Index(fields=['-is_boosted', '-trending_score', '-id'], name='booths_boot_is_boos_723cdb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booth',
+            index=models.Index(fields=['-is_boosted', '-view_count', '-id'], name='booths_boot_is_boos_cd0fda_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booth',
+            index=models.Index(fields=['country', '-is_boosted', '-trending_score', '-id'], name='booths_boot_country_835717_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booth',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genre_tags'], name='booths_genre_tags_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='booth',
+            index=models.Index(condition=models.Q(('is_boosted', True)), fields=['boost_expires_at'], name='booths_boosted_expiry'),
+        ),
+    ]
@@ -1,7 +1,11 @@
 """
 Booth model for producer profiles
 """
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.conf import settings
 
 
@@ -34,6 +38,34 @@ class Booth(models.Model):
         blank=True,
         verbose_name='Boost expires at'
     )
+    trending_score = models.FloatField(
+        default=0,
+        editable=False,
+        verbose_name='Trending score',
+        help_text="Sum of the producer's public content trending scores"
+    )
+    # Copied from the producer (see signals) so directory filters use booth indexes
+    country = models.CharField(
+        max_length=100,
+        blank=True,
+        editable=False,
+        verbose_name='Country',
+        help_text="Producer's country, lowercased"
+    )
+    genre_tags = ArrayField(
+        models.CharField(max_length=50),
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name='Genre tags',
+        help_text="Producer's genre tags"
+    )
+    public_content_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Public content count',
+        help_text='Maintained by Content.save; repaired by reconcile_booth_counts'
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         verbose_name='Created at'
@@ -47,6 +79,14 @@ class Booth(models.Model):
         verbose_name = 'Booth'
         verbose_name_plural = 'Booths'
         ordering = ['-created_at']
+        indexes = [
+            # Directory orderings: active boosts first (see expire_boosts)
+            models.Index(fields=['-is_boosted', '-trending_score', '-id']),
+            models.Index(fields=['-is_boosted', '-view_count', '-id']),
+            models.Index(fields=['country', '-is_boosted', '-trending_score', '-id']),
+            GinIndex(fields=['genre_tags'], name='booths_genre_tags_gin'),
+            models.Index(fields=['boost_expires_at'], condition=Q(is_boosted=True), name='booths_boosted_expiry'),
+        ]
 
     def __str__(self):
         return f"Booth: {self.slug} ({self.producer.username})"
@@ -61,7 +101,82 @@ class Booth(models.Model):
         from django.utils import timezone
         return timezone.now() < self.boost_expires_at
 
-    def increment_view_count(self):
-        """Increment view count atomically"""
-        from django.db.models import F
-        Booth.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
+    def increment_view_count(self, viewer=None):
+        """Count a view (buffered, see apps.core.counters) and, with a viewer key, a distinct viewer"""
+        from apps.core.counters import booth_view_counter, booth_viewer_sketches
+        self.view_count += booth_view_counter.increment(self.pk)
+        if viewer is not None:
+            booth_viewer_sketches.add(self.pk, viewer)
+
+    @staticmethod
+    def producer_fields(producer):
+        """Directory columns copied from the producer's profile"""
+        return {
+            'country': (producer.country or '').strip().lower(),
+            'genre_tags': [tag for tag in producer.genre_tags or [] if isinstance(tag, str)],
+        }
+
+    @classmethod
+    def expire_boosts(cls, now=None):
+        """Clear lapsed boosts in one UPDATE so is_boosted alone ranks the directory; returns the number expired"""
+        from django.utils import timezone
+        now = now or timezone.now()
+        return cls.objects.filter(is_boosted=True).filter(
+            Q(boost_expires_at__isnull=True) | Q(boost_expires_at__lte=now)
+        ).update(is_boosted=False, updated_at=now)
+
+    @classmethod
+    def adjust_public_content_count(cls, producer_id, delta):
+        """Add delta to a producer's booth count in place (call inside the content's transaction)"""
+        from django.utils import timezone
+        if delta:
+            cls.objects.filter(producer_id=producer_id).update(
+                public_content_count=F('public_content_count') + delta,
+                updated_at=timezone.now()  # The count is part of the booth payload (and its ETag)
+            )
+
+    @classmethod
+    def reconcile_public_content_counts(cls):
+        """Recount public contents and fix drifted booths in one UPDATE; returns the number fixed"""
+        from django.utils import timezone
+        from apps.contents.models import Content
+        from apps.core.constants import CONTENT_STATUS_PUBLIC
+
+        actual = Coalesce(
+            Subquery(
+                Content.objects.filter(producer=OuterRef('producer'), status=CONTENT_STATUS_PUBLIC)
+                .order_by().values('producer').annotate(n=Count('pk')).values('n')[:1]
+            ),
+            Value(0),
+            output_field=IntegerField()
+        )
+        return cls.objects.alias(actual=actual).exclude(
+            public_content_count=F('actual')
+        ).update(public_content_count=actual, updated_at=timezone.now())
+
+
+class BoothViewerSketch(models.Model):
+    """Daily HyperLogLog sketch of a booth's distinct viewers (see apps.core.hll)"""
+
+    booth = models.ForeignKey(
+        Booth,
+        on_delete=models.CASCADE,
+        related_name='viewer_sketches',
+        verbose_name='Booth'
+    )
+    date = models.DateField(
+        verbose_name='Date'
+    )
+    registers = models.BinaryField(
+        verbose_name='Registers'
+    )
+
+    class Meta:
+        verbose_name = 'Booth viewer sketch'
+        verbose_name_plural = 'Booth viewer sketches'
+        constraints = [
+            models.UniqueConstraint(fields=['booth', 'date'], name='unique_booth_viewer_sketch_date'),
+        ]
+
+    def __str__(self):
+        return f"Viewers of booth {self.booth_id} on {self.date}"
@@ -13,7 +13,7 @@ class BoothPublicSerializer(serializers.ModelSerializer):
     producer_logo = serializers.ImageField(source='producer.logo', read_only=True)
     producer_country = serializers.CharField(source='producer.country', read_only=True)
     producer_genre_tags = serializers.ListField(source='producer.genre_tags', read_only=True)
-    content_count = serializers.SerializerMethodField()
+    content_count = serializers.IntegerField(source='public_content_count', read_only=True)
 
     class Meta:
         model = Booth
@@ -23,7 +23,4 @@ class BoothPublicSerializer(serializers.ModelSerializer):
             'producer_country', 'producer_genre_tags', 'content_count'
         )
         read_only_fields = fields
-
-    def get_content_count(self, obj):
-        """Get count of public contents"""
-        return obj.producer.contents.filter(status='public').count()
+        fast_read = True  # Directory pages render from values() rows
@@ -1,10 +1,10 @@
 """
-Signal handlers for Booth auto-creation
+Signal handlers for Booth auto-creation and producer profile sync
 """
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.conf import settings
-from apps.core.utils import generate_unique_slug
+from apps.core.utils import create_with_unique_slug
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -16,16 +16,27 @@ def create_booth_for_producer(sender, instance, created, **kwargs):
     if created and instance.role == 'creator':
         from apps.booths.models import Booth
 
-        # Generate unique slug from company name or username
+        # Create booth under a unique slug from company name or username
         base_slug = instance.company_name or instance.username
-        unique_slug = generate_unique_slug(Booth, base_slug, slug_field='slug')
-
-        # Create booth
-        booth = Booth.objects.create(
-            producer=instance,
-            slug=unique_slug
+        booth = create_with_unique_slug(
+            Booth, base_slug,
+            lambda slug: Booth.objects.create(producer=instance, slug=slug, **Booth.producer_fields(instance)),
+            slug_field='slug'
         )
 
         # Update user's booth_slug field
-        instance.booth_slug = unique_slug
+        instance.booth_slug = booth.slug
         instance.save(update_fields=['booth_slug'])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_booth_directory_fields(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the booth's copy of the producer's country and genres current"""
+    if created or instance.role != 'creator':
+        return
+    if update_fields is not None and not {'country', 'genre_tags'} & set(update_fields):
+        return
+
+    from apps.booths.models import Booth
+    fields = Booth.producer_fields(instance)
+    Booth.objects.filter(producer=instance).exclude(**fields).update(**fields)
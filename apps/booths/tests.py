@@ -0,0 +1,145 @@
+"""
+Tests for booth listings and denormalized booth fields
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.contents.tests import create_content
+from apps.core.constants import CONTENT_STATUS_DRAFT, CONTENT_STATUS_PUBLIC
+from .models import Booth
+
+
+@override_settings(VIEW_COUNTER_FLUSH_INTERVAL=3600)
+class BoothContentCountTestCase(TestCase):
+    """Test the denormalized Booth.public_content_count"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+
+    def count(self):
+        return Booth.objects.values_list('public_content_count', flat=True).get(producer=self.producer)
+
+    def test_count_follows_status_changes(self):
+        """Create, publish, unpublish, soft and hard delete move the count"""
+        public = create_content(self.producer, title='Public')
+        draft = create_content(self.producer, title='Draft', status=CONTENT_STATUS_DRAFT)
+        self.assertEqual(self.count(), 1)
+
+        draft.status = CONTENT_STATUS_PUBLIC
+        draft.save()
+        draft.title = 'Published'
+        draft.save()
+        self.assertEqual(self.count(), 2)
+
+        draft.status = CONTENT_STATUS_DRAFT
+        draft.save(update_fields=['status'])
+        self.assertEqual(self.count(), 1)
+
+        public.soft_delete()
+        self.assertEqual(self.count(), 0)
+
+        draft.status = CONTENT_STATUS_PUBLIC
+        draft.save()
+        draft.delete()
+        self.assertEqual(self.count(), 0)
+
+    def test_reconcile_command_repairs_drift(self):
+        """Bulk updates bypass save(); the command recounts"""
+        create_content(self.producer)
+        create_content(self.producer)
+        Booth.objects.update(public_content_count=7)
+
+        out = StringIO()
+        call_command('reconcile_booth_counts', stdout=out)
+        self.assertEqual(self.count(), 2)
+        self.assertIn('1 booths', out.getvalue())
+
+    def test_booth_list_has_no_per_booth_queries(self):
+        """content_count is read from the booth row"""
+        create_content(self.producer)
+        for i in range(3):
+            User.objects.create_user(
+                username=f'producer{i}',
+                email=f'producer{i}@example.com',
+                password='password123',
+                role=User.Role.CREATOR
+            )
+        url = reverse('booths_api:booth_list')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        counts = {item['producer_username']: item['content_count'] for item in response.json()['data']}
+        self.assertEqual(counts['producer'], 1)
+        self.assertEqual(len(queries), 2)  # COUNT(*) for the page and the page itself
+
+
+class BoothDirectoryTestCase(TestCase):
+    """Test the booth directory ranking, filters and boost expiry"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('booths_api:booth_list')
+        self.seoul = self.create_producer('seoul', 'South Korea', ['drama', 'romance'])
+        self.busan = self.create_producer('busan', 'south korea ', ['action'])
+        self.tokyo = self.create_producer('tokyo', 'Japan', ['drama'])
+        Booth.objects.filter(producer=self.seoul).update(trending_score=5, view_count=10)
+        Booth.objects.filter(producer=self.busan).update(trending_score=9, view_count=1)
+        Booth.objects.filter(producer=self.tokyo).update(
+            trending_score=1, is_boosted=True, boost_expires_at=timezone.now() + timedelta(days=1)
+        )
+
+    def create_producer(self, username, country, genre_tags):
+        return User.objects.create_user(
+            username=username,
+            email=f'{username}@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            country=country,
+            genre_tags=genre_tags
+        )
+
+    def usernames(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['producer_username'] for item in response.json()['data']]
+
+    def test_boosted_first_then_ordering(self):
+        """Active boosts lead; the rest follow trending or views"""
+        self.assertEqual(self.usernames(), ['tokyo', 'busan', 'seoul'])
+        self.assertEqual(self.usernames(ordering='views'), ['tokyo', 'seoul', 'busan'])
+        self.assertEqual(self.usernames(pagination='cursor'), ['tokyo', 'busan', 'seoul'])
+
+    def test_country_and_genre_filters(self):
+        """Filters read the booth's copy of the producer profile"""
+        self.assertEqual(self.usernames(country='South Korea'), ['busan', 'seoul'])
+        self.assertEqual(self.usernames(genre='drama'), ['tokyo', 'seoul'])
+        self.assertEqual(self.usernames(genre='drama,action'), [])
+        self.assertEqual(self.usernames(genre='drama,action', genre_mode='any'), ['tokyo', 'busan', 'seoul'])
+
+        self.seoul.country = 'Japan'
+        self.seoul.save(update_fields=['country'])
+        self.assertEqual(self.usernames(country='japan'), ['tokyo', 'seoul'])
+
+    def test_expire_boosts(self):
+        """Lapsed boosts are cleared in bulk and lose their rank"""
+        Booth.objects.filter(producer=self.tokyo).update(boost_expires_at=timezone.now() - timedelta(minutes=1))
+        out = StringIO()
+        call_command('expire_boosts', stdout=out)
+        self.assertIn('Expired 1 booth boosts', out.getvalue())
+        self.assertEqual(self.usernames(), ['busan', 'seoul', 'tokyo'])
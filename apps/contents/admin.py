@@ -2,7 +2,7 @@
 Admin configuration for Content model
 """
 from django.contrib import admin
-from .models import Content
+from .models import Content, ExchangeRate
 
 
 @admin.register(Content)
@@ -13,7 +13,7 @@ class ContentAdmin(admin.ModelAdmin):
     )
     list_filter = ('status', 'rating', 'currency', 'created_at')
     search_fields = ('title', 'description', 'producer__username', 'producer__company_name')
-    readonly_fields = ('view_count', 'created_at', 'updated_at', 'deleted_at')
+    readonly_fields = ('view_count', 'price_usd_normalized', 'created_at', 'updated_at', 'deleted_at')
     list_per_page = 50
 
     fieldsets = (
@@ -27,7 +27,7 @@ class ContentAdmin(admin.ModelAdmin):
             )
         }),
         ('Pricing', {
-            'fields': ('price', 'currency')
+            'fields': ('price', 'currency', 'price_usd_normalized')
         }),
         ('Status & Visibility', {
             'fields': ('status',)
@@ -40,3 +40,14 @@ class ContentAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """Include soft-deleted items in admin"""
         return Content.objects.all()
+
+
+@admin.register(ExchangeRate)
+class ExchangeRateAdmin(admin.ModelAdmin):
+    list_display = ('currency', 'usd_rate', 'updated_at')
+    readonly_fields = ('updated_at',)
+
+    def save_model(self, request, obj, form, change):
+        """Re-normalize prices in this currency after a rate change"""
+        super().save_model(request, obj, form, change)
+        ExchangeRate.renormalize_prices([obj.currency])
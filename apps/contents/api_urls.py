@@ -2,12 +2,15 @@
 API URL routing for content endpoints
 """
 from django.urls import path
-from .api_views import ContentListView, ContentDetailView
+from .api_views import ContentListView, ContentFacetsView, ContentSuggestView, ContentBatchView, ContentDetailView
 
 app_name = 'contents_api'
 
 urlpatterns = [
     # Public content browsing
     path('', ContentListView.as_view(), name='content_list'),
+    path('facets/', ContentFacetsView.as_view(), name='content_facets'),
+    path('suggest/', ContentSuggestView.as_view(), name='content_suggest'),
+    path('batch/', ContentBatchView.as_view(), name='content_batch'),
     path('<int:pk>/', ContentDetailView.as_view(), name='content_detail'),
 ]
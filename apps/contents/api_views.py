@@ -1,19 +1,29 @@
 """
 API views for public content browsing
 """
+from django.utils.decorators import method_decorator
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
-from django.db.models import Q
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.constants import CONTENT_STATUS_PUBLIC
+from apps.core.cache_policy import public_cache_policy
+from apps.core.conditional import is_conditional, latest, make_etag, not_modified, set_validators
+from apps.core.counters import viewer_key
+from apps.core.serializers import apply_sparse_fieldset
 from .models import Content
+from .facets import get_facets
+from .filters import CONTENT_ORDERINGS, parse_content_filters, apply_content_filters
+from .result_cache import cached_response
+from .search import search_suggestions
+from .suggest import suggest
 from .serializers import ContentPublicSerializer, ContentDetailSerializer
 
 
 @extend_schema(tags=['Content - Public'])
+@method_decorator(public_cache_policy(), name='get')
 class ContentListView(generics.ListAPIView):
     """Public content listing with filters and search"""
     permission_classes = [AllowAny]
@@ -21,79 +31,196 @@ class ContentListView(generics.ListAPIView):
 
     @extend_schema(
         parameters=[
-            OpenApiParameter('search', str, description='Search in title and description'),
-            OpenApiParameter('genre', str, description='Filter by genre tag'),
-            OpenApiParameter('min_price', float, description='Minimum price'),
-            OpenApiParameter('max_price', float, description='Maximum price'),
+            OpenApiParameter('search', str, description='Full-text search in title, description and producer name'),
+            OpenApiParameter(
+                'search_mode', str,
+                description='fulltext (default) or fuzzy (typo-tolerant match on title and producer name)'
+            ),
+            OpenApiParameter('fields', str, description='Comma-separated response fields to return (id is always included)'),
+            OpenApiParameter('genre', str, description='Filter by genre tags (repeat or comma-separate for several)'),
+            OpenApiParameter('genre_mode', str, description='all (default): has every genre, any: has at least one'),
+            OpenApiParameter('min_price', float, description='Minimum price in price_currency (any content currency matches)'),
+            OpenApiParameter('max_price', float, description='Maximum price in price_currency (any content currency matches)'),
+            OpenApiParameter('price_currency', str, description='Currency of min_price/max_price (default USD)'),
             OpenApiParameter('currency', str, description='Currency code (USD, KRW, etc)'),
-            OpenApiParameter('ordering', str, description='Sort by: -created_at, price, -price, view_count'),
+            OpenApiParameter(
+                'ordering', str,
+                description='Sort by: -created_at, price, -price (by USD value), view_count, trending, relevance (default when searching)'
+            ),
         ],
         responses={200: ContentPublicSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         """List all public contents with filtering and sorting"""
-        queryset = self.get_queryset()
+        return cached_response('list', request, lambda: self.list_response(request))
 
-        # Search
-        search = request.query_params.get('search')
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+    def list_response(self, request):
+        """Build the filtered, sorted and paginated listing"""
+        try:
+            filters = parse_content_filters(request.query_params)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
-        # Genre filter
-        genre = request.query_params.get('genre')
-        if genre:
-            queryset = queryset.filter(genre_tags__contains=[genre])
-
-        # Price range filter
-        min_price = request.query_params.get('min_price')
-        max_price = request.query_params.get('max_price')
-
-        if min_price is not None and max_price is not None:
-            try:
-                min_price = float(min_price)
-                max_price = float(max_price)
-                if min_price > max_price:
-                    return error_response(
-                        message="min_price cannot be greater than max_price",
-                        status_code=status.HTTP_400_BAD_REQUEST
-                    )
-            except ValueError:
-                return error_response(
-                    message="Invalid price range values",
-                    status_code=status.HTTP_400_BAD_REQUEST
-                )
-
-        if min_price is not None:
-            queryset = queryset.filter(price__gte=min_price)
-        if max_price is not None:
-            queryset = queryset.filter(price__lte=max_price)
-
-        # Currency filter
-        currency = request.query_params.get('currency')
-        if currency:
-            queryset = queryset.filter(currency=currency.upper())
+        queryset = apply_content_filters(self.get_queryset(), **filters)
+        search = filters['search']
 
         # Ordering
-        ordering = request.query_params.get('ordering', '-created_at')
-        allowed_orderings = ['-created_at', 'created_at', 'price', '-price', 'view_count', '-view_count']
-        if ordering in allowed_orderings:
-            queryset = queryset.order_by(ordering)
+        ordering = request.query_params.get('ordering', 'relevance' if search else '-created_at')
+        if ordering == 'relevance':
+            if search:
+                queryset = queryset.order_by('-search_rank', '-created_at')
+        elif ordering in CONTENT_ORDERINGS:
+            queryset = queryset.order_by(CONTENT_ORDERINGS[ordering])
+
+        # Sparse fieldset (?fields=) prunes both the JSON and the loaded columns
+        try:
+            queryset, fields = apply_sparse_fieldset(queryset, ContentPublicSerializer, request)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        # "Did you mean" suggestions when the search finds nothing
+        extra = {}
+        if search and not queryset.exists():
+            extra['suggestions'] = search_suggestions(search)
 
         return paginated_response(
             queryset,
             ContentPublicSerializer,
             request,
-            message="Contents retrieved successfully"
+            message="Contents retrieved successfully",
+            serializer_kwargs={'fields': fields},
+            **extra
         )
 
     def get_queryset(self):
         """Only return public, non-deleted contents"""
-        return Content.objects.filter(status=CONTENT_STATUS_PUBLIC).select_related('producer')
+        return Content.objects.filter(status=CONTENT_STATUS_PUBLIC).select_related('producer').defer('search_vector')
 
 
 @extend_schema(tags=['Content - Public'])
+@method_decorator(public_cache_policy(), name='get')
+class ContentFacetsView(APIView):
+    """Facet counts for the browse sidebar"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('search', str, description='Same as the content list'),
+            OpenApiParameter('search_mode', str, description='Same as the content list'),
+            OpenApiParameter('genre', str, description='Same as the content list'),
+            OpenApiParameter('genre_mode', str, description='Same as the content list'),
+            OpenApiParameter('min_price', float, description='Same as the content list'),
+            OpenApiParameter('max_price', float, description='Same as the content list'),
+            OpenApiParameter('price_currency', str, description='Same as the content list'),
+            OpenApiParameter('currency', str, description='Same as the content list'),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description='Counts per genre tag, currency, rating and price bucket for the applied filters'
+            ),
+            400: OpenApiResponse(description='Invalid filters')
+        }
+    )
+    def get(self, request):
+        """Count matching contents per facet value in one query"""
+        try:
+            filters = parse_content_filters(request.query_params)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = apply_content_filters(
+            Content.objects.filter(status=CONTENT_STATUS_PUBLIC),
+            **filters
+        )
+        return success_response(
+            data=get_facets(queryset, filters),
+            message="Facets retrieved successfully"
+        )
+
+
+@extend_schema(tags=['Content - Public'])
+@method_decorator(public_cache_policy(), name='get')
+class ContentSuggestView(APIView):
+    """Typeahead suggestions for the search box"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('q', str, description='Prefix typed so far (matches the start of a title, or of any word in it)'),
+            OpenApiParameter('limit', int, description='Maximum suggestions per kind (default 5, max 10)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='Matching content titles and booths'),
+            400: OpenApiResponse(description='Invalid limit')
+        }
+    )
+    def get(self, request):
+        """Suggest content titles and booths by prefix"""
+        query = request.query_params.get('q', '').strip()
+        try:
+            limit = min(int(request.query_params.get('limit', 5)), 10)
+            if limit < 1:
+                raise ValueError
+        except ValueError:
+            return error_response(
+                message="limit must be a positive integer",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = suggest(query, limit) if query else {'titles': [], 'booths': []}
+        return success_response(data=data, message="Suggestions retrieved successfully")
+
+
+CONTENT_BATCH_MAX_IDS = 100
+
+
+@extend_schema(tags=['Content - Public'])
+@method_decorator(public_cache_policy(), name='get')
+class ContentBatchView(APIView):
+    """Many public contents by id in one call (widgets, integrations)"""
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('ids', str, required=True, description=f'Comma-separated content ids (max {CONTENT_BATCH_MAX_IDS})'),
+        ],
+        responses={
+            200: ContentDetailSerializer(many=True),
+            400: OpenApiResponse(description='Missing, invalid or too many ids')
+        }
+    )
+    def get(self, request):
+        """Get contents in the requested order; unknown or non-public ids are listed in missing"""
+        try:
+            ids = [int(value) for value in request.query_params.get('ids', '').split(',') if value.strip()]
+        except ValueError:
+            return error_response(
+                message="ids must be comma-separated integers",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return error_response(message="ids is required", status_code=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > CONTENT_BATCH_MAX_IDS:
+            return error_response(
+                message=f"At most {CONTENT_BATCH_MAX_IDS} ids per request",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        # One IN query; not counted as views
+        contents = Content.objects.filter(
+            pk__in=ids, status=CONTENT_STATUS_PUBLIC
+        ).select_related('producer').defer('search_vector').in_bulk()
+
+        return success_response(
+            data=ContentDetailSerializer([contents[pk] for pk in ids if pk in contents], many=True).data,
+            message="Contents retrieved successfully",
+            missing=[pk for pk in ids if pk not in contents]
+        )
+
+
+@extend_schema(tags=['Content - Public'])
+@method_decorator(public_cache_policy(), name='get')
 class ContentDetailView(APIView):
     """Public content detail view"""
     permission_classes = [AllowAny]
@@ -105,23 +232,44 @@ class ContentDetailView(APIView):
         }
     )
     def get(self, request, pk):
-        """Get content detail and increment view count"""
+        """Get content detail and increment view count (304 responses are not counted)"""
+        contents = Content.objects.filter(pk=pk, status=CONTENT_STATUS_PUBLIC)
+        if is_conditional(request):
+            version = contents.values_list('updated_at', 'producer__updated_at').first()
+            if version is not None:
+                response = not_modified(request, *content_validators(request, pk, *version))
+                if response is not None:
+                    return response
+
         try:
-            content = Content.objects.select_related('producer').get(
-                pk=pk,
-                status=CONTENT_STATUS_PUBLIC
-            )
+            content = contents.select_related('producer').get()
         except Content.DoesNotExist:
             return error_response(
                 message="Content not found or not available",
                 status_code=status.HTTP_404_NOT_FOUND
             )
 
-        # Increment view count (atomic)
-        content.increment_view_count()
+        # Increment view count (buffered)
+        content.increment_view_count(viewer_key(request))
 
         serializer = ContentDetailSerializer(content)
-        return success_response(
+        response = success_response(
             data=serializer.data,
             message="Content retrieved successfully"
         )
+        return set_validators(response, *content_validators(
+            request, content.pk, content.updated_at, content.producer.updated_at
+        ))
+
+
+def content_validators(request, pk, updated_at, producer_updated_at):
+    """
+    (ETag, Last-Modified) of a content detail payload
+
+    Every change to the payload moves one of the two timestamps, bulk price
+    re-normalization included (see ExchangeRate.renormalize_prices).
+    """
+    return (
+        make_etag(request, 'content', pk, updated_at, producer_updated_at),
+        latest(updated_at, producer_updated_at),
+    )
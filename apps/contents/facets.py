@@ -0,0 +1,98 @@
+"""
+Facet counts for the browse sidebar
+
+All facets are computed in one SQL statement: the filtered contents are
+materialized once in a CTE and each facet is a GROUP BY over it, glued
+together with UNION ALL. Results are cached per normalized filter set
+and catalog generation (see result_cache).
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from apps.core.constants import PRICE_BUCKETS
+from .result_cache import get_generation, result_cache_enabled
+
+FACETS_CACHE_PREFIX = 'contents:facets'
+
+
+def _price_bucket_sql():
+    """CASE expression mapping a USD-normalized price to its PRICE_BUCKETS label"""
+    cases = []
+    params = []
+    for label, low, high in PRICE_BUCKETS:
+        if high is None:
+            cases.append('WHEN price_usd_normalized >= %s THEN %s')
+            params.extend([low, label])
+        else:
+            cases.append('WHEN price_usd_normalized >= %s AND price_usd_normalized < %s THEN %s')
+            params.extend([low, high, label])
+    return f"CASE {' '.join(cases)} END", params
+
+
+def compute_facets(queryset):
+    """Count genre tags, currencies, ratings and price buckets of queryset"""
+    filtered_sql, filtered_params = queryset.order_by().values(
+        'genre_tags', 'currency', 'rating', 'price_usd_normalized'
+    ).query.sql_with_params()
+    bucket_sql, bucket_params = _price_bucket_sql()
+
+    sql = f"""
+        WITH filtered AS MATERIALIZED ({filtered_sql})
+        SELECT 'total', NULL, COUNT(*) FROM filtered
+        UNION ALL
+        SELECT 'genre', tag, COUNT(*) FROM filtered, unnest(filtered.genre_tags) AS tag GROUP BY tag
+        UNION ALL
+        SELECT 'currency', currency, COUNT(*) FROM filtered GROUP BY currency
+        UNION ALL
+        SELECT 'rating', rating, COUNT(*) FROM filtered GROUP BY rating
+        UNION ALL
+        SELECT 'price', {bucket_sql}, COUNT(*) FROM filtered GROUP BY 2
+    """
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(sql, [*filtered_params, *bucket_params])
+        rows = cursor.fetchall()
+
+    counts = {'total': {}, 'genre': {}, 'currency': {}, 'rating': {}, 'price': {}}
+    for facet, value, count in rows:
+        counts[facet][value] = count
+
+    def ranked(facet):
+        return [
+            {'value': value, 'count': count}
+            for value, count in sorted(counts[facet].items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    return {
+        'total': counts['total'].get(None, 0),
+        'genres': ranked('genre'),
+        'currencies': ranked('currency'),
+        'ratings': ranked('rating'),
+        'price_buckets': [
+            {'value': label, 'min': low, 'max': high, 'count': counts['price'].get(label, 0)}
+            for label, low, high in PRICE_BUCKETS
+        ],
+    }
+
+
+def facets_cache_key(filters):
+    """Cache key for a normalized filter dict under the current catalog generation"""
+    digest = hashlib.md5(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return f'{FACETS_CACHE_PREFIX}:{get_generation()}:{digest}'
+
+
+def get_facets(queryset, filters):
+    """Facet counts for queryset, cached by its normalized filters"""
+    if not result_cache_enabled():
+        return compute_facets(queryset)
+    key = facets_cache_key(filters)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(queryset)
+        cache.set(key, facets, getattr(settings, 'CONTENT_FACETS_CACHE_TIMEOUT', 300))
+    return facets
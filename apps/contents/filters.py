@@ -0,0 +1,135 @@
+"""
+Shared filtering for public content listings
+
+ContentListView, ContentFacetsView and browse_view all apply the same
+filters; views only differ in how they read them from the request.
+"""
+from decimal import Decimal, InvalidOperation
+
+from apps.core.constants import CURRENCY_CHOICES, CURRENCY_USD
+from .models import ExchangeRate
+from .search import (
+    SEARCH_MODE_FULLTEXT, SEARCH_MODE_FUZZY, SEARCH_MODES,
+    search_contents, fuzzy_search_contents
+)
+
+
+GENRE_MODE_ALL = 'all'
+GENRE_MODE_ANY = 'any'
+GENRE_MODES = [GENRE_MODE_ALL, GENRE_MODE_ANY]
+CURRENCY_CODES = [code for code, _ in CURRENCY_CHOICES]
+# Price bounds must fit price_usd_normalized (12 integer digits)
+MAX_PRICE_FILTER = Decimal(10) ** 12
+
+# Public ordering values and the model ordering behind them. Prices sort by
+# their USD value across currencies; trending is the precomputed score.
+CONTENT_ORDERINGS = {
+    '-created_at': '-created_at',
+    'created_at': 'created_at',
+    'price': 'price_usd_normalized',
+    '-price': '-price_usd_normalized',
+    'view_count': 'view_count',
+    '-view_count': '-view_count',
+    'trending': '-trending_score',
+}
+
+
+def parse_genres(params):
+    """Genres from repeated and/or comma-separated genre params, deduplicated"""
+    genres = []
+    for value in params.getlist('genre'):
+        for genre in value.split(','):
+            genre = genre.strip()
+            if genre and genre not in genres:
+                genres.append(genre)
+    return genres
+
+
+def parse_price(value):
+    """Price bound as a Decimal; ValueError unless it is a finite number in range"""
+    try:
+        price = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid price: {value}")
+    if not price.is_finite() or abs(price) >= MAX_PRICE_FILTER:
+        raise ValueError(f"Invalid price: {value}")
+    return price
+
+
+def parse_content_filters(params):
+    """
+    Read API query params into normalized filter kwargs
+
+    Raises ValueError with a client-facing message on invalid input.
+    """
+    search = params.get('search', '').strip()
+    search_mode = params.get('search_mode', SEARCH_MODE_FULLTEXT)
+    if search_mode not in SEARCH_MODES:
+        raise ValueError(f"Invalid search_mode. Must be one of: {', '.join(SEARCH_MODES)}")
+
+    prices = {}
+    for name in ('min_price', 'max_price'):
+        value = params.get(name)
+        if value is None or value == '':
+            continue
+        try:
+            prices[name] = parse_price(value)
+        except ValueError:
+            raise ValueError("Invalid price range values")
+    if 'min_price' in prices and 'max_price' in prices and prices['min_price'] > prices['max_price']:
+        raise ValueError("min_price cannot be greater than max_price")
+
+    genre_mode = params.get('genre_mode', GENRE_MODE_ALL)
+    if genre_mode not in GENRE_MODES:
+        raise ValueError(f"Invalid genre_mode. Must be one of: {', '.join(GENRE_MODES)}")
+
+    price_currency = params.get('price_currency', CURRENCY_USD).upper()
+    if price_currency not in CURRENCY_CODES:
+        raise ValueError(f"Invalid price_currency. Must be one of: {', '.join(CURRENCY_CODES)}")
+
+    currency = params.get('currency')
+
+    return {
+        'search': search,
+        'search_mode': search_mode,
+        'genres': parse_genres(params),
+        'genre_mode': genre_mode,
+        'min_price': prices.get('min_price'),
+        'max_price': prices.get('max_price'),
+        'price_currency': price_currency,
+        'currency': currency.upper() if currency else None,
+    }
+
+
+def apply_content_filters(queryset, search='', search_mode=SEARCH_MODE_FULLTEXT, genres=None,
+                          genre_mode=GENRE_MODE_ALL, min_price=None, max_price=None,
+                          price_currency=CURRENCY_USD, currency=None):
+    """
+    Apply normalized filters to a Content queryset
+
+    Genres are one array predicate either way, which the genre_tags GIN
+    index serves: @> (has all genres) or && (has any genre). Price bounds
+    are given in price_currency and compared against the indexed
+    price_usd_normalized column, so contents in any currency match.
+    """
+    if search:
+        if search_mode == SEARCH_MODE_FUZZY:
+            queryset = fuzzy_search_contents(queryset, search)
+        else:
+            queryset = search_contents(queryset, search)
+
+    if genres:
+        if genre_mode == GENRE_MODE_ANY:
+            queryset = queryset.filter(genre_tags__overlap=genres)
+        else:
+            queryset = queryset.filter(genre_tags__contains=genres)
+
+    if min_price is not None:
+        queryset = queryset.filter(price_usd_normalized__gte=ExchangeRate.to_usd(min_price, price_currency))
+    if max_price is not None:
+        queryset = queryset.filter(price_usd_normalized__lte=ExchangeRate.to_usd(max_price, price_currency))
+
+    if currency:
+        queryset = queryset.filter(currency=currency)
+
+    return queryset
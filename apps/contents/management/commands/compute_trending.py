@@ -0,0 +1,15 @@
+"""
+Recompute time-decayed trending scores (run periodically, e.g. hourly)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.trending import compute_trending
+
+
+class Command(BaseCommand):
+    help = 'Decay and refresh trending scores of contents and booths'
+
+    def handle(self, *args, **options):
+        updated = compute_trending()
+
+        self.stdout.write(self.style.SUCCESS(f'Updated trending scores for {updated} contents'))
@@ -0,0 +1,72 @@
+"""
+Load exchange rates from a local file and re-normalize content prices
+
+Accepts JSON ({"KRW": 0.00073, ...}) or CSV (currency,usd_rate rows,
+header optional). Rates are USD per one unit of the currency.
+"""
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.contents.models import ExchangeRate
+from apps.core.constants import CURRENCY_CHOICES, CURRENCY_USD
+
+
+class Command(BaseCommand):
+    help = 'Load exchange rates from a JSON or CSV file and update normalized content prices'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to a .json or .csv rates file')
+
+    def handle(self, *args, **options):
+        rates = self.read_rates(Path(options['path']))
+
+        with transaction.atomic():
+            for currency, usd_rate in rates.items():
+                ExchangeRate.objects.update_or_create(currency=currency, defaults={'usd_rate': usd_rate})
+
+            updated = ExchangeRate.renormalize_prices(list(rates))
+
+        loaded = ', '.join(f'{currency}={rate}' for currency, rate in sorted(rates.items()))
+        self.stdout.write(self.style.SUCCESS(f'Loaded rates ({loaded}); re-normalized {updated} contents'))
+
+    def read_rates(self, path):
+        if not path.exists():
+            raise CommandError(f'File not found: {path}')
+
+        try:
+            if path.suffix.lower() == '.json':
+                rows = json.loads(path.read_text()).items()
+            elif path.suffix.lower() == '.csv':
+                with path.open(newline='') as f:
+                    rows = [row[:2] for row in csv.reader(f) if len(row) >= 2 and row[0].strip().lower() != 'currency']
+            else:
+                raise CommandError('Rates file must be .json or .csv')
+        except (ValueError, AttributeError) as e:
+            raise CommandError(f'Could not parse {path}: {e}')
+
+        currencies = {code for code, _ in CURRENCY_CHOICES}
+        rates = {}
+        for currency, value in rows:
+            currency = str(currency).strip().upper()
+            if currency not in currencies:
+                raise CommandError(f'Unknown currency: {currency}')
+            try:
+                rate = Decimal(str(value).strip())
+                if not rate.is_finite():
+                    raise InvalidOperation
+            except InvalidOperation:
+                raise CommandError(f'Invalid rate for {currency}: {value}')
+            if rate <= 0:
+                raise CommandError(f'Rate for {currency} must be positive')
+            if currency == CURRENCY_USD and rate != 1:
+                raise CommandError('USD rate must be 1')
+            rates[currency] = rate
+
+        if not rates:
+            raise CommandError('No rates found')
+        return rates
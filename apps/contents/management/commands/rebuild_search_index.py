@@ -0,0 +1,24 @@
+"""
+Rebuild Content.search_vector for all (or one producer's) contents
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.models import Content
+from apps.contents.search import rebuild_search_vectors
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search vectors of contents'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--producer', type=int, help='Only rebuild contents of this producer id')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = Content.objects.all()
+        if options['producer']:
+            queryset = queryset.filter(producer_id=options['producer'])
+
+        updated = rebuild_search_vectors(queryset, batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt search vectors for {updated} contents'))
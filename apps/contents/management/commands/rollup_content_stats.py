@@ -0,0 +1,15 @@
+"""
+Roll up content views and offers into daily stats (run periodically, e.g. hourly)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.contents.rollups import rollup_daily_stats
+
+
+class Command(BaseCommand):
+    help = 'Fold content activity since the last run into daily analytics rollups'
+
+    def handle(self, *args, **options):
+        written = rollup_daily_stats()
+
+        self.stdout.write(self.style.SUCCESS(f'Updated {written} daily stats rows'))
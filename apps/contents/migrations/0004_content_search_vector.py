@@ -0,0 +1,75 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:04
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import Value
+
+# Frozen copy of apps.contents.search as of this migration, so later
+# changes to the live module don't change what this backfill writes
+CJK_RUN_RE = re.compile(
+    r'[\u1100-\u11FF\u3040-\u30FF\u3130-\u318F\u3400-\u4DBF'
+    r'\u4E00-\u9FFF\uAC00-\uD7AF\uF900-\uFAFF]+'
+)
+
+
+def cjk_bigrams(text):
+    tokens = []
+    for run in CJK_RUN_RE.findall(text or ''):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return ' '.join(tokens)
+
+
+def build_search_vector(title, description, producer_name):
+    vector = None
+    for text, weight in ((title, 'A'), (producer_name, 'B'), (description, 'C')):
+        text = text or ''
+        part = (
+            SearchVector(Value(text), config='english', weight=weight)
+            + SearchVector(Value(cjk_bigrams(text)), config='simple', weight=weight)
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def backfill_search_vectors(apps, schema_editor):
+    Content = apps.get_model('contents', 'Content')
+    batch = []
+    for content in Content.objects.select_related('producer').only(
+        'pk', 'title', 'description', 'producer__company_name'
+    ).iterator(chunk_size=500):
+        content.search_vector = build_search_vector(
+            content.title, content.description, content.producer.company_name
+        )
+        batch.append(content)
+        if len(batch) >= 500:
+            Content.objects.bulk_update(batch, ['search_vector'])
+            batch = []
+    if batch:
+        Content.objects.bulk_update(batch, ['search_vector'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0003_content_teaser_video'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='contents_search_vector_gin'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:06
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_company_name_trgm'),
+        ('contents', '0004_content_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='contents_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0005_content_title_trgm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='content',
+            name='contents_co_status_b12b6b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='content',
+            name='contents_co_produce_8f856f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='contents_co_status_a08ad6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', 'price', 'id'], name='contents_co_status_50c919_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['producer', 'status', '-created_at', '-id'], name='contents_co_produce_18607e_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:11
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genre_tags'], name='contents_genre_tags_gin'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:12
+
+from django.db import migrations, models
+
+
+def backfill_price_usd_normalized(apps, schema_editor):
+    # No rates are loaded yet, so every price is taken at par until
+    # load_exchange_rates runs and re-normalizes them
+    Content = apps.get_model('contents', 'Content')
+    Content.objects.update(price_usd_normalized=models.F('price'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0007_genre_tags_gin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('currency', models.CharField(choices=[('USD', 'US Dollar'), ('KRW', 'Korean Won'), ('EUR', 'Euro'), ('JPY', 'Japanese Yen')], max_length=3, unique=True, verbose_name='Currency')),
+                ('usd_rate', models.DecimalField(decimal_places=10, help_text='USD per one unit of the currency', max_digits=20, verbose_name='USD rate')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+            ],
+            options={
+                'verbose_name': 'Exchange rate',
+                'verbose_name_plural': 'Exchange rates',
+                'ordering': ['currency'],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='content',
+            name='contents_co_status_50c919_idx',
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='price_usd_normalized',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, help_text='Price converted with the current exchange rate, used for filtering and sorting', max_digits=14, verbose_name='Price (USD)'),
+        ),
+        migrations.RunPython(backfill_price_usd_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', 'price_usd_normalized', 'id'], name='contents_co_status_e8b3f4_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0008_price_usd_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='trending_computed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Trending computed at'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, help_text='Time-decayed view and offer activity', verbose_name='Trending score'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='trending_views_seen',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Views at last trending run'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['status', '-trending_score', '-id'], name='contents_co_status_ce6082_idx'),
+        ),
+    ]
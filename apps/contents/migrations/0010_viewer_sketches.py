@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0009_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentViewerSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('registers', models.BinaryField(verbose_name='Registers')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='viewer_sketches', to='contents.content', verbose_name='Content')),
+            ],
+            options={
+                'verbose_name': 'Content viewer sketch',
+                'verbose_name_plural': 'Content viewer sketches',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='contentviewersketch',
+            constraint=models.UniqueConstraint(fields=('content', 'date'), name='unique_content_viewer_sketch_date'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def skip_lifetime_views(apps, schema_editor):
+    # Views before the first rollup have no date, so they are not attributed to any day
+    Content = apps.get_model('contents', 'Content')
+    Content.objects.update(stats_views_seen=models.F('view_count'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0010_viewer_sketches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='Name')),
+                ('processed_until', models.DateTimeField(verbose_name='Processed until')),
+            ],
+            options={
+                'verbose_name': 'Stats watermark',
+                'verbose_name_plural': 'Stats watermarks',
+            },
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='stats_views_seen',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Views at last stats rollup'),
+        ),
+        migrations.RunPython(skip_lifetime_views, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='ContentDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Views')),
+                ('unique_viewers', models.PositiveIntegerField(default=0, help_text='Approximate, from the daily viewer sketch', verbose_name='Unique viewers')),
+                ('offers_created', models.PositiveIntegerField(default=0, verbose_name='Offers created')),
+                ('offers_accepted', models.PositiveIntegerField(default=0, verbose_name='Offers accepted')),
+                ('accepted_value', models.JSONField(blank=True, default=dict, help_text='Accepted offer amounts by currency, e.g. {"USD": "1200.00"}', verbose_name='Accepted value')),
+                ('content', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='contents.content', verbose_name='Content')),
+            ],
+            options={
+                'verbose_name': 'Content daily stats',
+                'verbose_name_plural': 'Content daily stats',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='contentdailystats',
+            constraint=models.UniqueConstraint(fields=('content', 'date'), name='unique_content_daily_stats_date'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:59
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contents', '0011_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='text_pattern_ops'), name='contents_title_upper_prefix'),
+        ),
+    ]
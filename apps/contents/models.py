@@ -1,9 +1,15 @@
 """
 Content model for short-form content items
 """
+import logging
+from decimal import Decimal
+
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from apps.core.utils import SoftDeleteManager
 from apps.core.constants import (
     CONTENT_STATUS_DRAFT,
@@ -16,6 +22,8 @@ from apps.core.constants import (
     RATING_CHOICES
 )
 
+logger = logging.getLogger(__name__)
+
 
 class Content(models.Model):
     """Short-form content item created by producers"""
@@ -80,6 +88,14 @@ class Content(models.Model):
         default=CURRENCY_USD,
         verbose_name='Currency'
     )
+    price_usd_normalized = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        verbose_name='Price (USD)',
+        help_text='Price converted with the current exchange rate, used for filtering and sorting'
+    )
 
     # Content details
     duration_seconds = models.PositiveIntegerField(
@@ -120,6 +136,37 @@ class Content(models.Model):
         verbose_name='View count'
     )
 
+    # Trending (maintained by the compute_trending command)
+    trending_score = models.FloatField(
+        default=0,
+        editable=False,
+        verbose_name='Trending score',
+        help_text='Time-decayed view and offer activity'
+    )
+    trending_views_seen = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Views at last trending run'
+    )
+    stats_views_seen = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Views at last stats rollup'
+    )
+    trending_computed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Trending computed at'
+    )
+
+    # Full-text search (maintained by update_search_vector)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name='Search vector'
+    )
+
     # Timestamps
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -145,13 +192,62 @@ class Content(models.Model):
         verbose_name_plural = 'Contents'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['producer', 'status']),
+            # (ordering, id) tuples for keyset pagination
+            models.Index(fields=['status', '-created_at', '-id']),
+            models.Index(fields=['status', 'price_usd_normalized', 'id']),
+            models.Index(fields=['producer', 'status', '-created_at', '-id']),
+            models.Index(fields=['status', '-trending_score', '-id']),
+            GinIndex(fields=['search_vector'], name='contents_search_vector_gin'),
+            GinIndex(fields=['genre_tags'], name='contents_genre_tags_gin'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='contents_title_trgm'),
+            # title__istartswith (typeahead database fallback) compares UPPER(title) LIKE 'PREFIX%'
+            models.Index(OpClass(Upper('title'), name='text_pattern_ops'), name='contents_title_upper_prefix'),
         ]
 
     def __str__(self):
         return f"{self.title} by {self.producer.username}"
 
+    def save(self, *args, **kwargs):
+        """
+        Save, keep derived price and search fields and the booth's public
+        content count in sync, and invalidate cached listings
+        """
+        from django.db import transaction
+        from .result_cache import bump_generation
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & {'price', 'currency'}:
+            self.price_usd_normalized = ExchangeRate.to_usd(self.price, self.currency)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'price_usd_normalized'}
+        with transaction.atomic():
+            counted = update_fields is None or bool(set(update_fields) & {'status', 'producer'})
+            previous = self._lock_public_state() if counted else None
+            super().save(*args, **kwargs)
+            if counted:
+                self._adjust_booth_count(previous)
+        bump_generation()
+        if update_fields is None or set(update_fields) & {'title', 'description', 'producer'}:
+            self.update_search_vector()
+
+    def _lock_public_state(self):
+        """(producer_id, was_public) of the stored row, locked until the save commits"""
+        if self._state.adding or self.pk is None:
+            return None
+        return type(self).objects.select_for_update().filter(pk=self.pk).values_list(
+            'producer_id', 'status'
+        ).first()
+
+    def _adjust_booth_count(self, previous):
+        """Move Booth.public_content_count by this save's publish/unpublish"""
+        from apps.booths.models import Booth
+        was_counted = previous[0] if previous is not None and previous[1] == CONTENT_STATUS_PUBLIC else None
+        is_counted = self.producer_id if self.status == CONTENT_STATUS_PUBLIC else None
+        if was_counted != is_counted:
+            if was_counted is not None:
+                Booth.adjust_public_content_count(was_counted, -1)
+            if is_counted is not None:
+                Booth.adjust_public_content_count(is_counted, 1)
+
     @property
     def is_public(self):
         """Check if content is publicly visible"""
@@ -167,10 +263,189 @@ class Content(models.Model):
         from django.utils import timezone
         self.status = CONTENT_STATUS_DELETED
         self.deleted_at = timezone.now()
-        self.save(update_fields=['status', 'deleted_at'])
+        self.save(update_fields=['status', 'deleted_at', 'updated_at'])
+
+    def increment_view_count(self, viewer=None):
+        """
+        Count a view (buffered, see apps.core.counters) and show it right away
+
+        viewer is a key from apps.core.counters.viewer_key(); when given,
+        the view also counts toward today's distinct viewers.
+        """
+        from apps.core.counters import content_view_counter, content_viewer_sketches
+        self.view_count += content_view_counter.increment(self.pk)
+        if viewer is not None:
+            content_viewer_sketches.add(self.pk, viewer)
+
+    def update_search_vector(self):
+        """Rebuild search_vector from title, description and producer company name"""
+        from .search import build_search_vector
+        Content.objects.filter(pk=self.pk).update(
+            search_vector=build_search_vector(
+                self.title, self.description, self.producer.company_name
+            )
+        )
+
+
+class ExchangeRate(models.Model):
+    """USD value of one unit of a content currency (loaded by load_exchange_rates)"""
+
+    currency = models.CharField(
+        max_length=3,
+        choices=CURRENCY_CHOICES,
+        unique=True,
+        verbose_name='Currency'
+    )
+    usd_rate = models.DecimalField(
+        max_digits=20,
+        decimal_places=10,
+        verbose_name='USD rate',
+        help_text='USD per one unit of the currency'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Updated at'
+    )
+
+    class Meta:
+        verbose_name = 'Exchange rate'
+        verbose_name_plural = 'Exchange rates'
+        ordering = ['currency']
+
+    def __str__(self):
+        return f"1 {self.currency} = {self.usd_rate} USD"
+
+    @classmethod
+    def to_usd(cls, amount, currency):
+        """
+        Convert an amount to USD, rounded to cents
+
+        Currencies without a loaded rate are taken at par (logged), so
+        rows stay sortable until rates are loaded.
+        """
+        amount = Decimal(str(amount))
+        rate = Decimal(1)
+        if currency != CURRENCY_USD:
+            stored = cls.objects.filter(currency=currency).values_list('usd_rate', flat=True).first()
+            if stored is None:
+                logger.warning(f"No exchange rate for {currency}, treating prices at par with USD")
+            else:
+                rate = stored
+        return (amount * rate).quantize(Decimal('0.01'))
 
-    def increment_view_count(self):
-        """Increment view count (atomic operation)"""
-        from django.db.models import F
-        Content.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
-        self.refresh_from_db(fields=['view_count'])
+    @classmethod
+    def renormalize_prices(cls, currencies):
+        """
+        Recompute price_usd_normalized of contents in these currencies in one
+        UPDATE, touching updated_at so detail ETags change with the price
+        """
+        from django.db.models import F, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+        from django.utils import timezone
+        from .result_cache import bump_generation
+        rate = Coalesce(
+            Subquery(cls.objects.filter(currency=OuterRef('currency')).values('usd_rate')[:1]),
+            Value(Decimal(1)),
+            output_field=models.DecimalField(max_digits=20, decimal_places=10)
+        )
+        updated = Content.objects.filter(currency__in=currencies).update(
+            price_usd_normalized=F('price') * rate,
+            updated_at=timezone.now()
+        )
+        bump_generation()
+        return updated
+
+
+class ContentViewerSketch(models.Model):
+    """Daily HyperLogLog sketch of a content's distinct viewers (see apps.core.hll)"""
+
+    content = models.ForeignKey(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='viewer_sketches',
+        verbose_name='Content'
+    )
+    date = models.DateField(
+        verbose_name='Date'
+    )
+    registers = models.BinaryField(
+        verbose_name='Registers'
+    )
+
+    class Meta:
+        verbose_name = 'Content viewer sketch'
+        verbose_name_plural = 'Content viewer sketches'
+        constraints = [
+            models.UniqueConstraint(fields=['content', 'date'], name='unique_content_viewer_sketch_date'),
+        ]
+
+    def __str__(self):
+        return f"Viewers of content {self.content_id} on {self.date}"
+
+
+class ContentDailyStats(models.Model):
+    """Per-day activity rollup of a content (filled by rollup_content_stats)"""
+
+    content = models.ForeignKey(
+        Content,
+        on_delete=models.CASCADE,
+        related_name='daily_stats',
+        verbose_name='Content'
+    )
+    date = models.DateField(
+        verbose_name='Date'
+    )
+    views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Views'
+    )
+    unique_viewers = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Unique viewers',
+        help_text='Approximate, from the daily viewer sketch'
+    )
+    offers_created = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Offers created'
+    )
+    offers_accepted = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Offers accepted'
+    )
+    accepted_value = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Accepted value',
+        help_text='Accepted offer amounts by currency, e.g. {"USD": "1200.00"}'
+    )
+
+    class Meta:
+        verbose_name = 'Content daily stats'
+        verbose_name_plural = 'Content daily stats'
+        ordering = ['-date']
+        constraints = [
+            models.UniqueConstraint(fields=['content', 'date'], name='unique_content_daily_stats_date'),
+        ]
+
+    def __str__(self):
+        return f"Stats of content {self.content_id} on {self.date}"
+
+
+class StatsWatermark(models.Model):
+    """How far a rollup job has processed its source data"""
+
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+        verbose_name='Name'
+    )
+    processed_until = models.DateTimeField(
+        verbose_name='Processed until'
+    )
+
+    class Meta:
+        verbose_name = 'Stats watermark'
+        verbose_name_plural = 'Stats watermarks'
+
+    def __str__(self):
+        return f"{self.name}: {self.processed_until}"
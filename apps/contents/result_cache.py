@@ -0,0 +1,122 @@
+"""
+Result cache for public content listings
+
+Entries are keyed by the normalized request (path, query params, language)
+plus a catalog generation number. Any write that changes what a listing
+shows bumps the generation, which orphans every cached entry at once;
+orphans simply expire.
+
+A bump only reaches processes reading the same cache, so results are
+cached only when CONTENT_RESULT_CACHE_ENABLED (set with the shared Redis
+cache). With per-process memory, every request builds its listing.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import get_language
+from rest_framework.response import Response
+
+GENERATION_KEY = 'contents:generation'
+RESULT_CACHE_PREFIX = 'contents:result'
+
+# Recent generations this process bumped to, so in-process indexes kept
+# current by signals can tell their own writes from other processes'
+_local_bumps = deque(maxlen=1000)
+_local_bumps_lock = threading.Lock()
+
+
+def _new_generation():
+    # Time-based so a generation lost to eviction never reuses an old number
+    return time.time_ns()
+
+
+def get_generation():
+    """Current catalog generation"""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = _new_generation()
+        if not cache.add(GENERATION_KEY, generation, None):
+            generation = cache.get(GENERATION_KEY, generation)
+    return generation
+
+
+def bump_generation():
+    """
+    Invalidate all cached listings
+
+    Bumps now so the writing request reads fresh data, and again on commit
+    so entries cached by concurrent readers before the commit are dropped too.
+    """
+    def bump():
+        try:
+            generation = cache.incr(GENERATION_KEY)
+        except ValueError:
+            generation = _new_generation()
+            cache.set(GENERATION_KEY, generation, None)
+        with _local_bumps_lock:
+            _local_bumps.append(generation)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def changed_elsewhere(since, generation):
+    """Whether another process bumped the generation from since to generation"""
+    if generation == since:
+        return False
+    with _local_bumps_lock:
+        local = set(_local_bumps)
+    if since is None or not 0 < generation - since <= len(local):
+        return True
+    # Bumps are increments, so every step in between must be one of ours
+    return any(step not in local for step in range(since + 1, generation + 1))
+
+
+def result_cache_key(namespace, request):
+    """Cache key for a listing request under the current generation"""
+    params = sorted((key, sorted(values)) for key, values in request.GET.lists())
+    raw = json.dumps(
+        [request.get_host(), request.path, params, get_language()],
+        separators=(',', ':')
+    )
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'{RESULT_CACHE_PREFIX}:{namespace}:{get_generation()}:{digest}'
+
+
+def result_cache_enabled():
+    """Whether listing results may be cached (needs a cache shared by every process)"""
+    return getattr(settings, 'CONTENT_RESULT_CACHE_ENABLED', False)
+
+
+def get_cached_result(key):
+    if not result_cache_enabled():
+        return None
+    return cache.get(key)
+
+
+def set_cached_result(key, value):
+    if result_cache_enabled():
+        cache.set(key, value, getattr(settings, 'CONTENT_RESULT_CACHE_TIMEOUT', 60))
+
+
+def cached_response(namespace, request, build):
+    """
+    Serve an API listing from cache, or build and cache it
+
+    build() returns a Response; only successful responses are cached.
+    """
+    key = result_cache_key(namespace, request)
+    data = get_cached_result(key)
+    if data is not None:
+        return Response(data)
+
+    response = build()
+    if response.status_code == 200:
+        set_cached_result(key, response.data)
+    return response
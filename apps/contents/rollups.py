@@ -0,0 +1,126 @@
+"""
+Daily content analytics rollups
+
+rollup_daily_stats() is run periodically (management command) and folds
+the activity since the previous run (the watermark) into
+ContentDailyStats rows:
+
+- views: growth of view_count since the previous run, dated on the run
+  day, so run it at least daily (hourly keeps days accurate)
+- unique_viewers: re-read from the viewer sketches of the days touched
+- offers created and accepted after the watermark, dated by created_at
+  and responded_at, with accepted amounts summed per currency
+
+Views and viewers still buffered in web processes (at most
+VIEW_COUNTER_FLUSH_INTERVAL seconds old) are picked up by the next run.
+
+Studio analytics read these rows, so dashboards cost O(days) whatever the
+raw traffic.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.core.constants import OFFER_STATUS_ACCEPTED
+from apps.core.hll import HyperLogLog
+
+WATERMARK_NAME = 'content_daily_stats'
+COUNT_FIELDS = ('views', 'unique_viewers', 'offers_created', 'offers_accepted')
+
+
+def _new_views():
+    """Mark current view counts as seen; returns [(content id, views since last run)]"""
+    from .models import Content
+
+    table = connection.ops.quote_name(Content._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {table} AS t SET stats_views_seen = t.view_count '
+            f'FROM (SELECT id, stats_views_seen FROM {table} '
+            f'      WHERE view_count > stats_views_seen FOR UPDATE) AS s '
+            f'WHERE t.id = s.id '
+            f'RETURNING t.id, t.view_count - s.stats_views_seen'
+        )
+        return cursor.fetchall()
+
+
+def rollup_daily_stats(now=None):
+    """Fold activity since the watermark into daily rows; returns rows written"""
+    from apps.offers.models import Offer
+    from .models import ContentDailyStats, ContentViewerSketch, StatsWatermark
+
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    rollups = defaultdict(lambda: {'counts': defaultdict(int), 'value': defaultdict(Decimal), 'unique': None})
+
+    with transaction.atomic():
+        watermark = StatsWatermark.objects.select_for_update().filter(name=WATERMARK_NAME).first()
+        since = watermark.processed_until if watermark else None
+
+        for content_id, views in _new_views():
+            rollups[(content_id, today)]['counts']['views'] += views
+
+        offers = Offer.objects.filter(created_at__lte=now)
+        if since is not None:
+            offers = offers.filter(created_at__gt=since)
+        created = offers.annotate(day=TruncDate('created_at')).values('content', 'day').annotate(n=Count('id'))
+        for row in created.order_by():
+            rollups[(row['content'], row['day'])]['counts']['offers_created'] += row['n']
+
+        accepted = Offer.objects.filter(status=OFFER_STATUS_ACCEPTED, responded_at__lte=now)
+        if since is not None:
+            accepted = accepted.filter(responded_at__gt=since)
+        accepted = accepted.annotate(day=TruncDate('responded_at')).values('content', 'day', 'currency').annotate(
+            n=Count('id'), total=Sum('offered_price')
+        )
+        for row in accepted.order_by():
+            rollup = rollups[(row['content'], row['day'])]
+            rollup['counts']['offers_accepted'] += row['n']
+            rollup['value'][row['currency']] += row['total']
+
+        sketches = ContentViewerSketch.objects.filter(date__lte=today)
+        if since is not None:
+            sketches = sketches.filter(date__gte=timezone.localdate(since))
+        for content_id, day, registers in sketches.values_list('content', 'date', 'registers'):
+            rollups[(content_id, day)]['unique'] = HyperLogLog(bytes(registers)).count()
+
+        written = _write_rollups(ContentDailyStats, rollups)
+        StatsWatermark.objects.update_or_create(name=WATERMARK_NAME, defaults={'processed_until': now})
+
+    return written
+
+
+def _write_rollups(model, rollups):
+    if not rollups:
+        return 0
+    existing = {
+        (row.content_id, row.date): row
+        for row in model.objects.select_for_update().filter(
+            content__in={content_id for content_id, _ in rollups},
+            date__in={day for _, day in rollups},
+        ).order_by('content', 'date')
+    }
+    created, changed = [], []
+    for (content_id, day), rollup in rollups.items():
+        row = existing.get((content_id, day))
+        if row is None:
+            row = model(content_id=content_id, date=day)
+            created.append(row)
+        else:
+            changed.append(row)
+        for field, delta in rollup['counts'].items():
+            setattr(row, field, getattr(row, field) + delta)
+        if rollup['unique'] is not None:
+            row.unique_viewers = rollup['unique']
+        if rollup['value']:
+            value = defaultdict(Decimal, {c: Decimal(v) for c, v in row.accepted_value.items()})
+            for currency, amount in rollup['value'].items():
+                value[currency] += amount
+            row.accepted_value = {c: str(v.quantize(Decimal('0.01'))) for c, v in sorted(value.items())}
+    model.objects.bulk_create(created)
+    model.objects.bulk_update(changed, [*COUNT_FIELDS, 'accepted_value'])
+    return len(created) + len(changed)
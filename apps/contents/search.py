@@ -0,0 +1,177 @@
+"""
+Search helpers for Content (full-text and trigram fuzzy matching)
+
+The catalog mixes English, Korean and Chinese text. PostgreSQL ships an
+`english` config but nothing for Hangul/Han, and the `simple` parser keeps a
+whole CJK run (often a full sentence in Chinese) as a single token. To make
+CJK text searchable we index overlapping character bigrams of every CJK run
+with the `simple` config, next to the stemmed `english` vector.
+"""
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+)
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Cast, Greatest
+
+SEARCH_CONFIG_LATIN = 'english'
+SEARCH_CONFIG_CJK = 'simple'
+
+SEARCH_MODE_FULLTEXT = 'fulltext'
+SEARCH_MODE_FUZZY = 'fuzzy'
+SEARCH_MODES = (SEARCH_MODE_FULLTEXT, SEARCH_MODE_FUZZY)
+
+# Hangul syllables/jamo, CJK ideographs, kana
+CJK_RUN_RE = re.compile(
+    r'[\u1100-\u11FF\u3040-\u30FF\u3130-\u318F\u3400-\u4DBF'
+    r'\u4E00-\u9FFF\uAC00-\uD7AF\uF900-\uFAFF]+'
+)
+
+
+def cjk_bigrams(text):
+    """
+    Split every CJK run in text into overlapping bigrams
+
+    '로맨스 드라마' -> '로맨 맨스 드라 라마'  (single-char runs are kept as-is)
+    """
+    tokens = []
+    for run in CJK_RUN_RE.findall(text or ''):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return ' '.join(tokens)
+
+
+def build_search_vector(title, description, producer_name):
+    """
+    Build the tsvector expression stored in Content.search_vector
+
+    Weights: title (A) > producer company name (B) > description (C).
+    """
+    vector = None
+    for text, weight in ((title, 'A'), (producer_name, 'B'), (description, 'C')):
+        text = text or ''
+        part = (
+            SearchVector(Value(text), config=SEARCH_CONFIG_LATIN, weight=weight)
+            + SearchVector(Value(cjk_bigrams(text)), config=SEARCH_CONFIG_CJK, weight=weight)
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def build_search_query(text):
+    """Build a tsquery matching either the English or the CJK bigram terms"""
+    query = SearchQuery(text, config=SEARCH_CONFIG_LATIN, search_type='websearch')
+    bigrams = cjk_bigrams(text)
+    if bigrams:
+        query = query | SearchQuery(bigrams, config=SEARCH_CONFIG_CJK, search_type='plain')
+    return query
+
+
+def search_contents(queryset, text):
+    """
+    Filter queryset by full-text search and annotate `search_rank`
+
+    Uses the GIN index on Content.search_vector.
+    """
+    query = build_search_query(text)
+    # ts_rank() returns real; cast so the rank round-trips exactly in cursors
+    return queryset.filter(search_vector=query).annotate(
+        search_rank=Cast(SearchRank(F('search_vector'), query), FloatField())
+    )
+
+
+def set_similarity_threshold(using='default'):
+    """
+    Apply CONTENT_SEARCH_SIMILARITY_THRESHOLD to pg_trgm's `%>` operator
+
+    The operator (not a similarity() comparison) is what the trigram GIN
+    indexes can serve, and it reads its cut-off from this setting.
+    """
+    threshold = getattr(settings, 'CONTENT_SEARCH_SIMILARITY_THRESHOLD', 0.4)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.word_similarity_threshold', %s, false)",
+            [str(threshold)]
+        )
+
+
+def fuzzy_search_contents(queryset, text):
+    """
+    Typo-tolerant search on title and producer company name
+
+    Both predicates use trigram GIN indexes (Content.title and
+    User.company_name). Annotates `search_rank` with the best word similarity.
+    """
+    from apps.accounts.models import User
+
+    set_similarity_threshold(queryset.db)
+    producers = User.objects.filter(company_name__trigram_word_similar=text).values('pk')
+    return queryset.filter(
+        Q(title__trigram_word_similar=text) | Q(producer__in=producers)
+    ).annotate(
+        search_rank=Cast(
+            Greatest(
+                TrigramWordSimilarity(text, 'title'),
+                TrigramWordSimilarity(text, 'producer__company_name'),
+            ),
+            FloatField()
+        )
+    )
+
+
+def search_suggestions(text, limit=5):
+    """
+    "Did you mean" suggestions: closest public titles and producer names
+    """
+    from apps.accounts.models import User
+    from apps.core.constants import CONTENT_STATUS_PUBLIC
+    from .models import Content
+
+    set_similarity_threshold()
+    titles = Content.objects.filter(
+        status=CONTENT_STATUS_PUBLIC,
+        title__trigram_word_similar=text
+    ).annotate(
+        similarity=TrigramWordSimilarity(text, 'title')
+    ).order_by('-similarity').values_list('title', 'similarity')[:limit]
+    companies = User.objects.filter(
+        role=User.Role.CREATOR,
+        company_name__trigram_word_similar=text
+    ).annotate(
+        similarity=TrigramWordSimilarity(text, 'company_name')
+    ).order_by('-similarity').values_list('company_name', 'similarity')[:limit]
+
+    suggestions = []
+    for value, _ in sorted([*titles, *companies], key=lambda item: -item[1]):
+        if value.lower() != text.lower() and value not in suggestions:
+            suggestions.append(value)
+    return suggestions[:limit]
+
+
+def rebuild_search_vectors(queryset, batch_size=500):
+    """
+    Recompute search_vector for every content in queryset
+
+    Used when a producer renames their company and by the
+    rebuild_search_index command. Returns the number of rows updated.
+    """
+    updated = 0
+    batch = []
+    for content in queryset.select_related('producer').only(
+        'pk', 'title', 'description', 'producer__company_name'
+    ).iterator(chunk_size=batch_size):
+        content.search_vector = build_search_vector(
+            content.title, content.description, content.producer.company_name
+        )
+        batch.append(content)
+        if len(batch) >= batch_size:
+            updated += queryset.model.objects.bulk_update(batch, ['search_vector'])
+            batch = []
+    if batch:
+        updated += queryset.model.objects.bulk_update(batch, ['search_vector'])
+    return updated
@@ -4,10 +4,11 @@ Serializers for Content model
 from rest_framework import serializers
 from .models import Content
 from apps.accounts.serializers import UserSerializer
+from apps.core.serializers import SparseFieldsetMixin
 from apps.core.validators import validate_genre_tags
 
 
-class ContentPublicSerializer(serializers.ModelSerializer):
+class ContentPublicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Public serializer for content browsing (read-only)"""
 
     producer_name = serializers.CharField(source='producer.company_name', read_only=True)
@@ -18,11 +19,12 @@ class ContentPublicSerializer(serializers.ModelSerializer):
         model = Content
         fields = (
             'id', 'title', 'description', 'poster', 'teaser_video', 'rating',
-            'genre_tags', 'price', 'currency', 'duration_seconds',
+            'genre_tags', 'price', 'currency', 'price_usd_normalized', 'duration_seconds',
             'release_target', 'view_count', 'created_at',
             'producer_name', 'producer_username', 'booth_slug'
         )
         read_only_fields = fields
+        fast_read = True  # List pages render from values() rows
 
 
 class ContentDetailSerializer(serializers.ModelSerializer):
@@ -36,7 +38,7 @@ class ContentDetailSerializer(serializers.ModelSerializer):
         model = Content
         fields = (
             'id', 'title', 'description', 'poster', 'teaser_video', 'rating',
-            'genre_tags', 'price', 'currency', 'duration_seconds',
+            'genre_tags', 'price', 'currency', 'price_usd_normalized', 'duration_seconds',
             'video_url', 'screener_url', 'release_target',
             'view_count', 'created_at', 'updated_at',
             'producer_name', 'producer_username', 'booth_slug'
@@ -0,0 +1,83 @@
+"""
+Signal handlers for keeping denormalized content data in sync
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.conf import settings
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_search_vectors_on_producer_update(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Producer company name is part of Content.search_vector,
+    so rebuild the producer's vectors when the profile is saved.
+    """
+    if created or instance.role != 'creator':
+        return
+    if update_fields is not None and 'company_name' not in update_fields:
+        return
+
+    from .models import Content
+    from .search import rebuild_search_vectors
+    rebuild_search_vectors(Content.objects.filter(producer=instance))
+
+
+# Producer fields shown in public listings (producer_name, producer_username, booth_slug)
+LISTED_PRODUCER_FIELDS = {'company_name', 'username', 'booth_slug'}
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_listings_on_producer_update(sender, instance, created, update_fields=None, **kwargs):
+    """Cached listings embed producer fields, so drop them when those change"""
+    if created or instance.role != 'creator':
+        return
+    if update_fields is not None and not LISTED_PRODUCER_FIELDS & set(update_fields):
+        return
+
+    from .result_cache import bump_generation
+    bump_generation()
+
+
+@receiver(post_delete, sender='contents.Content')
+def invalidate_listings_on_content_delete(sender, instance, **kwargs):
+    """Hard deletes bypass Content.save, so invalidate here"""
+    from .result_cache import bump_generation
+    bump_generation()
+
+
+@receiver(post_delete, sender='contents.Content')
+def update_booth_count_on_content_delete(sender, instance, **kwargs):
+    """Hard deletes bypass Content.save, so drop a public content from its booth count here"""
+    from apps.booths.models import Booth
+    from apps.core.constants import CONTENT_STATUS_PUBLIC
+    if instance.status == CONTENT_STATUS_PUBLIC:
+        Booth.adjust_public_content_count(instance.producer_id, -1)
+
+
+@receiver(post_save, sender='contents.Content')
+def update_suggest_index_on_content_save(sender, instance, **kwargs):
+    """Keep this process's typeahead index current"""
+    from .suggest import suggest_index
+    suggest_index.update_content(instance)
+
+
+@receiver(post_delete, sender='contents.Content')
+def update_suggest_index_on_content_delete(sender, instance, **kwargs):
+    from .suggest import suggest_index
+    suggest_index.remove_content(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_suggest_index_on_producer_update(sender, instance, **kwargs):
+    """Booth suggestions show the producer's company name and booth slug"""
+    if instance.role != 'creator':
+        return
+
+    from .suggest import suggest_index
+    suggest_index.update_booth(instance.pk, instance.booth_slug, instance.company_name)
+
+
+@receiver(post_delete, sender='booths.Booth')
+def update_suggest_index_on_booth_delete(sender, instance, **kwargs):
+    from .suggest import suggest_index
+    suggest_index.remove_booth(instance.producer_id)
@@ -5,7 +5,8 @@ from django.urls import path
 from .studio_views import (
     StudioContentListCreateView,
     StudioContentDetailView,
-    StudioContentStatsView
+    StudioContentStatsView,
+    StudioContentAnalyticsView
 )
 
 app_name = 'studio_contents'
@@ -14,5 +15,6 @@ urlpatterns = [
     # Producer content management
     path('', StudioContentListCreateView.as_view(), name='content_list_create'),
     path('stats/', StudioContentStatsView.as_view(), name='content_stats'),
+    path('analytics/', StudioContentAnalyticsView.as_view(), name='content_analytics'),
     path('<int:pk>/', StudioContentDetailView.as_view(), name='content_detail'),
 ]
@@ -1,16 +1,22 @@
 """
 Producer Studio API views for content management (CRUD)
 """
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.db.models import Count
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from django.db.models import Count, Sum
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.permissions import IsProducer, IsOnboarded
 from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
-from .models import Content
+from apps.core.counters import booth_viewer_sketches, content_viewer_sketches
+from apps.core.utils import parse_date_range
+from .models import Content, ContentDailyStats
 from .serializers import ContentProducerSerializer, ContentCreateUpdateSerializer
 
 
@@ -191,13 +197,30 @@ class StudioContentStatsView(APIView):
     permission_classes = [IsProducer, IsOnboarded]
 
     @extend_schema(
-        responses={200: OpenApiResponse(description='Content statistics')}
+        parameters=[
+            OpenApiParameter(name='date_from', type=str, description='Unique viewer range start (YYYY-MM-DD, default: 30 days before date_to)'),
+            OpenApiParameter(name='date_to', type=str, description='Unique viewer range end (YYYY-MM-DD, default: today)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='Content statistics'),
+            400: OpenApiResponse(description='Invalid date range')
+        }
     )
     def get(self, request):
         """Get content statistics for current producer"""
+        try:
+            date_from, date_to = parse_date_range(request.query_params)
+        except ValueError as e:
+            return error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
         contents = Content.objects.filter(producer=request.user).exclude(
             status=CONTENT_STATUS_DELETED
         )
+        content_ids = list(contents.values_list('id', flat=True))
+        booth_id = getattr(getattr(request.user, 'booth', None), 'pk', None)
 
         stats = {
             'total_contents': contents.count(),
@@ -205,9 +228,102 @@ class StudioContentStatsView(APIView):
             'draft_contents': contents.filter(status='draft').count(),
             'total_views': sum(c.view_count for c in contents),
             'total_offers': sum(c.offer_set.count() for c in contents),
+            # Approximate (HyperLogLog); a viewer of several contents counts once
+            'unique_viewers': content_viewer_sketches.count_distinct(content_ids, date_from, date_to),
+            'booth_unique_viewers': (
+                booth_viewer_sketches.count([booth_id], date_from, date_to)[booth_id]
+                if booth_id else 0
+            ),
+            'date_from': date_from,
+            'date_to': date_to,
         }
 
         return success_response(
             data=stats,
             message="Statistics retrieved successfully"
         )
+
+
+@extend_schema(tags=['Studio - Content Management'])
+class StudioContentAnalyticsView(APIView):
+    """Producer's daily views and offers, served from the daily rollups"""
+    permission_classes = [IsProducer, IsOnboarded]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='date_from', type=str, description='Range start (YYYY-MM-DD, default: 30 days before date_to)'),
+            OpenApiParameter(name='date_to', type=str, description='Range end (YYYY-MM-DD, default: today)'),
+            OpenApiParameter(name='content', type=int, description='Limit to one content (default: all contents)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='Daily series and totals'),
+            400: OpenApiResponse(description='Invalid date range'),
+            404: OpenApiResponse(description='Content not found')
+        }
+    )
+    def get(self, request):
+        """Get daily analytics for current producer (rolled up by rollup_content_stats)"""
+        try:
+            date_from, date_to = parse_date_range(request.query_params)
+        except ValueError as e:
+            return error_response(
+                message=str(e),
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        rows = ContentDailyStats.objects.filter(
+            content__producer=request.user,
+            date__gte=date_from,
+            date__lte=date_to
+        ).exclude(content__status=CONTENT_STATUS_DELETED)
+
+        content_id = request.query_params.get('content')
+        if content_id:
+            if not content_id.isdigit() or not Content.objects.filter(
+                pk=content_id, producer=request.user
+            ).exclude(status=CONTENT_STATUS_DELETED).exists():
+                return error_response(
+                    message="Content not found",
+                    status_code=status.HTTP_404_NOT_FOUND
+                )
+            rows = rows.filter(content_id=content_id)
+
+        count_fields = ('views', 'unique_viewers', 'offers_created', 'offers_accepted')
+        by_day = {
+            row['date']: row
+            for row in rows.values('date').annotate(
+                **{field: Sum(field) for field in count_fields}
+            ).order_by()
+        }
+        values = defaultdict(lambda: defaultdict(Decimal))
+        for day, accepted_value in rows.filter(offers_accepted__gt=0).values_list('date', 'accepted_value'):
+            for currency, amount in accepted_value.items():
+                values[day][currency] += Decimal(amount)
+
+        days = []
+        totals = {field: 0 for field in count_fields if field != 'unique_viewers'}
+        total_value = defaultdict(Decimal)
+        day = date_from
+        while day <= date_to:
+            row = by_day.get(day, {})
+            entry = {'date': day, **{field: row.get(field) or 0 for field in count_fields}}
+            entry['accepted_value'] = {c: str(v) for c, v in sorted(values[day].items())}
+            for field in totals:
+                totals[field] += entry[field]
+            for currency, amount in values[day].items():
+                total_value[currency] += amount
+            days.append(entry)
+            day += timedelta(days=1)
+        # Daily unique viewers do not add up; see stats/ for distinct viewers over a range
+        totals['accepted_value'] = {c: str(v) for c, v in sorted(total_value.items())}
+
+        return success_response(
+            data={
+                'date_from': date_from,
+                'date_to': date_to,
+                'content': int(content_id) if content_id else None,
+                'totals': totals,
+                'days': days,
+            },
+            message="Analytics retrieved successfully"
+        )
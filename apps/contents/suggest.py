@@ -0,0 +1,249 @@
+"""
+Typeahead suggestions for content titles and booths
+
+Suggestions are served from an in-process prefix index: sorted arrays
+of (normalized key, id) searched with bisect. Every title and booth name
+is indexed under its full text and under each later word, so "man" finds
+"Running Man". Signals keep the index of the writing process current.
+Writes from other processes are only visible through the catalog
+generation when the cache is shared (see result_cache): the index is then
+rebuilt when the generation shows one, and otherwise on a timer. Either
+way it is rebuilt on a background thread, at most once per
+CONTENT_SUGGEST_REBUILD_INTERVAL seconds, while requests keep using the
+current one. Until the first build finishes, when the index is
+disabled, or when the catalog is too large to hold in memory, suggestions
+fall back to prefix queries on the database (see the upper-case title
+index in Content.Meta).
+"""
+import bisect
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+
+from apps.core.constants import CONTENT_STATUS_PUBLIC
+from .result_cache import changed_elsewhere, get_generation, result_cache_enabled
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(text):
+    return ' '.join((text or '').split()).casefold()
+
+
+def index_keys(text):
+    """Full normalized text plus the suffix starting at each later word"""
+    words = normalize(text).split(' ')
+    return [' '.join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class PrefixIndex:
+    """Sorted (key, id) arrays for one kind of suggestion"""
+
+    def __init__(self):
+        self.primary = []  # full-text keys, preferred in results
+        self.secondary = []  # later-word keys
+        self.values = {}
+        self.keys = {}
+
+    def add(self, item_id, text, value):
+        self.remove(item_id)
+        keys = index_keys(text)
+        if not keys:
+            return
+        self.values[item_id] = value
+        self.keys[item_id] = keys
+        bisect.insort(self.primary, (keys[0], item_id))
+        for key in keys[1:]:
+            bisect.insort(self.secondary, (key, item_id))
+
+    def remove(self, item_id):
+        keys = self.keys.pop(item_id, None)
+        if keys is None:
+            return
+        self.values.pop(item_id, None)
+        for array, array_keys in ((self.primary, keys[:1]), (self.secondary, keys[1:])):
+            for key in array_keys:
+                position = bisect.bisect_left(array, (key, item_id))
+                if position < len(array) and array[position] == (key, item_id):
+                    del array[position]
+
+    def load(self, items):
+        """Replace the contents with (id, text, value) triples"""
+        self.__init__()
+        primary, secondary = [], []
+        for item_id, text, value in items:
+            keys = index_keys(text)
+            if not keys:
+                continue
+            self.values[item_id] = value
+            self.keys[item_id] = keys
+            primary.append((keys[0], item_id))
+            secondary.extend((key, item_id) for key in keys[1:])
+        self.primary = sorted(primary)
+        self.secondary = sorted(secondary)
+
+    def search(self, prefix, limit):
+        """Values whose text (or a word in it) starts with prefix"""
+        results = []
+        for array in (self.primary, self.secondary):
+            position = bisect.bisect_left(array, (prefix,))
+            while position < len(array) and len(results) < limit:
+                key, item_id = array[position]
+                if not key.startswith(prefix):
+                    break
+                if item_id not in results:
+                    results.append(item_id)
+                position += 1
+        return [self.values[item_id] for item_id in results]
+
+    def __len__(self):
+        return len(self.values)
+
+
+class SuggestIndex:
+    """Content title and booth indexes with background, generation-checked rebuilds"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.titles = PrefixIndex()
+        self.booths = PrefixIndex()
+        self.generation = None
+        self.built_at = 0
+        self.available = False
+        self.rebuilding = False
+
+    def ensure_fresh(self):
+        """
+        Schedule a rebuild when never built, or when another process may have changed the catalog
+
+        Without a shared cache other processes' generation bumps never show
+        up here, so every rebuild interval counts as a possible change.
+        """
+        if self.built_at and result_cache_enabled():
+            generation = get_generation()
+            if not changed_elsewhere(self.generation, generation):
+                self.generation = generation  # Our own writes, already applied by signals
+                return
+        interval = getattr(settings, 'CONTENT_SUGGEST_REBUILD_INTERVAL', 10)
+        if self.built_at and time.monotonic() - self.built_at < interval:
+            return
+        self.schedule_rebuild()
+
+    def schedule_rebuild(self):
+        """Rebuild on a background thread unless one is already running"""
+        with self.lock:
+            if self.rebuilding:
+                return
+            self.rebuilding = True
+        threading.Thread(target=self._rebuild_in_background, name='suggest-index-rebuild', daemon=True).start()
+
+    def _rebuild_in_background(self):
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception('Suggest index rebuild failed')
+        finally:
+            with self.lock:
+                self.rebuilding = False
+            connections.close_all()  # This thread's connections only
+
+    def rebuild(self, generation=None):
+        from apps.booths.models import Booth
+        from .models import Content
+
+        if generation is None:
+            generation = get_generation()
+        max_entries = getattr(settings, 'CONTENT_SUGGEST_INDEX_MAX_ENTRIES', 200000)
+        contents = Content.objects.filter(status=CONTENT_STATUS_PUBLIC)
+        booths = Booth.objects.all()
+
+        available = contents.count() + booths.count() <= max_entries
+        titles = []
+        booth_items = []
+        if available:
+            titles = [
+                (content_id, title, {'id': content_id, 'title': title})
+                for content_id, title in contents.values_list('id', 'title')
+            ]
+            booth_items = [
+                _booth_entry(producer_id, slug, company_name)
+                for producer_id, slug, company_name
+                in booths.values_list('producer_id', 'slug', 'producer__company_name')
+            ]
+
+        with self.lock:
+            self.titles.load(titles)
+            self.booths.load(booth_items)
+            self.available = available
+            self.generation = generation
+            self.built_at = time.monotonic()
+
+    def update_content(self, content):
+        with self.lock:
+            if content.status == CONTENT_STATUS_PUBLIC:
+                self.titles.add(content.id, content.title, {'id': content.id, 'title': content.title})
+            else:
+                self.titles.remove(content.id)
+
+    def remove_content(self, content_id):
+        with self.lock:
+            self.titles.remove(content_id)
+
+    def update_booth(self, producer_id, slug, company_name):
+        with self.lock:
+            if slug:
+                self.booths.add(*_booth_entry(producer_id, slug, company_name))
+            else:
+                self.booths.remove(producer_id)
+
+    def remove_booth(self, producer_id):
+        with self.lock:
+            self.booths.remove(producer_id)
+
+    def suggest(self, text, limit):
+        prefix = normalize(text)
+        with self.lock:
+            return {
+                'titles': self.titles.search(prefix, limit),
+                'booths': self.booths.search(prefix, limit),
+            }
+
+
+def _booth_entry(producer_id, slug, company_name):
+    """Booths are indexed by company name and slug, so either matches"""
+    company_name = company_name or ''
+    return producer_id, f'{company_name} {slug}', {'slug': slug, 'company_name': company_name}
+
+
+suggest_index = SuggestIndex()
+
+
+def db_suggest(text, limit):
+    """Prefix suggestions straight from the database"""
+    from django.db.models import Q
+    from apps.booths.models import Booth
+    from .models import Content
+
+    prefix = normalize(text)
+    titles = Content.objects.filter(
+        status=CONTENT_STATUS_PUBLIC, title__istartswith=prefix
+    ).order_by('title').values('id', 'title')[:limit]
+    booths = Booth.objects.filter(
+        Q(slug__istartswith=prefix) | Q(producer__company_name__istartswith=prefix)
+    ).order_by('slug').values('slug', 'producer__company_name')[:limit]
+    return {
+        'titles': list(titles),
+        'booths': [{'slug': b['slug'], 'company_name': b['producer__company_name'] or ''} for b in booths],
+    }
+
+
+def suggest(text, limit=5):
+    """Top title and booth matches for a typeahead prefix"""
+    if getattr(settings, 'CONTENT_SUGGEST_USE_INDEX', True):
+        suggest_index.ensure_fresh()
+        if suggest_index.available:
+            return suggest_index.suggest(text, limit)
+    return db_suggest(text, limit)
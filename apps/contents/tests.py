@@ -0,0 +1,910 @@
+"""
+Tests for content browsing and search
+"""
+import base64
+import json
+import os
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
+from apps.core.counters import content_view_counter, content_viewer_sketches, flush_view_counters
+from apps.core.hll import HyperLogLog
+from apps.core.pagination import EstimatedPaginator
+from apps.offers.models import Offer
+from .models import Content, ContentDailyStats, ContentViewerSketch, ExchangeRate
+from .rollups import rollup_daily_stats
+from .result_cache import GENERATION_KEY
+from .suggest import suggest_index
+from .trending import compute_trending
+
+
+def create_content(producer, **kwargs):
+    """Create a public content with sensible defaults"""
+    defaults = {
+        'title': 'Untitled',
+        'description': 'No description',
+        'genre_tags': ['drama'],
+        'price': 100,
+        'currency': 'USD',
+        'duration_seconds': 60,
+        'status': CONTENT_STATUS_PUBLIC,
+    }
+    defaults.update(kwargs)
+    return Content.objects.create(producer=producer, **defaults)
+
+
+class ContentSearchTestCase(TestCase):
+    """Test full-text search on the public content API"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.running = create_content(
+            self.producer,
+            title='Running Man Shorts',
+            description='Variety show highlights'
+        )
+        self.cooking = create_content(
+            self.producer,
+            title='Kitchen Diaries',
+            description='A cooking series about running a small restaurant'
+        )
+        self.korean = create_content(
+            self.producer,
+            title='로맨스 드라마 스페셜',
+            description='짧은 로맨스 이야기'
+        )
+        self.chinese = create_content(
+            self.producer,
+            title='恋爱故事',
+            description='短剧'
+        )
+
+    def search(self, query, **params):
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'search': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.json()['data']]
+
+    def test_search_uses_stemming(self):
+        """English terms are stemmed (run -> running)"""
+        ids = self.search('run')
+        self.assertIn(self.running.id, ids)
+        self.assertIn(self.cooking.id, ids)
+        self.assertNotIn(self.korean.id, ids)
+
+    def test_search_ranks_title_matches_first(self):
+        """Title matches outrank description matches"""
+        ids = self.search('running', ordering='relevance')
+        self.assertEqual(ids[0], self.running.id)
+
+    def test_search_korean_and_chinese(self):
+        """CJK text is matched through bigrams"""
+        self.assertEqual(self.search('로맨스'), [self.korean.id])
+        self.assertEqual(self.search('故事'), [self.chinese.id])
+
+    def test_search_producer_company_name(self):
+        """Producer renames are reflected in the search vector"""
+        self.assertEqual(len(self.search('seoul')), 4)
+
+        self.producer.company_name = 'Busan Studio'
+        self.producer.save()
+
+        self.assertEqual(self.search('seoul'), [])
+        self.assertEqual(len(self.search('busan')), 4)
+
+    def test_browse_view_search(self):
+        """Template browse uses the same search"""
+        response = self.client.get(reverse('contents:browse'), {'q': 'kitchen'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_count'], 1)
+
+    def test_fuzzy_search_tolerates_typos(self):
+        """Fuzzy mode matches misspelled titles and producer names"""
+        self.assertEqual(self.search('runing mann', search_mode='fuzzy'), [self.running.id])
+        self.assertEqual(len(self.search('Seul Pictures', search_mode='fuzzy')), 4)
+
+    def test_empty_search_returns_suggestions(self):
+        """A search without results suggests close titles"""
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'search': 'kitchn diares'})
+        self.assertEqual(response.json()['data'], [])
+        self.assertIn('Kitchen Diaries', response.json()['suggestions'])
+
+    def test_invalid_search_mode(self):
+        """Unknown search modes are rejected"""
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'search': 'x', 'search_mode': 'regex'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ContentCursorPaginationTestCase(TestCase):
+    """Test keyset pagination on the public content API"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        # Identical prices exercise the id tie-breaker
+        self.contents = [
+            create_content(self.producer, title=f'Content {i}', price=100 + (i // 10))
+            for i in range(45)
+        ]
+
+    def walk(self, **params):
+        """Follow next cursors until exhausted, returning ids and the last envelope"""
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'pagination': 'cursor', **params})
+        ids = [item['id'] for item in response.json()['data']]
+        pages = [response.json()]
+        while response.json()['pagination']['next_cursor']:
+            response = self.client.get(url, {**params, 'cursor': response.json()['pagination']['next_cursor']})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item['id'] for item in response.json()['data'])
+            pages.append(response.json())
+        return ids, pages
+
+    def test_cursor_pages_cover_all_rows_in_order(self):
+        """Cursor pages match the page-number ordering without gaps or repeats"""
+        ids, pages = self.walk()
+        self.assertEqual(len(pages), 3)
+        self.assertNotIn('count', pages[0]['pagination'])
+        self.assertEqual(ids, [c.id for c in sorted(self.contents, key=lambda c: (c.created_at, c.id), reverse=True)])
+
+    def test_cursor_with_price_ordering(self):
+        """Seek works on (price, id) with duplicate prices"""
+        ids, _ = self.walk(ordering='price')
+        self.assertEqual(ids, [c.id for c in sorted(self.contents, key=lambda c: (c.price, c.id))])
+
+    def test_previous_cursor(self):
+        """previous_cursor returns to the preceding page"""
+        _, pages = self.walk(ordering='-price')
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'ordering': '-price', 'cursor': pages[1]['pagination']['previous_cursor']})
+        self.assertEqual(response.json()['data'], pages[0]['data'])
+
+    def test_invalid_cursor(self):
+        """Tampered cursors are rejected"""
+        response = self.client.get(reverse('contents_api:content_list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.json()['success'])
+
+        # Well-formed tokens with values of the wrong type for (-created_at, -pk) or (price, pk)
+        for ordering, values in (('-created_at', ['yesterday', 1]), ('-created_at', [{}, 'x']),
+                                 ('price', ['cheap', 1]), ('price', [None, 1]), ('price', [1, 2, 3])):
+            cursor = base64.urlsafe_b64encode(json.dumps({'v': values, 'r': 0}).encode()).decode()
+            response = self.client.get(reverse('contents_api:content_list'), {'ordering': ordering, 'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, values)
+
+    def test_page_number_mode_unchanged(self):
+        """Clients that don't opt in keep page-number pagination"""
+        response = self.client.get(reverse('contents_api:content_list'), {'page': 2})
+        pagination = response.json()['pagination']
+        self.assertEqual(pagination['count'], 45)
+        self.assertEqual(pagination['current_page'], 2)
+
+    def test_sparse_fieldset(self):
+        """fields= shrinks the JSON and the columns loaded"""
+        url = reverse('contents_api:content_list')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'fields': 'title,price,producer_name', 'pagination': 'cursor'})
+        self.assertEqual(set(response.json()['data'][0]), {'id', 'title', 'price', 'producer_name'})
+        sql = queries.captured_queries[-1]['sql']
+        self.assertNotIn('description', sql)
+        self.assertIn('company_name', sql)
+        self.assertNotIn('"accounts_user"."email"', sql)
+
+        # Cursor pages still work with pruned columns
+        cursor = response.json()['pagination']['next_cursor']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'fields': 'title', 'cursor': cursor})
+        self.assertEqual(len(response.json()['data']), 20)
+
+        response = self.client.get(url, {'fields': 'title,password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_estimated_mode(self):
+        """Estimated pages skip COUNT(*) and mark the total as approximate"""
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'pagination': 'estimated'})
+        pagination = response.json()['pagination']
+        self.assertEqual(len(response.json()['data']), 20)
+        self.assertTrue(pagination['has_next'])
+        self.assertTrue(pagination['count_estimated'])
+        self.assertGreaterEqual(pagination['count'], 21)
+
+        # The last page knows the exact total
+        response = self.client.get(url, {'pagination': 'estimated', 'page': 3})
+        pagination = response.json()['pagination']
+        self.assertFalse(pagination['has_next'])
+        self.assertFalse(pagination['count_estimated'])
+        self.assertEqual(pagination['count'], 45)
+        self.assertIsNone(pagination['next'])
+
+        response = self.client.get(url, {'pagination': 'estimated', 'page': 4})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=0)
+    def test_estimated_paginator_for_templates(self):
+        """EstimatedPaginator pages without COUNT(*)"""
+        paginator = EstimatedPaginator(Content.objects.order_by('-id'), 20)
+        page = paginator.get_page(2)
+        self.assertTrue(page.has_next())
+        self.assertEqual(len(page), 20)
+        page = paginator.get_page(3)
+        self.assertFalse(page.has_next())
+        self.assertEqual(paginator.count, 45)
+        self.assertFalse(paginator.count_estimated)
+
+    @override_settings(PAGINATION_EXACT_COUNT_THRESHOLD=10 ** 9)
+    def test_estimated_paginator_counts_small_lists(self):
+        """Below the threshold the count is exact and out-of-range pages clamp to the last"""
+        paginator = EstimatedPaginator(Content.objects.order_by('-id'), 20)
+        self.assertEqual(paginator.count, 45)
+        self.assertFalse(paginator.count_estimated)
+        page = paginator.get_page(999999)
+        self.assertEqual(page.number, 3)
+        self.assertEqual(len(page), 5)
+        self.assertFalse(page.has_next())
+
+
+@override_settings(CONTENT_RESULT_CACHE_ENABLED=True)
+class ContentFacetsTestCase(TestCase):
+    """Test browse facet counts"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        create_content(self.producer, genre_tags=['drama', 'romance'], price=50, rating='all')
+        create_content(self.producer, genre_tags=['drama'], price=300, currency='KRW', rating='15')
+        create_content(self.producer, genre_tags=['comedy'], price=8000, rating='15')
+        create_content(self.producer, genre_tags=['drama'], status=CONTENT_STATUS_DELETED)
+
+    def facets(self, **params):
+        response = self.client.get(reverse('contents_api:content_facets'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['data']
+
+    def test_facet_counts(self):
+        """All facets are counted over public contents"""
+        data = self.facets()
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['genres'][0], {'value': 'drama', 'count': 2})
+        self.assertIn({'value': 'romance', 'count': 1}, data['genres'])
+        self.assertEqual(data['currencies'], [{'value': 'USD', 'count': 2}, {'value': 'KRW', 'count': 1}])
+        self.assertEqual(data['ratings'], [{'value': '15', 'count': 2}, {'value': 'all', 'count': 1}])
+        buckets = {bucket['value']: bucket['count'] for bucket in data['price_buckets']}
+        self.assertEqual(buckets, {'0-100': 1, '100-500': 1, '500-1000': 0, '1000-5000': 0, '5000+': 1})
+
+    def test_facets_follow_filters(self):
+        """Applied filters narrow every facet"""
+        data = self.facets(genre='drama', max_price=100)
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['currencies'], [{'value': 'USD', 'count': 1}])
+
+    def test_facets_single_query_and_cached(self):
+        """Facets take one statement and are served from cache afterwards"""
+        with self.assertNumQueries(1):
+            self.facets(currency='usd')
+        with self.assertNumQueries(0):
+            self.facets(currency='USD')
+
+    def test_genre_modes(self):
+        """Several genres match all of them by default, or any of them"""
+        self.assertEqual(self.facets(genre='drama,romance')['total'], 1)
+        self.assertEqual(self.facets(genre=['drama', 'comedy'], genre_mode='any')['total'], 3)
+
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, {'genre': ['romance', 'comedy'], 'genre_mode': 'any'})
+        self.assertEqual(len(response.json()['data']), 2)
+        response = self.client.get(reverse('contents:browse'), {'genre': ['drama', 'romance']})
+        self.assertEqual(response.context['total_count'], 1)
+
+    def test_invalid_filters(self):
+        """Invalid filters are rejected"""
+        response = self.client.get(reverse('contents_api:content_facets'), {'min_price': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for value in ('inf', '-Infinity', 'nan', '1e999'):
+            response = self.client.get(reverse('contents_api:content_list'), {'max_price': value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, value)
+        response = self.client.get(reverse('contents:browse'), {'price_max': 'inf'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(reverse('contents_api:content_facets'), {'genre_mode': 'none'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_browse_genre_counts(self):
+        """Browse sidebar shows genre counts"""
+        response = self.client.get(reverse('contents:browse'))
+        self.assertIn(('drama', 2), response.context['genre_choices'])
+        self.assertIn(('gaming', 0), response.context['genre_choices'])
+
+
+@override_settings(CONTENT_RESULT_CACHE_ENABLED=True)
+class ContentResultCacheTestCase(TestCase):
+    """Test the public listing result cache and its invalidation"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.content = create_content(self.producer, title='Cached Title', genre_tags=['drama'])
+
+    def list_contents(self, **params):
+        response = self.client.get(reverse('contents_api:content_list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_repeated_list_served_from_cache(self):
+        """Identical requests don't touch the database"""
+        first = self.list_contents(genre='drama', ordering='price')
+        with self.assertNumQueries(0):
+            second = self.list_contents(ordering='price', genre='drama')
+        self.assertEqual(first, second)
+
+    def test_content_save_invalidates(self):
+        """Content edits and soft deletes show up immediately"""
+        self.list_contents()
+        self.content.title = 'Fresh Title'
+        self.content.save()
+        self.assertEqual(self.list_contents()['data'][0]['title'], 'Fresh Title')
+
+        self.content.soft_delete()
+        self.assertEqual(self.list_contents()['data'], [])
+
+    def test_producer_update_invalidates(self):
+        """Producer renames refresh producer_name in cached listings"""
+        self.list_contents()
+        self.producer.company_name = 'Busan Studio'
+        self.producer.save(update_fields=['company_name'])
+        self.assertEqual(self.list_contents()['data'][0]['producer_name'], 'Busan Studio')
+
+    def test_browse_served_from_cache(self):
+        """Warm browse pages render without queries"""
+        self.client.get(reverse('contents:browse'), {'genre': 'drama'})
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('contents:browse'), {'genre': 'drama'})
+        self.assertEqual(response.context['total_count'], 1)
+        self.assertEqual(list(response.context['page_obj']), [self.content])
+
+    @override_settings(CONTENT_RESULT_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        """Per-process caches would miss other processes' bumps, so nothing is cached"""
+        for url in (reverse('contents_api:content_list'), reverse('contents_api:content_facets')):
+            self.client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+            self.assertTrue(queries)
+
+
+class ContentPriceNormalizationTestCase(TestCase):
+    """Test currency-normalized price filtering and sorting"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.usd = create_content(self.producer, title='USD', price=500, currency='USD')
+        self.krw = create_content(self.producer, title='KRW', price=100000, currency='KRW')
+        self.jpy = create_content(self.producer, title='JPY', price=20000, currency='JPY')
+
+        rates_file = tempfile.NamedTemporaryFile('w', suffix='.json', delete=False)
+        json.dump({'KRW': '0.00075', 'JPY': '0.0067', 'EUR': '1.08'}, rates_file)
+        rates_file.close()
+        self.addCleanup(os.unlink, rates_file.name)
+        call_command('load_exchange_rates', rates_file.name, stdout=StringIO())
+
+    def list_titles(self, **params):
+        response = self.client.get(reverse('contents_api:content_list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['title'] for item in response.json()['data']]
+
+    def test_load_exchange_rates_renormalizes(self):
+        """Loading rates updates existing contents"""
+        self.krw.refresh_from_db()
+        self.assertEqual(self.krw.price_usd_normalized, Decimal('75.00'))
+
+    def test_load_exchange_rates_rejects_non_finite_rates(self):
+        """NaN and infinite rates are a command error, not a crash or a stored rate"""
+        for value in ('NaN', 'sNaN', 'Infinity', '-Infinity'):
+            with tempfile.NamedTemporaryFile('w', suffix='.csv') as rates_file:
+                rates_file.write(f'KRW,{value}\n')
+                rates_file.flush()
+                with self.assertRaisesMessage(CommandError, 'Invalid rate for KRW'):
+                    call_command('load_exchange_rates', rates_file.name, stdout=StringIO())
+        self.assertEqual(ExchangeRate.objects.get(currency='KRW').usd_rate, Decimal('0.00075'))
+
+    def test_save_normalizes_price(self):
+        """New and edited contents are normalized on save"""
+        eur = create_content(self.producer, price=100, currency='EUR')
+        self.assertEqual(eur.price_usd_normalized, Decimal('108.00'))
+
+        self.jpy.price = 1000
+        self.jpy.save(update_fields=['price'])
+        self.jpy.refresh_from_db()
+        self.assertEqual(self.jpy.price_usd_normalized, Decimal('6.70'))
+
+    def test_price_ordering_across_currencies(self):
+        """price ordering compares USD values, not raw numbers"""
+        self.assertEqual(self.list_titles(ordering='price'), ['KRW', 'JPY', 'USD'])
+
+    def test_price_range_across_currencies(self):
+        """Price bounds match contents in any currency"""
+        self.assertEqual(self.list_titles(max_price=200, ordering='price'), ['KRW', 'JPY'])
+        self.assertEqual(self.list_titles(min_price=200000, price_currency='KRW'), ['USD'])
+
+    def test_invalid_price_currency(self):
+        """Unknown price currencies are rejected"""
+        response = self.client.get(reverse('contents_api:content_list'), {'price_currency': 'GBP'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CONTENT_RESULT_CACHE_ENABLED=True, CONTENT_SUGGEST_REBUILD_INTERVAL=0)
+class ContentSuggestTestCase(TestCase):
+    """Test typeahead suggestions"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.running = create_content(self.producer, title='Running Man Shorts')
+        self.rookie = create_content(self.producer, title='Rookie Detective')
+        create_content(self.producer, title='Runway Draft', status='draft')
+        suggest_index.rebuild()  # Background rebuilds can't see the test transaction
+
+    def suggest(self, query, **params):
+        response = self.client.get(reverse('contents_api:content_suggest'), {'q': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()['data']
+
+    def test_title_prefixes(self):
+        """Title starts rank before later-word matches; drafts are hidden"""
+        data = self.suggest('ru')
+        self.assertEqual([item['title'] for item in data['titles']], ['Running Man Shorts'])
+        self.assertEqual(self.suggest('MAN')['titles'], [{'id': self.running.id, 'title': 'Running Man Shorts'}])
+
+    def test_booth_prefixes(self):
+        """Booths match on company name or slug"""
+        booth = {'slug': self.producer.booth_slug, 'company_name': 'Seoul Pictures'}
+        self.assertEqual(self.suggest('pict')['booths'], [booth])
+        self.assertEqual(self.suggest(self.producer.booth_slug[:4])['booths'], [booth])
+
+    def test_warm_index_skips_database(self):
+        """Keystrokes after the first are answered from memory"""
+        self.suggest('r')
+        with self.assertNumQueries(0):
+            self.suggest('ro')
+
+    def test_incremental_updates(self):
+        """Content and producer changes are reflected right away"""
+        self.suggest('r')
+        self.rookie.title = 'Midnight Detective'
+        self.rookie.save()
+        self.assertEqual(self.suggest('mid')['titles'], [{'id': self.rookie.id, 'title': 'Midnight Detective'}])
+        self.assertEqual(self.suggest('rookie')['titles'], [])
+
+        self.producer.company_name = 'Busan Studio'
+        self.producer.save()
+        self.assertEqual(self.suggest('busan')['booths'][0]['company_name'], 'Busan Studio')
+
+    def test_rebuild_only_for_other_processes(self):
+        """Own writes are applied by signals; another process's bump rebuilds in the background"""
+        with mock.patch.object(suggest_index, 'schedule_rebuild') as schedule_rebuild:
+            self.rookie.title = 'Midnight Detective'
+            self.rookie.save()
+            self.suggest('mid')
+            schedule_rebuild.assert_not_called()
+
+            cache.incr(GENERATION_KEY)  # As another worker or a cron job would
+            with self.assertNumQueries(0):
+                self.assertEqual(len(self.suggest('mid')['titles']), 1)
+            schedule_rebuild.assert_called_once()
+
+    @override_settings(CONTENT_RESULT_CACHE_ENABLED=False, CONTENT_SUGGEST_REBUILD_INTERVAL=60)
+    def test_rebuild_on_a_timer_without_shared_cache(self):
+        """Another worker's write can't bump a per-process cache; the interval rebuild drops stale titles"""
+        # As another worker would: no signal here, no bump in this process's cache
+        Content.objects.filter(pk=self.rookie.pk).update(title='Midnight Detective')
+        with mock.patch.object(suggest_index, 'schedule_rebuild', side_effect=suggest_index.rebuild) as schedule_rebuild:
+            self.assertEqual(len(self.suggest('rookie')['titles']), 1)
+            schedule_rebuild.assert_not_called()
+
+            suggest_index.built_at -= 60
+            self.assertEqual(self.suggest('rookie')['titles'], [])
+            schedule_rebuild.assert_called_once()
+        self.assertEqual(self.suggest('mid')['titles'], [{'id': self.rookie.id, 'title': 'Midnight Detective'}])
+
+    def test_cold_index_uses_database(self):
+        """Requests don't wait for the first build"""
+        with mock.patch.object(suggest_index, 'schedule_rebuild') as schedule_rebuild, \
+                mock.patch.object(suggest_index, 'built_at', 0), \
+                mock.patch.object(suggest_index, 'available', False):
+            self.assertEqual([item['title'] for item in self.suggest('ru')['titles']], ['Running Man Shorts'])
+        schedule_rebuild.assert_called_once()
+
+    @override_settings(CONTENT_SUGGEST_USE_INDEX=False)
+    def test_database_fallback(self):
+        """Without the index the database answers the same prefixes"""
+        self.assertEqual([item['title'] for item in self.suggest('ru')['titles']], ['Running Man Shorts'])
+        self.assertEqual(self.suggest('seoul')['booths'][0]['company_name'], 'Seoul Pictures')
+
+
+class ContentTrendingTestCase(TestCase):
+    """Test precomputed trending scores"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@example.com',
+            password='password123',
+            role=User.Role.BUYER,
+            company_name='Buyer Co'
+        )
+        self.old_hit = create_content(self.producer, title='Old Hit', view_count=500)
+        self.new_hit = create_content(self.producer, title='New Hit')
+        self.quiet = create_content(self.producer, title='Quiet')
+
+    def test_scores_decay_and_add_new_activity(self):
+        """Recent activity outranks older, larger activity after decay"""
+        start = timezone.now()
+        compute_trending(now=start)
+        self.old_hit.refresh_from_db()
+        self.assertEqual(self.old_hit.trending_score, 500)
+
+        Content.objects.filter(pk=self.new_hit.pk).update(view_count=100)
+        Offer.objects.create(content=self.new_hit, buyer=self.buyer, offered_price=100, currency='USD')
+        compute_trending(now=start + timedelta(hours=72))
+
+        self.old_hit.refresh_from_db()
+        self.new_hit.refresh_from_db()
+        self.assertAlmostEqual(self.old_hit.trending_score, 62.5)
+        self.assertEqual(self.new_hit.trending_score, 110)
+
+        response = self.client.get(reverse('contents_api:content_list'), {'ordering': 'trending'})
+        titles = [item['title'] for item in response.json()['data']]
+        self.assertEqual(titles, ['New Hit', 'Old Hit', 'Quiet'])
+
+    def test_booth_listing_by_trending(self):
+        """Booth scores sum their public contents"""
+        other = User.objects.create_user(
+            username='other',
+            email='other@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Other Studio'
+        )
+        create_content(other, title='Other', view_count=1000)
+        call_command('compute_trending', stdout=StringIO())
+
+        response = self.client.get(reverse('booths_api:booth_list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        slugs = [booth['slug'] for booth in response.json()['data']]
+        self.assertEqual(slugs, [other.booth_slug, self.producer.booth_slug])
+
+    def test_home_hot_content_rail(self):
+        """Home shows contents with a trending score"""
+        compute_trending()
+        response = self.client.get(reverse('home'))
+        self.assertEqual(list(response.context['hot_contents']), [self.old_hit])
+
+
+@override_settings(VIEW_COUNTER_FLUSH_INTERVAL=3600)
+class ContentViewCounterTestCase(TestCase):
+    """Test write-behind view counters"""
+
+    def setUp(self):
+        cache.clear()
+        flush_view_counters()
+        self.addCleanup(flush_view_counters)
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures',
+            is_onboarded=True
+        )
+        self.content = create_content(self.producer, title='Counted', view_count=10)
+
+    def test_views_are_buffered_until_flush(self):
+        """Detail responses include pending views; the row waits for the flush"""
+        url = reverse('contents_api:content_detail', args=[self.content.pk])
+        for expected in (11, 12, 13):
+            response = self.client.get(url)
+            self.assertEqual(response.json()['data']['view_count'], expected)
+
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 10)
+        self.assertEqual(content_view_counter.get_pending(self.content.pk), 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            flush_view_counters()
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE') and 'view_count' in q['sql']]), 1)
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 13)
+        self.assertEqual(content_view_counter.get_pending(self.content.pk), 0)
+
+    @override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0)
+    def test_zero_interval_writes_through(self):
+        """With no interval every view is written immediately"""
+        self.client.get(reverse('contents_api:content_detail', args=[self.content.pk]))
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 11)
+
+    @override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0)
+    def test_failed_flush_does_not_fail_the_request(self):
+        """A write error is logged and the views stay pending for the next flush"""
+        url = reverse('contents_api:content_detail', args=[self.content.pk])
+        with mock.patch.object(type(content_view_counter), 'write', side_effect=DatabaseError), \
+                self.assertLogs('apps.core.counters', 'ERROR'):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(content_view_counter.get_pending(self.content.pk), 1)
+
+        flush_view_counters()
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 11)
+
+    @override_settings(VIEW_COUNTER_MAX_PENDING=1)
+    def test_full_buffer_wakes_the_flusher(self):
+        """Requests only hand off to the background thread"""
+        with mock.patch('apps.core.counters.flusher') as flusher:
+            self.client.get(reverse('contents_api:content_detail', args=[self.content.pk]))
+        flusher.start.assert_called()
+        flusher.wake.assert_called()
+        self.content.refresh_from_db()
+        self.assertEqual(self.content.view_count, 10)
+
+    def test_unique_viewers_sketch(self):
+        """Repeat views count once; sketches merge across days and flushes"""
+        url = reverse('contents_api:content_detail', args=[self.content.pk])
+        for agent in ('a', 'b', 'a', 'a'):
+            self.client.get(url, HTTP_USER_AGENT=agent)
+        today = timezone.localdate()
+        self.assertEqual(content_viewer_sketches.count([self.content.pk], today, today), {self.content.pk: 2})
+
+        flush_view_counters()
+        sketch = ContentViewerSketch.objects.get(content=self.content, date=today)
+        self.assertEqual(len(bytes(sketch.registers)), 4096)
+
+        yesterday = HyperLogLog()
+        for viewer in ('anon:x', 'anon:y'):
+            yesterday.add(viewer)
+        ContentViewerSketch.objects.create(
+            content=self.content, date=today - timedelta(days=1), registers=yesterday.to_bytes()
+        )
+        self.client.get(url, HTTP_USER_AGENT='c')
+        counts = content_viewer_sketches.count([self.content.pk], today - timedelta(days=1), today)
+        self.assertEqual(counts[self.content.pk], 5)
+
+        self.client.force_authenticate(self.producer)
+        response = self.client.get(reverse('studio_contents:content_stats'))
+        self.assertEqual(response.json()['data']['unique_viewers'], 5)
+
+    def test_hyperloglog_accuracy(self):
+        """Estimates stay within a few percent at larger cardinalities"""
+        sketch = HyperLogLog()
+        for i in range(20000):
+            sketch.add(f'viewer-{i}')
+        self.assertLess(abs(sketch.count() - 20000) / 20000, 0.05)
+
+
+class ContentAnalyticsRollupTestCase(TestCase):
+    """Test daily analytics rollups and the studio analytics API"""
+
+    def setUp(self):
+        flush_view_counters()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures',
+            is_onboarded=True
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@example.com',
+            password='password123',
+            role=User.Role.BUYER,
+            company_name='Buyer Co'
+        )
+        self.content = create_content(self.producer, title='Tracked')
+
+    def test_rollup_processes_only_new_data(self):
+        """Reruns add only activity after the watermark"""
+        Content.objects.filter(pk=self.content.pk).update(view_count=7)
+        offer = Offer.objects.create(content=self.content, buyer=self.buyer, offered_price=300, currency='USD')
+        Offer.objects.filter(pk=offer.pk).update(status='accepted', responded_at=timezone.now())
+        rollup_daily_stats()
+
+        today = timezone.localdate()
+        row = ContentDailyStats.objects.get(content=self.content, date=today)
+        self.assertEqual((row.views, row.offers_created, row.offers_accepted), (7, 1, 1))
+        self.assertEqual(row.accepted_value, {'USD': '300.00'})
+
+        rollup_daily_stats()
+        row.refresh_from_db()
+        self.assertEqual((row.views, row.offers_created, row.offers_accepted), (7, 1, 1))
+
+        Content.objects.filter(pk=self.content.pk).update(view_count=10)
+        rollup_daily_stats()
+        row.refresh_from_db()
+        self.assertEqual(row.views, 10)
+
+    def test_analytics_api_serves_rollups(self):
+        """Date ranges are zero-filled and totalled from the rollup rows"""
+        today = timezone.localdate()
+        ContentDailyStats.objects.create(
+            content=self.content, date=today - timedelta(days=2), views=5, offers_created=2,
+            offers_accepted=1, accepted_value={'KRW': '150000.00'}
+        )
+        ContentDailyStats.objects.create(content=self.content, date=today, views=3, unique_viewers=2)
+
+        self.client.force_authenticate(self.producer)
+        url = reverse('studio_contents:content_analytics')
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {
+                'date_from': (today - timedelta(days=2)).isoformat(),
+                'date_to': today.isoformat(),
+            })
+        data = response.json()['data']
+        self.assertEqual([day['views'] for day in data['days']], [5, 0, 3])
+        self.assertEqual(data['totals']['views'], 8)
+        self.assertEqual(data['totals']['offers_created'], 2)
+        self.assertEqual(data['totals']['accepted_value'], {'KRW': '150000.00'})
+
+        response = self.client.get(url, {'date_from': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ContentConditionalGetTestCase(TestCase):
+    """Test ETag / Last-Modified on public detail endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(flush_view_counters)  # Views counted during the test
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.content = create_content(self.producer, title='Polled')
+
+    def test_content_detail_not_modified(self):
+        """A matching If-None-Match gets a 304 from one probe query"""
+        url = reverse('contents_api:content_detail', args=[self.content.pk])
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        self.content.title = 'Polled Again'
+        self.content.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_booth_endpoints_not_modified(self):
+        """Booth detail and contents revalidate against the booth, producer and listed contents"""
+        slug = self.producer.booth_slug
+        for url in (reverse('booths_api:booth_detail', args=[slug]),
+                    reverse('booths_api:booth_contents', args=[slug])):
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        contents_url = url
+        detail_url = reverse('booths_api:booth_detail', args=[slug])
+        detail_etag = self.client.get(detail_url)['ETag']
+        new = create_content(self.producer, title='New Release')
+        for url, etag in ((contents_url, etag), (detail_url, detail_etag)):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Editing a listed content changes the contents list, not the profile
+        contents_etag = self.client.get(contents_url)['ETag']
+        detail_etag = self.client.get(detail_url)['ETag']
+        new.title = 'New Release (Director\'s Cut)'
+        new.save()
+        response = self.client.get(contents_url, HTTP_IF_NONE_MATCH=contents_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_renormalized_price_changes_etag(self):
+        """Bulk price re-normalization moves updated_at, so stale copies are not revalidated"""
+        content = create_content(self.producer, title='Priced', price=Decimal('1000000'), currency='KRW')
+        url = reverse('contents_api:content_detail', args=[content.pk])
+        etag = self.client.get(url)['ETag']
+
+        ExchangeRate.objects.create(currency='KRW', usd_rate=Decimal('0.00075'))
+        ExchangeRate.renormalize_prices(['KRW'])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['data']['price_usd_normalized'], '750.00')
+
+    def test_batch_lookup(self):
+        """Batch returns public contents in request order from one query, without counting views"""
+        other = create_content(self.producer, title='Second')
+        draft = create_content(self.producer, title='Draft', status='draft')
+        url = reverse('contents_api:content_batch')
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'ids': f'{other.pk},{draft.pk},999999,{self.content.pk},{other.pk}'})
+        body = response.json()
+        self.assertEqual([item['id'] for item in body['data']], [other.pk, self.content.pk])
+        self.assertEqual(body['missing'], [draft.pk, 999999])
+        self.assertEqual(content_view_counter.get_pending(other.pk), 0)
+
+        self.assertEqual(self.client.get(url, {'ids': 'a,b'}).status_code, status.HTTP_400_BAD_REQUEST)
+        too_many = ','.join(str(i) for i in range(1, 102))
+        self.assertEqual(self.client.get(url, {'ids': too_many}).status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,82 @@
+"""
+Time-decayed trending scores for contents and booths
+
+compute_trending() is run periodically (management command). Each run
+decays the stored score by the time elapsed since the previous run and
+adds the activity seen in between:
+
+    score = score * 0.5 ** (elapsed / half_life)
+            + new views * TRENDING_VIEW_WEIGHT
+            + new offers * TRENDING_OFFER_WEIGHT
+
+New views are the growth of view_count since the last run, so no view
+log is needed. Views still buffered in web processes (at most
+VIEW_COUNTER_FLUSH_INTERVAL seconds old, see apps.core.counters) are
+picked up by the next run. A booth's score is the sum of its public contents' scores.
+Both live in indexed columns, so trending sorts are plain index scans.
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Count, F, FloatField, IntegerField, OuterRef, Subquery, Sum, Value
+)
+from django.db.models.functions import Cast, Coalesce, Extract, Greatest, Power
+from django.utils import timezone
+
+from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _subquery_count(queryset):
+    return Coalesce(
+        Subquery(queryset.order_by().values('content').annotate(n=Count('pk')).values('n')[:1]),
+        Value(0),
+        output_field=IntegerField()
+    )
+
+
+def compute_trending(now=None):
+    """Update Content and Booth trending scores in two UPDATE statements"""
+    from apps.booths.models import Booth
+    from apps.offers.models import Offer
+    from .models import Content
+    from .result_cache import bump_generation
+
+    now = now or timezone.now()
+    half_life = getattr(settings, 'TRENDING_HALF_LIFE_HOURS', 24) * 3600
+    view_weight = getattr(settings, 'TRENDING_VIEW_WEIGHT', 1.0)
+    offer_weight = getattr(settings, 'TRENDING_OFFER_WEIGHT', 10.0)
+
+    last_run = Coalesce(F('trending_computed_at'), Value(now))
+    elapsed = Cast(Extract(Value(now) - last_run, 'epoch'), FloatField())
+    decay = Power(Value(0.5), elapsed / Value(float(half_life)))
+
+    new_views = Greatest(F('view_count') - F('trending_views_seen'), Value(0))
+    new_offers = _subquery_count(Offer.objects.filter(
+        content=OuterRef('pk'),
+        # The first run counts every offer, like it counts every view
+        created_at__gt=Coalesce(OuterRef('trending_computed_at'), Value(EPOCH)),
+        created_at__lte=now,
+    ))
+
+    with transaction.atomic():
+        updated = Content.objects.exclude(status=CONTENT_STATUS_DELETED).update(
+            trending_score=F('trending_score') * decay
+            + Cast(new_views, FloatField()) * Value(view_weight)
+            + Cast(new_offers, FloatField()) * Value(offer_weight),
+            trending_views_seen=F('view_count'),
+            trending_computed_at=Value(now),
+        )
+
+        content_scores = Content.objects.filter(
+            producer=OuterRef('producer'), status=CONTENT_STATUS_PUBLIC
+        ).order_by().values('producer').annotate(total=Sum('trending_score')).values('total')[:1]
+        Booth.objects.update(
+            trending_score=Coalesce(Subquery(content_scores), Value(0.0), output_field=FloatField())
+        )
+        bump_generation()
+
+    return updated
@@ -4,13 +4,31 @@ Template-based views for content browsing and management
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.core.paginator import Page, Paginator
+from django.db.models import Count
 from .models import Content
+from .facets import get_facets
+from .filters import (
+    CONTENT_ORDERINGS, GENRE_MODE_ALL, GENRE_MODES, apply_content_filters, parse_genres, parse_price
+)
+from .result_cache import result_cache_key, get_cached_result, set_cached_result
+from .search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_FUZZY, search_suggestions
 from apps.booths.models import Booth
-from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED
+from apps.core.constants import CONTENT_STATUS_PUBLIC, CONTENT_STATUS_DELETED, CURRENCY_USD, GENRE_CHOICES
+from apps.core.cache_policy import public_cache_policy
+from apps.core.counters import content_viewer_sketches, viewer_key
+from apps.core.utils import parse_date_range
 
 
+def _parse_price(value):
+    """Price filter value as Decimal, or None when empty or invalid"""
+    try:
+        return parse_price(value) if value else None
+    except ValueError:
+        return None
+
+
+@public_cache_policy()
 def browse_view(request):
     """
     콘텐츠 브라우징 화면 (/browse)
@@ -22,56 +40,82 @@ def browse_view(request):
 
     # Search (BRW-002)
     search_query = request.GET.get('q', '').strip()
-    if search_query:
-        contents = contents.filter(
-            Q(title__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(producer__company_name__icontains=search_query)
-        )
-
-    # Genre filter (BRW-003)
-    genre_filter = request.GET.getlist('genre')
-    if genre_filter:
-        for genre in genre_filter:
-            contents = contents.filter(genre_tags__contains=[genre])
-
-    # Price range filter (BRW-004)
+    search_mode = request.GET.get('search_mode', '')
+
+    # Genre filter (BRW-003): all selected genres, or any with genre_mode=any
+    genre_filter = parse_genres(request.GET)
+    genre_mode = request.GET.get('genre_mode', GENRE_MODE_ALL)
+    if genre_mode not in GENRE_MODES:
+        genre_mode = GENRE_MODE_ALL
+
+    # Price range filter (BRW-004), invalid values are ignored
     price_min = request.GET.get('price_min')
     price_max = request.GET.get('price_max')
 
-    if price_min:
-        try:
-            contents = contents.filter(price__gte=float(price_min))
-        except ValueError:
-            pass
-
-    if price_max:
-        try:
-            contents = contents.filter(price__lte=float(price_max))
-        except ValueError:
-            pass
+    filters = {
+        'search': search_query,
+        'search_mode': SEARCH_MODE_FUZZY if search_mode == SEARCH_MODE_FUZZY else SEARCH_MODE_FULLTEXT,
+        'genres': genre_filter,
+        'genre_mode': genre_mode,
+        'min_price': _parse_price(price_min),
+        'max_price': _parse_price(price_max),
+        'price_currency': CURRENCY_USD,
+        'currency': None,
+    }
+    contents = apply_content_filters(contents, **filters)
 
     # Sorting
-    ordering = request.GET.get('ordering', '-created_at')
-    if ordering in ['-created_at', 'created_at', 'price', '-price']:
-        contents = contents.order_by(ordering)
+    ordering = request.GET.get('ordering', 'relevance' if search_query else '-created_at')
+    if ordering == 'relevance':
+        if search_query:
+            contents = contents.order_by('-search_rank', '-created_at')
+    elif ordering in ['-created_at', 'created_at', 'price', '-price', 'trending']:
+        contents = contents.order_by(CONTENT_ORDERINGS[ordering])
 
     # Pagination (BRW-005: 20개 단위)
+    # The page rows and count are served from the result cache when warm
     paginator = Paginator(contents, 20)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
-
-    # Genre choices for filter
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
-    ]
+    cache_key = result_cache_key('browse', request)
+    result = get_cached_result(cache_key)
+    if result is None:
+        page_number = request.GET.get('page', 1)
+        page_obj = paginator.get_page(page_number)
+
+        # "Did you mean" suggestions when the search finds nothing
+        suggestions = []
+        if search_query and not paginator.count:
+            suggestions = search_suggestions(search_query)
+
+        result = {
+            'object_list': list(page_obj.object_list),
+            'number': page_obj.number,
+            'count': paginator.count,
+            'suggestions': suggestions,
+        }
+        set_cached_result(cache_key, result)
+    else:
+        paginator.count = result['count']
+    page_obj = Page(result['object_list'], result['number'], paginator)
+    suggestions = result['suggestions']
+
+    # Current filters for pagination links
+    query_params = request.GET.copy()
+    query_params.pop('page', None)
+
+    # Genre choices with counts for the current filters
+    genre_counts = {
+        facet['value']: facet['count'] for facet in get_facets(contents, filters)['genres']
+    }
+    genre_choices = [(genre, genre_counts.get(genre, 0)) for genre in GENRE_CHOICES]
 
     context = {
         'page_obj': page_obj,
         'search_query': search_query,
+        'search_mode': search_mode,
+        'suggestions': suggestions,
+        'query_string': query_params.urlencode(),
         'genre_filter': genre_filter,
+        'genre_mode': genre_mode,
         'price_min': price_min,
         'price_max': price_max,
         'ordering': ordering,
@@ -82,6 +126,7 @@ def browse_view(request):
     return render(request, 'contents/browse.html', context)
 
 
+@public_cache_policy()
 def content_detail_view(request, content_id):
     """
     콘텐츠 상세 화면 (/content/:contentId)
@@ -95,7 +140,7 @@ def content_detail_view(request, content_id):
     )
 
     # Increment view count (CNT-001)
-    content.increment_view_count()
+    content.increment_view_count(viewer_key(request))
 
     # Check if user can submit offer (CNT-004)
     can_submit_offer = False
@@ -120,6 +165,7 @@ def content_detail_view(request, content_id):
     return render(request, 'contents/detail.html', context)
 
 
+@public_cache_policy()
 def booth_view(request, slug):
     """
     제작사 부스 화면 (/booth/:slug)
@@ -129,7 +175,7 @@ def booth_view(request, slug):
     booth = get_object_or_404(Booth.objects.select_related('producer'), slug=slug)
 
     # Increment booth view count
-    booth.increment_view_count()
+    booth.increment_view_count(viewer_key(request))
 
     # Get producer's public contents (BTH-002)
     contents = Content.objects.filter(
@@ -137,8 +183,9 @@ def booth_view(request, slug):
         status=CONTENT_STATUS_PUBLIC
     ).order_by('-created_at')
 
-    # Pagination
+    # Pagination (the booth keeps the public count, so no COUNT(*))
     paginator = Paginator(contents, 20)
+    paginator.count = booth.public_content_count
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -190,6 +237,14 @@ def studio_content_list_view(request):
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
+    # Unique viewers over the last 30 days, for this page only
+    date_from, date_to = parse_date_range({})
+    unique_viewers = content_viewer_sketches.count(
+        [content.id for content in page_obj], date_from, date_to
+    )
+    for content in page_obj:
+        content.unique_viewers = unique_viewers[content.id]
+
     context = {
         'page_obj': page_obj,
         'status_filter': status_filter,
@@ -295,15 +350,8 @@ def studio_content_create_view(request):
             messages.success(request, f'Content "{content.title}" has been created successfully!')
             return redirect('contents:studio_list')
 
-    # Genre choices
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
-    ]
-
     context = {
-        'genre_choices': genre_choices,
+        'genre_choices': GENRE_CHOICES,
     }
 
     return render(request, 'contents/studio_create.html', context)
@@ -420,16 +468,9 @@ def studio_content_edit_view(request, content_id):
                 messages.success(request, f'Content "{content.title}" has been updated successfully!')
                 return redirect('contents:studio_list')
 
-    # Genre choices
-    genre_choices = [
-        'drama', 'comedy', 'romance', 'action', 'thriller',
-        'horror', 'documentary', 'education', 'business',
-        'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
-    ]
-
     context = {
         'content': content,
-        'genre_choices': genre_choices,
+        'genre_choices': GENRE_CHOICES,
     }
 
     return render(request, 'contents/studio_edit.html', context)
@@ -59,7 +59,7 @@ class AdminDashboardView(APIView):
             'total_buyers': User.objects.filter(role=User.Role.BUYER).count(),
             'total_contents': Content.objects.exclude(status='deleted').count(),
             'total_offers': Offer.objects.count(),
-            'pending_offers': Offer.objects.filter(status='pending').count(),
+            'pending_offers': Offer.objects.filter_effective_status('pending').count(),
             'total_lois': LOI.objects.count(),
         }
 
@@ -0,0 +1,112 @@
+"""
+Cache-Control policy for public pages and API endpoints
+
+Anonymous responses are marked shareable for PUBLIC_CACHE_MAX_AGE seconds
+(plus PUBLIC_CACHE_STALE_WHILE_REVALIDATE), so a reverse proxy
+(nginx/Varnish) in front of gunicorn can serve them. Anything tied to a
+viewer (logged in, Authorization header, a session or language cookie, or
+a response that sets a cookie such as CSRF or messages) stays private.
+
+Public responses vary on language and credentials only: varying on Cookie
+would split the shared cache on every analytics cookie. The proxy must
+instead bypass its cache for requests carrying the session cookie and key
+on the language cookie, e.g. for nginx:
+
+    proxy_cache_bypass $cookie_sessionid;
+    proxy_cache_key "$scheme$host$request_uri$cookie_django_language";
+
+Private responses keep Vary: Cookie. DRF adds Accept and the compression
+middleware adds Accept-Encoding.
+
+Responses served from the proxy are not counted as views.
+"""
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import cc_delim_re, patch_cache_control, patch_vary_headers
+
+# Status codes shared caches may store (RFC 9110 heuristically cacheable plus 304)
+CACHEABLE_STATUSES = {200, 203, 204, 300, 301, 304, 404, 410}
+
+
+# Cookies that change what an anonymous visitor sees
+PERSONALIZING_COOKIES = (settings.SESSION_COOKIE_NAME, settings.LANGUAGE_COOKIE_NAME)
+
+
+def is_personalized(request, response):
+    return (
+        request.user.is_authenticated
+        or 'HTTP_AUTHORIZATION' in request.META
+        or any(name in request.COOKIES for name in PERSONALIZING_COOKIES)
+        or bool(response.cookies)
+        # The page used the CSRF token, so the response will set its cookie
+        or request.META.get('CSRF_COOKIE_NEEDS_UPDATE', False)
+    )
+
+
+def apply_cache_policy(request, response, max_age=None, stale_while_revalidate=None):
+    """Stamp public or private Cache-Control and Vary on a response"""
+    if response.has_header('Cache-Control'):
+        return response  # The view chose its own policy
+
+    patch_vary_headers(response, ('Accept-Language', 'Authorization'))
+    if is_personalized(request, response):
+        patch_vary_headers(response, ('Cookie',))
+        patch_cache_control(response, private=True, no_cache=True)
+    elif response.status_code in CACHEABLE_STATUSES:
+        response.public_cache = True
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, 'PUBLIC_CACHE_MAX_AGE', 60) if max_age is None else max_age,
+            stale_while_revalidate=(
+                getattr(settings, 'PUBLIC_CACHE_STALE_WHILE_REVALIDATE', 300)
+                if stale_while_revalidate is None else stale_while_revalidate
+            ),
+        )
+    return response
+
+
+def public_cache_policy(max_age=None, stale_while_revalidate=None):
+    """
+    View decorator: public caching for anonymous requests, private otherwise
+
+    Use directly on function views and with method_decorator on APIView
+    methods.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            return apply_cache_policy(request, response, max_age, stale_while_revalidate)
+        return wrapper
+    return decorator
+
+
+class PublicCacheMiddleware:
+    """
+    Drop Vary: Cookie from responses apply_cache_policy marked public
+
+    SessionMiddleware adds Vary: Cookie whenever the session was read, so
+    this sits above it in MIDDLEWARE and cleans up on the way out. A cookie
+    set further down the stack makes the response private after all.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not getattr(response, 'public_cache', False):
+            return response
+
+        if response.cookies:
+            response.headers['Cache-Control'] = 'private, no-cache'
+            patch_vary_headers(response, ('Cookie',))
+        elif response.has_header('Vary'):
+            vary = [header for header in cc_delim_re.split(response['Vary']) if header.lower() != 'cookie']
+            if vary:
+                response.headers['Vary'] = ', '.join(vary)
+            else:
+                del response.headers['Vary']
+        return response
@@ -0,0 +1,56 @@
+"""
+Conditional GET helpers (ETag / Last-Modified)
+
+When the client sends validators, views probe the version columns of an
+object with one indexed lookup and answer If-None-Match /
+If-Modified-Since with 304 before loading and serializing the full
+object. Full responses carry ETag and Last-Modified for the next request.
+
+ETags are weak: payloads may carry fast-moving counters (view_count)
+that do not change the representation's meaning.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.translation import get_language
+
+
+def is_conditional(request):
+    """Whether the client sent validators worth probing for"""
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+def make_etag(request, *parts):
+    """Weak ETag over version parts and the negotiated format and language"""
+    media_type = getattr(request, 'accepted_media_type', '')
+    digest = hashlib.blake2b(
+        repr((media_type, get_language(), *parts)).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def latest(*timestamps):
+    """Most recent of the given timestamps (None values ignored)"""
+    timestamps = [ts for ts in timestamps if ts is not None]
+    return max(timestamps) if timestamps else None
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 response if the client's copy is current, else None"""
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    """Stamp ETag and Last-Modified on a response"""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
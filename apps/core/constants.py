@@ -52,6 +52,22 @@ RATING_CHOICES = [
     (RATING_19, '19+'),
 ]
 
+# Content genres (browse filter and studio form choices)
+GENRE_CHOICES = [
+    'drama', 'comedy', 'romance', 'action', 'thriller',
+    'horror', 'documentary', 'education', 'business',
+    'lifestyle', 'food', 'travel', 'music', 'sports', 'gaming'
+]
+
+# Price buckets for browse facets, in USD: (label, min inclusive, max exclusive)
+PRICE_BUCKETS = [
+    ('0-100', 0, 100),
+    ('100-500', 100, 500),
+    ('500-1000', 500, 1000),
+    ('1000-5000', 1000, 5000),
+    ('5000+', 5000, None),
+]
+
 # File upload limits
 MAX_LOGO_SIZE = 2 * 1024 * 1024  # 2MB
 MAX_POSTER_SIZE = 5 * 1024 * 1024  # 5MB (for vertical posters)
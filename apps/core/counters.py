@@ -0,0 +1,294 @@
+"""
+Write-behind view counters
+
+Page views are added to an in-process buffer instead of updating the row
+on every hit. A daemon thread flushes every buffer as one batched
+UPDATE ... FROM (VALUES ...) each VIEW_COUNTER_FLUSH_INTERVAL seconds,
+sooner when a buffer grows past VIEW_COUNTER_MAX_PENDING rows, and once
+more at process exit. Requests never wait on (or fail with) the write; a
+failed flush is logged and retried on the next tick, so a hard kill
+(SIGKILL, OOM) loses at most one interval of views. Responses show the
+stored count plus this process's pending views.
+
+Distinct viewers are tracked the same way in daily HyperLogLog sketches
+(see apps.core.hll), keyed by user id or by a hash of IP and user agent.
+"""
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from .hll import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+
+def viewer_key(request):
+    """Stable viewer identity: user id, else a hash of IP and user agent"""
+    if request.user.is_authenticated:
+        return f'user:{request.user.pk}'
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+    ip = forwarded.split(',')[0].strip() or request.META.get('REMOTE_ADDR', '')
+    agent = request.META.get('HTTP_USER_AGENT', '')
+    return 'anon:' + hashlib.sha256(f'{ip}|{agent}'.encode()).hexdigest()
+
+
+class WriteBehindBuffer(ABC):
+    """In-process pending writes, flushed by the background flusher"""
+
+    def __init__(self, model_label):
+        self.model_label = model_label
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.pending = {}
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def record(self, update):
+        """Apply update(pending) under the lock; returns its result"""
+        max_pending = getattr(settings, 'VIEW_COUNTER_MAX_PENDING', 1000)
+        with self.lock:
+            result = update(self.pending)
+            full = len(self.pending) >= max_pending
+        if getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 5) <= 0:
+            try:
+                self.flush()  # Write-through
+            except Exception:
+                logger.exception('View counter flush failed, will retry')
+        else:
+            flusher.start()
+            if full:
+                flusher.wake()
+        return result
+
+    def flush(self):
+        """Write all pending entries; on error they are requeued and the error re-raised"""
+        if not self.flush_lock.acquire(blocking=False):
+            return 0  # Another thread is already flushing
+        try:
+            with self.lock:
+                batch = sorted(self.pending.items())
+                self.pending = {}
+            if not batch:
+                return 0
+            try:
+                self.write(batch)
+            except Exception:
+                # Put the entries back so the next flush retries them
+                with self.lock:
+                    for key, value in batch:
+                        self.requeue(key, value)
+                raise
+            return len(batch)
+        finally:
+            self.flush_lock.release()
+
+    @abstractmethod
+    def requeue(self, key, value):
+        """Merge a failed batch entry back into pending (called under the lock)"""
+
+    @abstractmethod
+    def write(self, batch):
+        """Persist sorted [(key, value)] pairs"""
+
+
+class BufferedCounter(WriteBehindBuffer):
+    """Buffered increments of one integer column"""
+
+    def __init__(self, model_label, field):
+        super().__init__(model_label)
+        self.field = field
+
+    def increment(self, pk):
+        """
+        Count one view of pk; returns the views not yet in the database
+        (including this one) for display on top of the loaded value
+        """
+        def update(pending):
+            pending[pk] = pending.get(pk, 0) + 1
+            return pending[pk]
+        return self.record(update)
+
+    def get_pending(self, pk):
+        with self.lock:
+            return self.pending.get(pk, 0)
+
+    def requeue(self, pk, delta):
+        self.pending[pk] = self.pending.get(pk, 0) + delta
+
+    def write(self, batch):
+        meta = self.model._meta
+        table = connection.ops.quote_name(meta.db_table)
+        column = connection.ops.quote_name(meta.get_field(self.field).column)
+        pk_column = connection.ops.quote_name(meta.pk.column)
+        values = ', '.join(['(%s::bigint, %s::integer)'] * len(batch))
+        params = [item for pk_delta in batch for item in pk_delta]
+        # Rows are sorted by pk so concurrent flushes lock in the same order
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} AS t SET {column} = t.{column} + v.delta '
+                f'FROM (VALUES {values}) AS v(id, delta) WHERE t.{pk_column} = v.id',
+                params
+            )
+
+
+class ViewerSketchBuffer(WriteBehindBuffer):
+    """
+    Buffered daily distinct-viewer sketches
+
+    model_label names a sketch model with a foreign key (fk_field), a
+    date and a registers BinaryField, unique on (fk_field, date).
+    """
+
+    def __init__(self, model_label, fk_field):
+        super().__init__(model_label)
+        self.fk_field = fk_field
+
+    def add(self, pk, viewer):
+        """Record that viewer saw pk today"""
+        key = (pk, timezone.localdate())
+
+        def update(pending):
+            pending.setdefault(key, HyperLogLog()).add(viewer)
+        self.record(update)
+
+    def requeue(self, key, sketch):
+        if key in self.pending:
+            self.pending[key].merge(sketch)
+        else:
+            self.pending[key] = sketch
+
+    def write(self, batch):
+        model = self.model
+        fk_id = f'{self.fk_field}_id'
+        parent = model._meta.get_field(self.fk_field).related_model
+        ids = set(parent.objects.filter(
+            pk__in={pk for (pk, _), _ in batch}
+        ).values_list('pk', flat=True))  # Items deleted meanwhile are skipped
+        dates = {day for (_, day), _ in batch}
+        with transaction.atomic():
+            # Create missing rows first, so concurrent flushes merge instead of colliding
+            model.objects.bulk_create(
+                [model(**{fk_id: pk, 'date': day, 'registers': HyperLogLog().to_bytes()})
+                 for (pk, day), _ in batch if pk in ids],
+                ignore_conflicts=True
+            )
+            rows = {
+                (getattr(row, fk_id), row.date): row
+                for row in model.objects.select_for_update().filter(
+                    **{f'{fk_id}__in': ids, 'date__in': dates}
+                ).order_by(fk_id, 'date')
+            }
+            changed = []
+            for key, sketch in batch:
+                row = rows.get(key)
+                if row is None:
+                    continue
+                row.registers = sketch.merge(bytes(row.registers)).to_bytes()
+                changed.append(row)
+            model.objects.bulk_update(changed, ['registers'])
+
+    def merged(self, ids, start, end):
+        """
+        {id: HyperLogLog} of distinct viewers between start and end (inclusive)
+
+        Stored sketches are merged with this process's pending ones, so
+        views not yet flushed are included.
+        """
+        fk_id = f'{self.fk_field}_id'
+        ids = set(ids)
+        sketches = defaultdict(HyperLogLog)
+        rows = self.model.objects.filter(
+            **{f'{fk_id}__in': ids, 'date__gte': start, 'date__lte': end}
+        ).values_list(fk_id, 'registers')
+        for pk, registers in rows:
+            sketches[pk].merge(bytes(registers))
+        with self.lock:
+            for (pk, day), sketch in self.pending.items():
+                if pk in ids and start <= day <= end:
+                    sketches[pk].merge(sketch)
+        return sketches
+
+    def count(self, ids, start, end):
+        """Distinct viewers of each id: {id: count}"""
+        sketches = self.merged(ids, start, end)
+        return {pk: sketches[pk].count() if pk in sketches else 0 for pk in ids}
+
+    def count_distinct(self, ids, start, end):
+        """Distinct viewers across all ids (a viewer of several counts once)"""
+        total = HyperLogLog()
+        for sketch in self.merged(ids, start, end).values():
+            total.merge(sketch)
+        return total.count()
+
+
+content_view_counter = BufferedCounter('contents.Content', 'view_count')
+booth_view_counter = BufferedCounter('booths.Booth', 'view_count')
+content_viewer_sketches = ViewerSketchBuffer('contents.ContentViewerSketch', 'content')
+booth_viewer_sketches = ViewerSketchBuffer('booths.BoothViewerSketch', 'booth')
+
+BUFFERS = (content_view_counter, booth_view_counter, content_viewer_sketches, booth_viewer_sketches)
+
+
+def flush_view_counters():
+    """Flush every view counter and viewer sketch"""
+    return sum(buffer.flush() for buffer in BUFFERS)
+
+
+class BackgroundFlusher:
+    """Daemon thread running flush_view_counters() every VIEW_COUNTER_FLUSH_INTERVAL seconds"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.pid = None
+
+    def start(self):
+        """Start the thread once per process (a forked worker starts its own)"""
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.wakeup = threading.Event()
+            threading.Thread(target=self.run, name='view-counter-flusher', daemon=True).start()
+            self.pid = os.getpid()
+
+    def wake(self):
+        """Flush now instead of at the next tick"""
+        self.wakeup.set()
+
+    def run(self):
+        while True:
+            interval = getattr(settings, 'VIEW_COUNTER_FLUSH_INTERVAL', 5)
+            self.wakeup.wait(interval if interval > 0 else 1)
+            self.wakeup.clear()
+            try:
+                flush_view_counters()
+            except Exception:
+                logger.exception('View counter flush failed, will retry')
+            finally:
+                connections.close_all()  # This thread's connections only
+
+
+flusher = BackgroundFlusher()
+
+
+def _flush_at_exit():
+    try:
+        flush_view_counters()
+    except Exception:
+        logger.exception('View counter flush at exit failed, views lost')
+
+
+atexit.register(_flush_at_exit)
@@ -0,0 +1,59 @@
+"""
+HyperLogLog sketches for approximate distinct counts
+
+A sketch is 2 ** HLL_PRECISION one-byte registers (4 KB at precision 12,
+about 1.6% standard error). Sketches merge by taking the register-wise
+maximum, so daily sketches combine into counts for any date range.
+"""
+import hashlib
+import math
+
+HLL_PRECISION = 12
+HLL_REGISTERS = 1 << HLL_PRECISION
+_HASH_BITS = 64
+_REMAINDER_BITS = _HASH_BITS - HLL_PRECISION
+
+
+def _hash(value):
+    digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+class HyperLogLog:
+    """Distinct-value estimator with a fixed-size register array"""
+
+    def __init__(self, registers=None):
+        if registers is None:
+            self.registers = bytearray(HLL_REGISTERS)
+        else:
+            if len(registers) != HLL_REGISTERS:
+                raise ValueError(f'Expected {HLL_REGISTERS} registers, got {len(registers)}')
+            self.registers = bytearray(registers)
+
+    def add(self, value):
+        hashed = _hash(value)
+        index = hashed >> _REMAINDER_BITS
+        remainder = hashed & ((1 << _REMAINDER_BITS) - 1)
+        # Position of the first 1 bit in the remaining hash bits
+        rank = _REMAINDER_BITS - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Fold another sketch (or its register bytes) into this one"""
+        registers = other.registers if isinstance(other, HyperLogLog) else other
+        self.registers = bytearray(map(max, self.registers, registers))
+        return self
+
+    def count(self):
+        m = HLL_REGISTERS
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self):
+        return bytes(self.registers)
@@ -0,0 +1,92 @@
+"""
+Response compression for dynamic pages and API responses
+
+CompressionMiddleware negotiates brotli (when the brotli package is
+installed) or gzip for responses of at least COMPRESSION_MIN_SIZE bytes.
+File downloads (FileResponse, e.g. LOI PDFs) and already-compressed media
+types pass through untouched, so they keep streaming from disk with their
+Content-Length. Static files are compressed ahead of time by WhiteNoise.
+
+Brotli has no header field for random padding, so it is only used for
+responses that cannot carry a per-viewer secret (no credentials, session
+or CSRF cookie on the request, no cookie set by the response). Everything
+else goes through GZipMiddleware, whose random gzip filename is Django's
+BREACH mitigation.
+"""
+from django.conf import settings
+from django.http import FileResponse
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r'\bbr\b')
+
+# Compressing these again costs CPU and saves nothing
+PRECOMPRESSED_TYPES = ('image/', 'video/', 'audio/', 'application/pdf', 'application/zip', 'application/gzip')
+
+
+def brotli_sequence(sequence, quality):
+    """Brotli-compress an iterator of byte chunks, flushing after each chunk"""
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def may_carry_secrets(request, response):
+    """True if the body could hold a session-bound secret such as a CSRF token"""
+    return (
+        'HTTP_AUTHORIZATION' in request.META
+        or settings.SESSION_COOKIE_NAME in request.COOKIES
+        or settings.CSRF_COOKIE_NAME in request.COOKIES
+        or bool(response.cookies)
+    )
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """brotli or gzip for dynamic responses above a size threshold"""
+
+    def process_response(self, request, response):
+        if not self.should_compress(response):
+            return response
+
+        if brotli is None or not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', '')):
+            return super().process_response(request, response)
+        if response.streaming and response.is_async:
+            return super().process_response(request, response)
+        if may_carry_secrets(request, response):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 5)
+        if response.streaming:
+            response.streaming_content = brotli_sequence(response.streaming_content, quality)
+            # The compressed size is unknown until the stream ends
+            del response.headers['Content-Length']
+        else:
+            compressed_content = brotli.compress(response.content, quality=quality)
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers['Content-Length'] = str(len(response.content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
+
+    def should_compress(self, response):
+        if isinstance(response, FileResponse) or response.has_header('Content-Encoding'):
+            return False
+        if response.get('Content-Type', '').startswith(PRECOMPRESSED_TYPES):
+            return False
+        min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        return response.streaming or len(response.content) >= min_size
@@ -0,0 +1,376 @@
+"""
+Pagination helpers for API list responses
+
+Page-number pagination (DRF's PageNumberPagination) is the default.
+Keyset (cursor) pagination is opt-in with ?pagination=cursor (or by passing
+a ?cursor= token): instead of OFFSET it seeks past the last row seen using
+the queryset ordering plus the primary key as a tie-breaker, so every page
+costs the same as the first one.
+Estimated pagination (?pagination=estimated) keeps page numbers but skips
+COUNT(*): it fetches one extra row to know whether a next page exists and
+reports the planner's row estimate as the total.
+"""
+import base64
+import binascii
+import json
+import math
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Page, Paginator
+from django.db import connections
+from django.db.models import BooleanField, Expression, F, Q, Value
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+PAGINATION_MODE_PARAM = 'pagination'
+PAGINATION_MODE_PAGE = 'page'
+PAGINATION_MODE_CURSOR = 'cursor'
+PAGINATION_MODE_ESTIMATED = 'estimated'
+PAGINATION_MODES = [PAGINATION_MODE_PAGE, PAGINATION_MODE_CURSOR, PAGINATION_MODE_ESTIMATED]
+CURSOR_PARAM = 'cursor'
+PAGE_PARAM = 'page'
+
+
+class RowComparison(Expression):
+    """
+    SQL row-value comparison, e.g. (created_at, id) < (%s, %s)
+
+    Unlike the equivalent OR-chain, PostgreSQL can use a row comparison
+    as an index condition on a matching composite index.
+    """
+
+    def __init__(self, lhs, operator, rhs):
+        super().__init__(output_field=BooleanField())
+        self.lhs = list(lhs)
+        self.operator = operator
+        self.rhs = list(rhs)
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs = list(exprs[:len(self.lhs)])
+        self.rhs = list(exprs[len(self.lhs):])
+
+    def as_sql(self, compiler, connection):
+        params = []
+        sides = []
+        for side in (self.lhs, self.rhs):
+            parts = []
+            for expression in side:
+                sql, expression_params = compiler.compile(expression)
+                parts.append(sql)
+                params.extend(expression_params)
+            sides.append(', '.join(parts))
+        return f'({sides[0]}) {self.operator} ({sides[1]})', params
+
+
+def get_pagination_mode(request):
+    """Pagination mode requested by the client (page-number pagination otherwise)"""
+    if request.query_params.get(CURSOR_PARAM):
+        return PAGINATION_MODE_CURSOR
+    mode = request.query_params.get(PAGINATION_MODE_PARAM, PAGINATION_MODE_PAGE)
+    return mode if mode in PAGINATION_MODES else PAGINATION_MODE_PAGE
+
+
+def estimate_count(queryset):
+    """
+    Approximate row count without COUNT(*)
+
+    Unfiltered querysets read pg_class.reltuples (kept by VACUUM/ANALYZE);
+    filtered ones, and tables never analyzed, use the planner's EXPLAIN
+    row estimate for the query.
+    """
+    connection = connections[queryset.db]
+    queryset = queryset.order_by()
+    with connection.cursor() as cursor:
+        if not queryset.query.where and not queryset.query.distinct:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return int(row[0])
+
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _fetch_page(queryset, number, page_size):
+    """
+    Rows of a 1-based page plus a count that is exact on the last page
+
+    Fetches page_size + 1 rows: the extra row tells whether a next page
+    exists. Only then is the estimated total consulted, clamped to what
+    the fetched rows prove.
+    """
+    offset = (number - 1) * page_size
+    rows = list(queryset[offset:offset + page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    if has_next:
+        return rows, True, max(estimate_count(queryset), offset + page_size + 1), True
+    if rows or number == 1:
+        return rows, False, offset + len(rows), False
+    # Past the last page: the total is somewhere below this page
+    return rows, False, min(estimate_count(queryset), offset), True
+
+
+class EstimatedPagination:
+    """Page-number pagination with an estimated total instead of COUNT(*)"""
+
+    page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+
+    def __init__(self, page_size=None):
+        if page_size:
+            self.page_size = page_size
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        try:
+            self.number = int(request.query_params.get(PAGE_PARAM, 1))
+            if self.number < 1:
+                raise ValueError
+        except ValueError:
+            raise NotFound('Invalid page.')
+
+        rows, self.has_next, self.count, self.count_estimated = _fetch_page(
+            queryset, self.number, self.page_size
+        )
+        if not rows and self.number > 1:
+            raise NotFound('Invalid page.')
+        return rows
+
+    def get_pagination_data(self):
+        return {
+            'mode': PAGINATION_MODE_ESTIMATED,
+            'count': self.count,
+            'count_estimated': self.count_estimated,
+            'next': self.get_link(self.number + 1) if self.has_next else None,
+            'previous': self.get_link(self.number - 1) if self.number > 1 else None,
+            'page_size': self.page_size,
+            'current_page': self.number,
+            'total_pages': math.ceil(self.count / self.page_size),
+            'has_next': self.has_next,
+        }
+
+    def get_link(self, number):
+        url = self.request.build_absolute_uri()
+        if number == 1:
+            return remove_query_param(url, PAGE_PARAM)
+        return replace_query_param(url, PAGE_PARAM, number)
+
+
+class EstimatedPaginator(Paginator):
+    """
+    Django Paginator for template views that avoids COUNT(*)
+
+    count starts as the planner estimate and is corrected once a page is
+    fetched; count_estimated tells templates whether it is exact. Below
+    PAGINATION_EXACT_COUNT_THRESHOLD estimated rows COUNT(*) is cheap, so
+    the count is exact from the start and out-of-range pages are clamped
+    to the last one like Paginator.get_page() does.
+    """
+
+    count_estimated = True
+
+    def __init__(self, object_list, per_page, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        threshold = getattr(settings, 'PAGINATION_EXACT_COUNT_THRESHOLD', 1000)
+        estimate = estimate_count(object_list)
+        if estimate < threshold:
+            self.count, self.count_estimated = object_list.count(), False
+        else:
+            self.count = estimate
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            number = 1
+        number = max(number, 1)
+        if self.count_estimated:
+            return number  # Any positive page may exist, the estimate can't rule it out
+        return min(number, self.num_pages)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_estimated:
+            return super().page(number)
+        rows, _, self.count, self.count_estimated = _fetch_page(self.object_list, number, self.per_page)
+        self.__dict__.pop('num_pages', None)
+        return Page(rows, number, self)
+
+    @property
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, value):
+        self._count = value
+
+
+class KeysetPagination:
+    """
+    Cursor pagination that seeks on (ordering fields..., pk)
+
+    Ordering fields must be non-null model fields or annotations. Cursors
+    are opaque base64 tokens holding the boundary row's ordering values.
+    """
+
+    page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+
+    def __init__(self, page_size=None):
+        if page_size:
+            self.page_size = page_size
+        self.has_next = False
+        self.has_previous = False
+        self.next_cursor = None
+        self.previous_cursor = None
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        ordering = self.get_ordering(queryset)
+        cursor = self.decode_cursor(request.query_params.get(CURSOR_PARAM), queryset, ordering)
+
+        reverse = bool(cursor and cursor['r'])
+        if reverse:
+            ordering = [(name, not descending) for name, descending in ordering]
+
+        queryset = queryset.order_by(*[f"{'-' if desc else ''}{name}" for name, desc in ordering])
+        if cursor:
+            queryset = queryset.filter(self.seek_condition(queryset, ordering, cursor['v']))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+            ordering = [(name, not descending) for name, descending in ordering]
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        if rows and self.has_next:
+            self.next_cursor = self.encode_cursor(rows[-1], ordering, reverse=False)
+        if rows and self.has_previous:
+            self.previous_cursor = self.encode_cursor(rows[0], ordering, reverse=True)
+        return rows
+
+    def get_pagination_data(self):
+        return {
+            'mode': PAGINATION_MODE_CURSOR,
+            'next': self.get_link(self.next_cursor),
+            'previous': self.get_link(self.previous_cursor),
+            'next_cursor': self.next_cursor,
+            'previous_cursor': self.previous_cursor,
+            'page_size': self.page_size,
+        }
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, 'page')
+        url = remove_query_param(url, PAGINATION_MODE_PARAM)
+        return replace_query_param(url, CURSOR_PARAM, cursor)
+
+    @staticmethod
+    def get_ordering(queryset):
+        """Queryset ordering as [(name, descending)], with pk as final tie-breaker"""
+        query = queryset.query
+        fields = query.order_by or (query.default_ordering and queryset.model._meta.ordering) or []
+        ordering = []
+        for field in fields:
+            if not isinstance(field, str) or field == '?':
+                raise NotFound('Cursor pagination is not available for this listing')
+            descending = field.startswith('-')
+            name = field.lstrip('-')
+            if name == queryset.model._meta.pk.name:
+                name = 'pk'
+            ordering.append((name, descending))
+            if name == 'pk':
+                break
+        if not ordering or ordering[-1][0] != 'pk':
+            ordering.append(('pk', ordering[-1][1] if ordering else True))
+        return ordering
+
+    @staticmethod
+    def seek_condition(queryset, ordering, values):
+        """Rows strictly after the cursor position in the given ordering"""
+        rhs = [Value(value, output_field=_output_field(queryset, name)) for (name, _), value in zip(ordering, values)]
+        directions = {descending for _, descending in ordering}
+        if len(directions) == 1:
+            operator = '<' if directions.pop() else '>'
+            return RowComparison([F(name) for name, _ in ordering], operator, rhs)
+
+        # Mixed directions can't be expressed as one row comparison
+        condition = Q()
+        for index, (name, descending) in enumerate(ordering):
+            step = Q(**{f"{name}__{'lt' if descending else 'gt'}": rhs[index]})
+            for prior_index in range(index):
+                step &= Q(**{ordering[prior_index][0]: rhs[prior_index]})
+            condition |= step
+        return condition
+
+    @staticmethod
+    def encode_cursor(row, ordering, reverse):
+        values = []
+        for name, _ in ordering:
+            if isinstance(row, dict):
+                value = row[name]  # values() row (fast serialization path)
+            else:
+                value = row
+                for part in name.split('__'):
+                    value = getattr(value, part)
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            elif isinstance(value, Decimal):
+                value = str(value)
+            values.append(value)
+        payload = json.dumps({'v': values, 'r': int(reverse)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(token, queryset, ordering):
+        """Cursor dict with values converted to the ordering fields' types (forged ones are a 404)"""
+        if not token:
+            return None
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            if not isinstance(cursor.get('v'), list) or len(cursor['v']) != len(ordering):
+                raise ValueError
+            cursor['v'] = [
+                _output_field(queryset, name).to_python(value)
+                for (name, _), value in zip(ordering, cursor['v'])
+            ]
+            if None in cursor['v']:
+                raise ValueError  # Ordering fields are non-null
+            cursor['r'] = bool(cursor.get('r'))
+            return cursor
+        except (ValueError, TypeError, AttributeError, ValidationError, binascii.Error, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
+
+
+def _output_field(queryset, name):
+    """Model field or annotation output field behind an ordering name"""
+    if name in queryset.query.annotations:
+        return queryset.query.annotations[name].output_field
+    model = queryset.model
+    field = None
+    for part in name.split('__'):
+        field = model._meta.pk if part == 'pk' else model._meta.get_field(part)
+        if field.is_relation:
+            model = field.related_model
+    return field
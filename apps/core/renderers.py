@@ -0,0 +1,66 @@
+"""
+Fast API renderers
+
+ORJSONRenderer replaces DRF's stdlib-json JSONRenderer with byte-identical
+output for valid data: datetimes go through DRF's encoder (millisecond
+precision), U+2028/U+2029 are escaped, and indented output (browsable
+API, ?indent / renderer_context['indent']) is left to DRF's renderer.
+One difference remains: NaN and infinite floats render as null, where
+DRF's strict JSON raises. MessagePackRenderer serves the same data as
+application/msgpack for machine clients (Accept header or
+?format=msgpack). Values neither library handles natively go through
+DRF's JSON encoder rules (Decimal as number, lazy strings, timedelta...).
+"""
+import msgpack
+import orjson
+from django.db.models.fields.files import FieldFile
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_drf_encoder = JSONEncoder()
+
+# Datetimes are passed to encode_default so they get DRF's formatting
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def encode_default(obj):
+    """Fallback for values the fast encoders do not know"""
+    if isinstance(obj, FieldFile):
+        # Unserialized file/image fields render as their URL
+        return obj.url if obj else None
+    return _drf_encoder.default(obj)
+
+
+class RendererJSONEncoder(JSONEncoder):
+    """DRF's encoder plus the FieldFile rule, for indented output"""
+
+    def default(self, obj):
+        return encode_default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson"""
+    encoder_class = RendererJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # orjson only indents by two spaces; indented output is for humans
+            return super().render(data, accepted_media_type, renderer_context)
+        content = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+        # Like DRF: these are valid JSON but end lines in JavaScript
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack renderer for machine clients"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
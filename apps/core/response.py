@@ -48,18 +48,53 @@ def error_response(message="Error occurred", errors=None, error_code=None, statu
     return Response(response_data, status=status_code)
 
 
-def paginated_response(queryset, serializer_class, request, message="Success"):
+def paginated_response(queryset, serializer_class, request, message="Success",
+                       serializer_kwargs=None, **kwargs):
     """
     Helper for paginated responses
+    Page-number pagination by default; clients pick another with
+    ?pagination=page|cursor|estimated
+    serializer_kwargs are passed to the serializer (e.g. sparse fields)
+    Extra kwargs are added to the envelope (e.g. suggestions)
+    Serializers with Meta.fast_read are rendered from values() rows
+    (see apps.core.serializers.FastReadSerializer)
     """
+    serializer_kwargs = serializer_kwargs or {}
+    from django.db.models import QuerySet
     from rest_framework.pagination import PageNumberPagination
+    from .pagination import (
+        PAGINATION_MODE_CURSOR, PAGINATION_MODE_ESTIMATED,
+        KeysetPagination, EstimatedPagination, get_pagination_mode
+    )
+    from .serializers import get_fast_serializer
+
+    fast = None
+    if isinstance(queryset, QuerySet) and set(serializer_kwargs) <= {'fields'}:
+        fast = get_fast_serializer(serializer_class, serializer_kwargs.get('fields'))
+    if fast is not None:
+        queryset = fast.prepare(queryset)
+
+    def serialize(rows):
+        if fast is not None:
+            return fast.serialize(rows)
+        return serializer_class(rows, many=True, **serializer_kwargs).data
+
+    mode = get_pagination_mode(request)
+    if mode in (PAGINATION_MODE_CURSOR, PAGINATION_MODE_ESTIMATED):
+        paginator = KeysetPagination() if mode == PAGINATION_MODE_CURSOR else EstimatedPagination()
+        rows = paginator.paginate_queryset(queryset, request)
+        return success_response(
+            data=serialize(rows),
+            message=message,
+            pagination=paginator.get_pagination_data(),
+            **kwargs
+        )
 
     paginator = PageNumberPagination()
     paginated_queryset = paginator.paginate_queryset(queryset, request)
-    serializer = serializer_class(paginated_queryset, many=True)
 
     return success_response(
-        data=serializer.data,
+        data=serialize(paginated_queryset),
         message=message,
         pagination={
             'count': paginator.page.paginator.count,
@@ -68,5 +103,6 @@ def paginated_response(queryset, serializer_class, request, message="Success"):
             'page_size': paginator.page_size,
             'current_page': paginator.page.number,
             'total_pages': paginator.page.paginator.num_pages,
-        }
+        },
+        **kwargs
     )
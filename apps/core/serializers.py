@@ -0,0 +1,206 @@
+"""
+Shared serializer helpers
+"""
+from functools import lru_cache
+
+FIELDS_PARAM = 'fields'
+
+
+class SparseFieldsetMixin:
+    """
+    ModelSerializer mixin for ?fields=a,b,c sparse fieldsets
+
+    Pass fields=[...] to keep only those output fields. Use
+    apply_sparse_fieldset() in list views to parse the request and prune
+    the queryset columns to match.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def apply_sparse_fieldset(queryset, serializer_class, request, always=('id',)):
+    """
+    Read ?fields= and load only the columns those fields need
+
+    Returns (queryset, fields); fields is None when the parameter is
+    absent. Raises ValueError with a client-facing message for unknown
+    fields. select_related is narrowed to the relations still needed and
+    ordering columns stay loaded (cursor pagination reads them).
+    """
+    param = request.query_params.get(FIELDS_PARAM)
+    if not param:
+        return queryset, None
+
+    available = serializer_class().fields
+    fields = list(dict.fromkeys(name.strip() for name in param.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in available]
+    if unknown or not fields:
+        raise ValueError(
+            f"Invalid fields: {', '.join(unknown) or param}. "
+            f"Available: {', '.join(available)}"
+        )
+    fields = [name for name in always if name in available and name not in fields] + fields
+
+    columns = set()
+    relations = set()
+    for name in fields:
+        source = available[name].source
+        if source == '*':
+            # Method fields may read anything, keep every column
+            return queryset, fields
+        path = source.replace('.', '__')
+        if path in queryset.query.annotations:
+            continue  # Computed by the query, no column to load
+        columns.add(path)
+        parts = path.split('__')[:-1]
+        for i in range(1, len(parts) + 1):
+            relations.add('__'.join(parts[:i]))
+
+    query = queryset.query
+    for ordering in query.order_by or (query.default_ordering and queryset.model._meta.ordering) or []:
+        if isinstance(ordering, str):
+            name = ordering.lstrip('-')
+            if name != 'pk' and name not in query.annotations:
+                columns.add(name)
+
+    queryset = queryset.select_related(None)
+    if relations:
+        queryset = queryset.select_related(*relations)
+    return queryset.only(*columns, *relations), fields
+
+
+class FastSerializerUnsupported(Exception):
+    """The serializer has a field the fast path can't reproduce"""
+
+
+class FastReadSerializer:
+    """
+    values()-based projection of a read-only ModelSerializer
+
+    Opt in with Meta.fast_read = True. Each output field is compiled once
+    into (column path, converter): plain columns are read with values()
+    and passed through DRF's own to_representation (or as-is where that is
+    an identity), file fields become storage URLs, and forward foreign keys
+    give their id. No model instances or serializer field lookups are
+    made per row, and the output matches serializer.data.
+
+    Computed fields can be declared on the serializer as
+    fast_getters = {name: ((column paths...), function)}; the function
+    receives the column values and returns the rendered value. Serializers
+    with any other kind of field (method fields, nested serializers,
+    nullable relation hops) are not compiled, see get_fast_serializer().
+    """
+
+    def __init__(self, serializer_class, fields=None):
+        serializer = serializer_class(fields=fields) if fields is not None else serializer_class()
+        self.model = serializer_class.Meta.model
+        computed = getattr(serializer_class, 'fast_getters', {})
+        self.paths = []
+        self.getters = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in computed:
+                sources, function = computed[name]
+                self.getters.append((name, tuple(self.column(path) for path in sources), function))
+            else:
+                self.getters.append((name, self.column(field.source.replace('.', '__')), self.converter(field)))
+
+    def column(self, path):
+        if path not in self.paths:
+            self.paths.append(path)
+        return path
+
+    def converter(self, field):
+        """Function turning a non-null column value into the field's output (None: as-is)"""
+        from django.db import models
+        from rest_framework import fields as drf_fields, relations
+
+        if field.source == '*' or not isinstance(field, drf_fields.Field) or hasattr(field, 'child_relation'):
+            raise FastSerializerUnsupported(field.field_name)
+        model_field = self.model_field(field.source.split('.'))
+
+        if isinstance(field, relations.RelatedField):
+            if not isinstance(field, relations.PrimaryKeyRelatedField) or field.pk_field is not None:
+                raise FastSerializerUnsupported(field.field_name)
+            return None  # values() gives the related id
+        if model_field.is_relation:
+            raise FastSerializerUnsupported(field.field_name)
+        if isinstance(field, drf_fields.FileField):
+            if not getattr(field, 'use_url', True):
+                return None
+            storage = model_field.storage
+            return lambda name: storage.url(name) if name else None
+        if type(field) is drf_fields.ChoiceField and all(isinstance(key, str) for key in field.choice_strings_to_values.values()):
+            return None
+        if type(field) in (drf_fields.CharField, drf_fields.ReadOnlyField) and isinstance(model_field, (models.CharField, models.TextField)):
+            return None
+        if type(field) is drf_fields.IntegerField and isinstance(model_field, models.IntegerField):
+            return None
+        if isinstance(field, drf_fields.SerializerMethodField) or not hasattr(field, 'to_representation'):
+            raise FastSerializerUnsupported(field.field_name)
+        return field.to_representation
+
+    def model_field(self, attrs):
+        """Concrete model field behind a dotted source, via non-null forward relations only"""
+        from django.core.exceptions import FieldDoesNotExist
+
+        model = self.model
+        try:
+            for index, attr in enumerate(attrs):
+                model_field = model._meta.get_field(attr)
+                if not model_field.concrete or model_field.many_to_many:
+                    raise FastSerializerUnsupported(attr)
+                if index < len(attrs) - 1:
+                    if not model_field.is_relation or model_field.null:
+                        raise FastSerializerUnsupported(attr)
+                    model = model_field.related_model
+        except FieldDoesNotExist:
+            raise FastSerializerUnsupported('.'.join(attrs))
+        return model_field
+
+    def prepare(self, queryset):
+        """values() queryset with the output columns and the ordering columns (for cursors)"""
+        query = queryset.query
+        ordering = query.order_by or (query.default_ordering and self.model._meta.ordering) or []
+        extra = [name.lstrip('-') for name in ordering if isinstance(name, str) and name != '?']
+        return queryset.values(*dict.fromkeys([*self.paths, 'pk', *extra]))
+
+    def serialize(self, rows):
+        data = []
+        for row in rows:
+            item = {}
+            for name, source, convert in self.getters:
+                if type(source) is tuple:
+                    item[name] = convert(*[row[path] for path in source])
+                    continue
+                value = row[source]
+                item[name] = value if value is None or convert is None else convert(value)
+            data.append(item)
+        return data
+
+
+# Compiled per (serializer, field set): output order follows the serializer,
+# so permutations of ?fields= share an entry, and the cache is bounded
+# because clients choose the subsets
+FAST_SERIALIZER_CACHE_SIZE = 256
+
+
+def get_fast_serializer(serializer_class, fields=None):
+    """Compiled FastReadSerializer for a fast_read serializer (None when not applicable)"""
+    meta = getattr(serializer_class, 'Meta', None)
+    if not getattr(meta, 'fast_read', False):
+        return None
+    return _compile_fast_serializer(serializer_class, frozenset(fields) if fields is not None else None)
+
+
+@lru_cache(maxsize=FAST_SERIALIZER_CACHE_SIZE)
+def _compile_fast_serializer(serializer_class, fields):
+    try:
+        return FastReadSerializer(serializer_class, fields)
+    except FastSerializerUnsupported:
+        return None
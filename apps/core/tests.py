@@ -0,0 +1,271 @@
+"""
+Tests for shared API plumbing: renderers, fast serializers, compression
+and cache policy
+"""
+import gzip
+import itertools
+import tempfile
+from decimal import Decimal
+
+import brotli
+import msgpack
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse, HttpResponse
+from django.test import Client, RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.contents.models import Content
+from apps.contents.serializers import ContentDetailSerializer, ContentPublicSerializer
+from apps.contents.tests import create_content
+from apps.offers.models import Offer
+from apps.offers.serializers import OfferBuyerSerializer, OfferProducerSerializer
+from .counters import flush_view_counters
+from .middleware import CompressionMiddleware
+from .renderers import ORJSONRenderer
+from .serializers import FAST_SERIALIZER_CACHE_SIZE, _compile_fast_serializer, get_fast_serializer
+
+
+class ContentRendererTestCase(TestCase):
+    """Test the orjson and MessagePack renderers"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        create_content(self.producer, title='Rendered', price=Decimal('1200.50'))
+
+    def test_orjson_matches_stdlib_json(self):
+        """Envelope bytes match DRF's JSONRenderer, including Decimal, dates and indentation"""
+        response = self.client.get(reverse('contents_api:content_list'))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        data = {
+            'data': response.json()['data'],
+            'price': Decimal('1.50'),
+            'day': timezone.localdate(),
+            'at': timezone.now().replace(microsecond=123456),
+            'naive': timezone.now().replace(tzinfo=None, microsecond=1),
+            'separators': 'line\u2028paragraph\u2029',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        for args in (('application/json; indent=4', None), (None, {'indent': 2})):
+            self.assertEqual(ORJSONRenderer().render(data, *args), JSONRenderer().render(data, *args))
+
+    def test_orjson_differences(self):
+        """Non-finite floats render as null; DRF's strict JSON refuses them"""
+        self.assertEqual(ORJSONRenderer().render({'score': float('nan')}), b'{"score":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({'score': float('nan')})
+
+    def test_msgpack_negotiation(self):
+        """Machine clients get the same envelope as MessagePack"""
+        url = reverse('contents_api:content_list')
+        response = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content), self.client.get(url).json())
+
+
+class FastReadSerializerTestCase(TestCase):
+    """Test the values()-based list serialization against DRF's output"""
+
+    def setUp(self):
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@example.com',
+            password='password123',
+            role=User.Role.BUYER,
+            company_name='Tokyo Films',
+            country='JP'
+        )
+        self.content = create_content(
+            self.producer, title='Fast', price=Decimal('1200.50'), currency='KRW',
+            genre_tags=['drama', 'romance'], release_target=timezone.localdate()
+        )
+        Content.objects.filter(pk=self.content.pk).update(poster='posters/fast.jpg')
+        create_content(self.producer, title='Plain')
+        Offer.objects.create(content=self.content, buyer=self.buyer, offered_price=300, currency='USD')
+
+    def assert_same_output(self, serializer_class, queryset, fields=None):
+        kwargs = {'fields': fields} if fields is not None else {}
+        expected = serializer_class(queryset, many=True, **kwargs).data
+        fast = get_fast_serializer(serializer_class, fields)
+        self.assertIsNotNone(fast)
+        data = fast.serialize(fast.prepare(queryset))
+        self.assertEqual(data, expected)
+        self.assertEqual([list(item) for item in data], [list(item) for item in expected])
+
+    def test_content_rows_match_serializer(self):
+        """Files, decimals, dates and producer columns render identically"""
+        queryset = Content.objects.select_related('producer').order_by('-created_at')
+        self.assert_same_output(ContentPublicSerializer, queryset)
+        self.assert_same_output(ContentPublicSerializer, queryset, fields=['id', 'title', 'poster'])
+
+    def test_offer_rows_match_serializer(self):
+        """Foreign key ids and nested sources render identically"""
+        queryset = Offer.objects.select_related('content__producer', 'buyer').with_effective_status()
+        self.assert_same_output(OfferBuyerSerializer, queryset)
+        self.assert_same_output(OfferProducerSerializer, queryset)
+
+    def test_compiled_once_per_field_set(self):
+        """Reordered ?fields= reuse one compiled serializer; the cache is bounded"""
+        _compile_fast_serializer.cache_clear()
+        first = get_fast_serializer(ContentPublicSerializer, ['id', 'title', 'poster'])
+        for fields in itertools.permutations(['id', 'title', 'poster']):
+            self.assertIs(get_fast_serializer(ContentPublicSerializer, list(fields)), first)
+        self.assertEqual(_compile_fast_serializer.cache_info().currsize, 1)
+        self.assertEqual(_compile_fast_serializer.cache_info().maxsize, FAST_SERIALIZER_CACHE_SIZE)
+
+    def test_unsupported_serializer_falls_back(self):
+        """Serializers without fast_read keep the regular path"""
+        self.assertIsNone(get_fast_serializer(ContentDetailSerializer))
+
+
+class ResponseCompressionTestCase(TestCase):
+    """Test negotiated brotli/gzip compression"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        for i in range(10):
+            create_content(producer, title=f'Compressible {i}', description='A long synopsis. ' * 20)
+
+    def test_negotiated_encodings(self):
+        """brotli is preferred, gzip is the fallback, identity without Accept-Encoding"""
+        url = reverse('contents_api:content_list')
+        plain = self.client.get(url).content
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), plain)
+        self.assertLess(len(response.content) * 5, len(plain))
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), plain)
+
+        response = self.client.get(url)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_brotli_skips_secret_bearing_responses(self):
+        """Responses that may hold a session secret get gzip (with BREACH padding), never brotli"""
+        url = reverse('contents_api:content_list')
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'x' * 32
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+        self.client.cookies.clear()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = 'expired'
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_small_and_file_responses_pass_through(self):
+        """Short bodies and file downloads are sent as they are"""
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='br, gzip')
+        middleware = CompressionMiddleware(lambda request: None)
+
+        small = middleware.process_response(request, HttpResponse(b'x' * 100))
+        self.assertFalse(small.has_header('Content-Encoding'))
+
+        with tempfile.NamedTemporaryFile(suffix='.pdf') as f:
+            f.write(b'%PDF-1.4 ' * 1000)
+            f.flush()
+            download = FileResponse(open(f.name, 'rb'), content_type='application/pdf')
+            response = middleware.process_response(request, download)
+            self.assertFalse(response.has_header('Content-Encoding'))
+            self.assertEqual(response['Content-Length'], '9000')
+            response.close()
+
+
+class PublicCachePolicyTestCase(TestCase):
+    """Test Cache-Control / Vary on public endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(flush_view_counters)  # Views counted during the test
+        self.client = APIClient()
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.content = create_content(self.producer, title='Cached')
+
+    def assertVaries(self, response, *headers):
+        vary = {header.strip().lower() for header in response['Vary'].split(',')}
+        for header in headers:
+            self.assertIn(header.lower(), vary)
+
+    def test_anonymous_api_is_public(self):
+        """Anonymous API responses are shareable and vary on language and credentials"""
+        for url in (reverse('contents_api:content_list'),
+                    reverse('contents_api:content_detail', args=[self.content.pk]),
+                    reverse('booths_api:booth_detail', args=[self.producer.booth_slug])):
+            response = self.client.get(url)
+            self.assertEqual(response['Cache-Control'], 'public, max-age=60, stale-while-revalidate=300')
+            self.assertVaries(response, 'Accept', 'Accept-Language', 'Authorization')
+            self.assertNotIn('cookie', response['Vary'].lower())
+
+    def test_authenticated_api_is_private(self):
+        """Logged-in responses never go to a shared cache"""
+        self.client.force_authenticate(self.producer)
+        response = self.client.get(reverse('contents_api:content_list'))
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+    def test_template_pages(self):
+        """Anonymous pages render no CSRF token, so they stay cacheable"""
+        client = Client(enforce_csrf_checks=True)
+        for url in (reverse('contents:browse'), reverse('booths:detail', args=[self.producer.booth_slug])):
+            response = client.get(url)
+            self.assertIn('public', response['Cache-Control'])
+            self.assertNotIn('cookie', response['Vary'].lower())
+            self.assertFalse(response.cookies)
+
+    def test_language_switch_keeps_csrf(self):
+        """set_language needs the token the navbar fetches from i18n/csrf/"""
+        client = Client(enforce_csrf_checks=True)
+        data = {'language': 'zh-hans', 'next': '/'}
+        self.assertEqual(client.post(reverse('set_language'), data).status_code, 403)
+
+        response = client.get(reverse('csrf_token'))
+        self.assertIn('no-cache', response['Cache-Control'])
+        data['csrfmiddlewaretoken'] = response.json()['csrfToken']
+        self.assertEqual(client.post(reverse('set_language'), data).status_code, 302)
+
+        # The language cookie now picks the page, so it leaves the shared cache
+        response = client.get(reverse('contents:browse'))
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertVaries(response, 'Cookie')
+
+    def test_session_cookie_is_private(self):
+        """Logged-in pages never go to a shared cache"""
+        client = Client()
+        client.force_login(self.producer)
+        response = client.get(reverse('contents:browse'))
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
@@ -35,7 +35,11 @@ class SoftDeleteManager(models.Manager):
 
 def generate_unique_slug(model_class, base_slug, slug_field='slug'):
     """
-    Generate a unique slug by appending a counter if necessary
+    Next free slug for base_slug: the slug itself, else slug-N after the highest suffix taken
+
+    One query however many suffixes exist. The result can still be taken
+    by a concurrent insert before it is saved, so use
+    create_with_unique_slug() for inserts.
 
     Args:
         model_class: Django model class
@@ -45,14 +49,92 @@ def generate_unique_slug(model_class, base_slug, slug_field='slug'):
     Returns:
         Unique slug string
     """
+    import re
+    from django.db.models import BigIntegerField, Count, Max, Q
+    from django.db.models.functions import Cast, Substr
     from django.utils.text import slugify
 
     slug = slugify(base_slug)
-    unique_slug = slug
-    counter = 1
+    exact = Q(**{slug_field: slug})
+    # startswith uses the slug's pattern index, the regex keeps only numeric suffixes
+    suffixed = Q(**{
+        f'{slug_field}__startswith': f'{slug}-',
+        f'{slug_field}__regex': rf'^{re.escape(slug)}-[0-9]{{1,18}}$',
+    })
+    taken = model_class._base_manager.filter(exact | suffixed).aggregate(
+        exact=Count('pk', filter=exact),
+        max_suffix=Max(Cast(Substr(slug_field, len(slug) + 2), BigIntegerField()), filter=suffixed),
+    )
+
+    if not taken['exact']:
+        return slug
+    return f"{slug}-{(taken['max_suffix'] or 0) + 1}"
+
+
+def create_with_unique_slug(model_class, base_slug, create, slug_field='slug', attempts=5):
+    """
+    Insert a row under the next free slug, retrying if a concurrent insert takes it first
+
+    Args:
+        model_class: Django model class
+        base_slug: Base slug string
+        create: Callable taking the slug and inserting the row
+        slug_field: Field name for slug (default: 'slug')
+        attempts: Allocations tried before giving up
 
-    while model_class.objects.filter(**{slug_field: unique_slug}).exists():
-        unique_slug = f"{slug}-{counter}"
-        counter += 1
+    Returns:
+        Whatever create() returns
+
+    Raises:
+        IntegrityError: when the violation isn't the slug's or attempts run out
+    """
+    from django.db import IntegrityError, transaction
 
-    return unique_slug
+    for attempt in range(attempts):
+        slug = generate_unique_slug(model_class, base_slug, slug_field)
+        try:
+            with transaction.atomic():
+                return create(slug)
+        except IntegrityError:
+            lost_race = model_class._base_manager.filter(**{slug_field: slug}).exists()
+            if not lost_race or attempt == attempts - 1:
+                raise
+
+
+def parse_date_range(params, default_days=30, max_days=366):
+    """
+    Read date_from / date_to (YYYY-MM-DD, inclusive) from query params
+
+    Args:
+        params: QueryDict or dict of query parameters
+        default_days: Range length when date_from is missing
+        max_days: Longest range accepted
+
+    Returns:
+        (start, end) dates; end defaults to today
+
+    Raises:
+        ValueError: with a client-facing message for invalid ranges
+    """
+    from datetime import timedelta
+    from django.utils.dateparse import parse_date
+
+    def read(name):
+        value = params.get(name)
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+        return parsed
+
+    end = read('date_to') or timezone.localdate()
+    start = read('date_from') or end - timedelta(days=default_days - 1)
+    if start > end:
+        raise ValueError("date_from must not be after date_to")
+    if (end - start).days + 1 > max_days:
+        raise ValueError(f"Date range must not exceed {max_days} days")
+    return start, end
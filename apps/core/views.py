@@ -1,7 +1,10 @@
 """
 Core template views (non-API)
 """
+from django.http import JsonResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import render
+from django.views.decorators.cache import never_cache
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.utils import timezone
 from datetime import timedelta
@@ -41,7 +44,7 @@ def admin_dashboard_view(request):
         'total_buyers': User.objects.filter(role=User.Role.BUYER).count(),
         'total_contents': Content.objects.exclude(status='deleted').count(),
         'total_offers': Offer.objects.count(),
-        'pending_offers': Offer.objects.filter(status='pending').count(),
+        'pending_offers': Offer.objects.filter_effective_status('pending').count(),
         'total_lois': LOI.objects.count(),
     }
 
@@ -74,6 +77,18 @@ def admin_dashboard_view(request):
     })
 
 
+def home_view(request):
+    """
+    Home page view
+    Shows the hot content rail (precomputed trending scores, one index scan)
+    """
+    hot_contents = Content.objects.filter(
+        status='public', trending_score__gt=0
+    ).select_related('producer').order_by('-trending_score', '-id')[:8]
+
+    return render(request, 'home.html', {'hot_contents': hot_contents})
+
+
 def tutorial_view(request):
     """
     Tutorial page view
@@ -88,3 +103,12 @@ def company_intro_view(request):
     Shows information about B.able Company
     """
     return render(request, 'company_intro.html')
+
+
+@never_cache
+def csrf_token_view(request):
+    """
+    CSRF token for forms on publicly cached pages
+    The navbar language switcher fetches it right before posting
+    """
+    return JsonResponse({'csrfToken': get_token(request)})
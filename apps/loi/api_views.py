@@ -8,6 +8,7 @@ from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 from apps.core.response import success_response, error_response, paginated_response
 from apps.core.permissions import IsRelatedParty
+from apps.core.conditional import is_conditional, latest, make_etag, not_modified, set_validators
 from .models import LOI
 from .serializers import LOISerializer
 
@@ -48,6 +49,16 @@ class LOIDetailView(APIView):
     )
     def get(self, request, pk):
         """Get LOI detail"""
+        if is_conditional(request):
+            version = LOI.objects.filter(pk=pk).values_list(
+                'buyer_id', 'producer_id', 'updated_at', 'pdf_generated_at'
+            ).first()
+            # Only related parties get a 304; others fall through to the 403 below
+            if version is not None and request.user.pk in version[:2]:
+                response = not_modified(request, *loi_validators(request, pk, *version[2:]))
+                if response is not None:
+                    return response
+
         try:
             loi = LOI.objects.select_related('buyer', 'producer', 'offer').get(pk=pk)
         except LOI.DoesNotExist:
@@ -60,10 +71,19 @@ class LOIDetailView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
 
-        return success_response(
+        response = success_response(
             data=LOISerializer(loi).data,
             message="LOI retrieved successfully"
         )
+        return set_validators(response, *loi_validators(request, loi.pk, loi.updated_at, loi.pdf_generated_at))
+
+
+def loi_validators(request, pk, updated_at, pdf_generated_at):
+    """(ETag, Last-Modified) of an LOI payload; PDF generation does not touch updated_at"""
+    return (
+        make_etag(request, 'loi', pk, updated_at, pdf_generated_at),
+        latest(updated_at, pdf_generated_at),
+    )
 
 
 @extend_schema(tags=['LOI'])
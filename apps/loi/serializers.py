@@ -11,6 +11,9 @@ class LOISerializer(serializers.ModelSerializer):
     offer_id = serializers.IntegerField(source='offer.id', read_only=True)
     is_pdf_ready = serializers.BooleanField(read_only=True)
 
+    # Fast list path (Meta.fast_read): is_pdf_ready from the pdf_file column
+    fast_getters = {'is_pdf_ready': (('pdf_file',), lambda pdf_file: bool(pdf_file))}
+
     class Meta:
         model = LOI
         fields = (
@@ -23,3 +26,4 @@ class LOISerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         )
         read_only_fields = fields
+        fast_read = True
@@ -1,10 +1,14 @@
 """
 Email notification utilities
 """
-from django.core.mail import send_mail
+import logging
+
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
 from django.template.loader import render_to_string
 
+logger = logging.getLogger(__name__)
+
 
 def send_new_offer_notification(offer):
     """
@@ -184,6 +188,50 @@ ShortDeal Team
     )
 
 
+def send_offer_expired_notifications(offer_ids):
+    """
+    NTF-005: Send email to buyers whose offers expired (apps.offers.expiry)
+
+    Reads the offers in one query and sends the emails over one
+    connection. A failed email is logged and the rest are still sent,
+    since the offers are already expired. Returns the number sent.
+    """
+    from apps.offers.models import Offer
+
+    offers = Offer.objects.filter(pk__in=offer_ids).values_list(
+        'buyer__email', 'buyer__company_name', 'buyer__username',
+        'content__title', 'content__producer__company_name', 'content__producer__username',
+        'currency', 'offered_price',
+    )
+
+    sent = 0
+    with get_connection() as connection:
+        for email, company_name, username, content_title, producer_company, producer_username, currency, price in offers:
+            if not email:
+                continue
+            message = f"""
+Hello {company_name or username},
+
+Your offer for '{content_title}' to {producer_company or producer_username} has expired without a response.
+
+Offered Price: {currency} {price:,.2f}
+
+You may submit a new offer if you are still interested in this content.
+
+Best regards,
+ShortDeal Team
+"""
+            subject = f"Your Offer for '{content_title}' Has Expired"
+            try:
+                sent += EmailMessage(
+                    subject, message, settings.DEFAULT_FROM_EMAIL, [email], connection=connection
+                ).send()
+            except Exception:
+                logger.exception(f"Failed to send offer expiry email to {email}")
+                connection.close()  # The next send reconnects if the failure broke the session
+    return sent
+
+
 def send_password_reset_email(user, reset_url):
     """
     Send password reset email with token link
@@ -3,9 +3,10 @@ API views for Offer management
 """
 from rest_framework import status
 from rest_framework.views import APIView
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
 from apps.core.response import success_response, error_response, paginated_response
+from apps.core.serializers import apply_sparse_fieldset
 from apps.core.permissions import IsBuyer, IsOnboarded
 from apps.core.constants import OFFER_STATUS_PENDING
 from .models import Offer
@@ -17,23 +18,37 @@ class BuyerOfferListCreateView(APIView):
     """Buyer's offer list and create"""
     permission_classes = [IsBuyer, IsOnboarded]
 
-    @extend_schema(responses={200: OfferBuyerSerializer(many=True)})
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('status', str, description='Effective status: pending, accepted, rejected or expired (includes pending offers past expires_at)'),
+            OpenApiParameter('fields', str, description='Comma-separated response fields to return (id is always included)'),
+            OpenApiParameter('pagination', str, description='page (default), cursor or estimated'),
+        ],
+        responses={200: OfferBuyerSerializer(many=True)}
+    )
     def get(self, request):
         """List all offers from current buyer"""
         queryset = Offer.objects.filter(buyer=request.user).select_related(
             'content', 'content__producer'
         ).order_by('-created_at')
 
-        # Status filter
+        # Status filter on the effective status (pending offers past expires_at count as expired)
+        queryset = queryset.with_effective_status()
         status_filter = request.query_params.get('status')
         if status_filter:
-            queryset = queryset.filter(status=status_filter)
+            queryset = queryset.filter(effective_status=status_filter)
+
+        try:
+            queryset, fields = apply_sparse_fieldset(queryset, OfferBuyerSerializer, request)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
         return paginated_response(
             queryset,
             OfferBuyerSerializer,
             request,
-            message="Offers retrieved successfully"
+            message="Offers retrieved successfully",
+            serializer_kwargs={'fields': fields}
         )
 
     @extend_schema(
@@ -83,23 +98,37 @@ class ProducerOfferListView(APIView):
     """Producer's offer list"""
     permission_classes = [IsOnboarded]
 
-    @extend_schema(responses={200: OfferProducerSerializer(many=True)})
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('status', str, description='Effective status: pending, accepted, rejected or expired (includes pending offers past expires_at)'),
+            OpenApiParameter('fields', str, description='Comma-separated response fields to return (id is always included)'),
+            OpenApiParameter('pagination', str, description='page (default), cursor or estimated'),
+        ],
+        responses={200: OfferProducerSerializer(many=True)}
+    )
     def get(self, request):
         """List all offers for producer's contents"""
         queryset = Offer.objects.filter(
             content__producer=request.user
         ).select_related('buyer', 'content').order_by('-created_at')
 
-        # Status filter
+        # Status filter on the effective status (pending offers past expires_at count as expired)
+        queryset = queryset.with_effective_status()
         status_filter = request.query_params.get('status')
         if status_filter:
-            queryset = queryset.filter(status=status_filter)
+            queryset = queryset.filter(effective_status=status_filter)
+
+        try:
+            queryset, fields = apply_sparse_fieldset(queryset, OfferProducerSerializer, request)
+        except ValueError as e:
+            return error_response(message=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
         return paginated_response(
             queryset,
             OfferProducerSerializer,
             request,
-            message="Offers retrieved successfully"
+            message="Offers retrieved successfully",
+            serializer_kwargs={'fields': fields}
         )
 
 
@@ -0,0 +1,71 @@
+"""
+Bulk expiry of pending offers past their expires_at
+
+expire_offers() is run periodically (management command). Each batch is
+one UPDATE ... RETURNING over the (status, expires_at) index; rows locked
+by a concurrent accept/reject are skipped and picked up by the next run.
+No model instances are saved, so no post_save receivers fire: expiry
+creates no LOI, and the buyers' notifications are sent per batch with
+send_offer_expired_notifications().
+"""
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.constants import OFFER_STATUS_EXPIRED, OFFER_STATUS_PENDING
+from .models import Offer
+
+logger = logging.getLogger(__name__)
+
+
+def expire_offers(now=None, batch_size=None, notify=True):
+    """
+    Expire every pending offer whose expires_at has passed
+
+    Args:
+        now: Cut-off time (default: now)
+        batch_size: Offers per UPDATE (default: OFFER_EXPIRY_BATCH_SIZE)
+        notify: Email the buyers of expired offers
+
+    Returns:
+        List of expired offer ids
+    """
+    from apps.notifications.emails import send_offer_expired_notifications
+
+    now = now or timezone.now()
+    batch_size = batch_size or settings.OFFER_EXPIRY_BATCH_SIZE
+    expired = []
+    while True:
+        with transaction.atomic():
+            ids = _expire_batch(now, batch_size)
+        expired.extend(ids)
+        if ids and notify:
+            try:
+                send_offer_expired_notifications(ids)
+            except Exception:
+                # The offers stay expired; only the emails are lost
+                logger.exception('Failed to send expiry notifications for %d offers', len(ids))
+        if len(ids) < batch_size:
+            return expired
+
+
+def _expire_batch(now, batch_size):
+    table = connection.ops.quote_name(Offer._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} SET status = %s, updated_at = %s
+            WHERE id IN (
+                SELECT id FROM {table}
+                WHERE status = %s AND expires_at < %s
+                ORDER BY expires_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            ) AND status = %s
+            RETURNING id
+            """,
+            [OFFER_STATUS_EXPIRED, now, OFFER_STATUS_PENDING, now, batch_size, OFFER_STATUS_PENDING]
+        )
+        return [row[0] for row in cursor.fetchall()]
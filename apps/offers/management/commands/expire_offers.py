@@ -0,0 +1,19 @@
+"""
+Expire pending offers past their validity (run periodically, e.g. every 10 minutes)
+"""
+from django.core.management.base import BaseCommand
+
+from apps.offers.expiry import expire_offers
+
+
+class Command(BaseCommand):
+    help = 'Expire due pending offers in batched UPDATEs and notify their buyers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Offers per UPDATE (default: OFFER_EXPIRY_BATCH_SIZE)')
+        parser.add_argument('--no-notify', action='store_true', help='Do not email the buyers')
+
+    def handle(self, *args, **options):
+        expired = expire_offers(batch_size=options['batch_size'], notify=not options['no_notify'])
+
+        self.stdout.write(self.style.SUCCESS(f'Expired {len(expired)} offers'))
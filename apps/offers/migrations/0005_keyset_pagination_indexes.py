@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-17 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0004_restore_unique_pending_offer_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['buyer', '-created_at', '-id'], name='offers_offe_buyer_i_fcb5a8_idx'),
+        ),
+    ]
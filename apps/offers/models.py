@@ -16,6 +16,55 @@ from apps.core.constants import (
 )
 
 
+def effective_offer_status(status, expires_at, now=None):
+    """Status as buyers and producers see it: a pending offer past expires_at reads as expired"""
+    if status == OFFER_STATUS_PENDING and expires_at < (now or timezone.now()):
+        return OFFER_STATUS_EXPIRED
+    return status
+
+
+class OfferQuerySet(models.QuerySet):
+    """
+    Effective status at read time
+
+    The expire_offers sweep stores the expiry later; until then these
+    express it in SQL. Lists annotate with with_effective_status() and
+    filter on that annotation, so the rows shown and the status filter
+    agree on one instant. Counts and existence checks, which don't read
+    the status, use filter_effective_status(): plain status/expires_at
+    predicates served by the (status, expires_at) index.
+    """
+
+    def with_effective_status(self, now=None):
+        now = now or timezone.now()
+        return self.annotate(effective_status=models.Case(
+            models.When(
+                status=OFFER_STATUS_PENDING, expires_at__lt=now,
+                then=models.Value(OFFER_STATUS_EXPIRED)
+            ),
+            default=models.F('status'),
+            output_field=models.CharField(),
+        ))
+
+    def filter_effective_status(self, status, now=None):
+        now = now or timezone.now()
+        if status == OFFER_STATUS_PENDING:
+            return self.filter(status=OFFER_STATUS_PENDING, expires_at__gte=now)
+        if status == OFFER_STATUS_EXPIRED:
+            return self.filter(
+                models.Q(status=OFFER_STATUS_EXPIRED)
+                | models.Q(status=OFFER_STATUS_PENDING, expires_at__lt=now)
+            )
+        return self.filter(status=status)
+
+    def expire_due(self, now=None):
+        """Store the expiry of due pending offers in this queryset now (e.g. before a new offer for the pair)"""
+        now = now or timezone.now()
+        return self.filter(status=OFFER_STATUS_PENDING, expires_at__lt=now).update(
+            status=OFFER_STATUS_EXPIRED, updated_at=now
+        )
+
+
 class Offer(models.Model):
     """Offer from buyer to producer for content purchase"""
 
@@ -92,12 +141,15 @@ class Offer(models.Model):
         verbose_name='Updated at'
     )
 
+    objects = OfferQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Offer'
         verbose_name_plural = 'Offers'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['buyer', 'status']),
+            models.Index(fields=['buyer', '-created_at', '-id']),
             models.Index(fields=['content', 'status']),
             models.Index(fields=['status', 'expires_at']),
         ]
@@ -128,6 +180,17 @@ class Offer(models.Model):
         """Check if offer has expired"""
         return timezone.now() > self.expires_at
 
+    @property
+    def effective_status(self):
+        """Status with pending-but-due read as expired (annotated by with_effective_status())"""
+        if 'effective_status' in self.__dict__:
+            return self.__dict__['effective_status']
+        return effective_offer_status(self.status, self.expires_at)
+
+    @effective_status.setter
+    def effective_status(self, value):
+        self.__dict__['effective_status'] = value
+
     def save(self, *args, **kwargs):
         """Auto-calculate expires_at on creation"""
         if not self.pk and not self.expires_at:
@@ -172,7 +235,7 @@ class Offer(models.Model):
             pass  # Don't fail offer rejection if email fails
 
     def mark_as_expired(self):
-        """Mark offer as expired (called by scheduled task)"""
+        """Mark this offer as expired (the scheduled sweep is apps.offers.expiry.expire_offers)"""
         if self.status == OFFER_STATUS_PENDING and self.is_expired:
             self.status = OFFER_STATUS_EXPIRED
             self.save(update_fields=['status', 'updated_at'])
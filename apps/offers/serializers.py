@@ -4,23 +4,30 @@ Serializers for Offer model
 from rest_framework import serializers
 from .models import Offer
 from apps.contents.serializers import ContentPublicSerializer
+from apps.core.serializers import SparseFieldsetMixin
 
 
-class OfferBuyerSerializer(serializers.ModelSerializer):
+class OfferBuyerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for buyer's offer operations"""
 
     content_title = serializers.CharField(source='content.title', read_only=True)
     producer_name = serializers.CharField(source='content.producer.company_name', read_only=True)
+    effective_status = serializers.CharField(read_only=True)
+
+    # Fast list path (Meta.fast_read): the list views annotate effective_status
+    # (with_effective_status()), so rows read the column the status filter used
+    fast_getters = {'effective_status': (('effective_status',), str)}
 
     class Meta:
         model = Offer
         fields = (
             'id', 'content', 'content_title', 'producer_name',
             'offered_price', 'currency', 'message', 'validity_days',
-            'status', 'expires_at', 'responded_at', 'producer_response',
+            'status', 'effective_status', 'expires_at', 'responded_at', 'producer_response',
             'created_at', 'updated_at'
         )
-        read_only_fields = ('id', 'status', 'expires_at', 'responded_at', 'producer_response', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'status', 'effective_status', 'expires_at', 'responded_at', 'producer_response', 'created_at', 'updated_at')
+        fast_read = True  # List pages render from values() rows
 
     def validate_offered_price(self, value):
         """Validate price is positive"""
@@ -36,19 +43,27 @@ class OfferBuyerSerializer(serializers.ModelSerializer):
 
         # Check duplicate pending offer
         buyer = self.context['request'].user
-        if Offer.objects.filter(content=content, buyer=buyer, status='pending').exists():
+        if Offer.objects.filter(content=content, buyer=buyer).filter_effective_status('pending').exists():
             raise serializers.ValidationError("You already have a pending offer for this content.")
 
         return attrs
 
+    def create(self, validated_data):
+        """Create the offer, first storing the expiry of a lapsed pending one for the same content"""
+        Offer.objects.filter(content=validated_data['content'], buyer=validated_data['buyer']).expire_due()
+        return super().create(validated_data)
+
 
-class OfferProducerSerializer(serializers.ModelSerializer):
+class OfferProducerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for producer's offer view"""
 
     buyer_name = serializers.CharField(source='buyer.company_name', read_only=True)
     buyer_username = serializers.CharField(source='buyer.username', read_only=True)
     buyer_country = serializers.CharField(source='buyer.country', read_only=True)
     content_title = serializers.CharField(source='content.title', read_only=True)
+    effective_status = serializers.CharField(read_only=True)
+
+    fast_getters = OfferBuyerSerializer.fast_getters
 
     class Meta:
         model = Offer
@@ -56,10 +71,11 @@ class OfferProducerSerializer(serializers.ModelSerializer):
             'id', 'content', 'content_title',
             'buyer', 'buyer_name', 'buyer_username', 'buyer_country',
             'offered_price', 'currency', 'message', 'validity_days',
-            'status', 'expires_at', 'responded_at', 'producer_response',
+            'status', 'effective_status', 'expires_at', 'responded_at', 'producer_response',
             'created_at', 'updated_at'
         )
         read_only_fields = fields
+        fast_read = True
 
 
 class OfferResponseSerializer(serializers.Serializer):
@@ -0,0 +1,162 @@
+"""
+Tests for offer expiry and offer listings
+"""
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.core.paginator import Paginator
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.contents.tests import create_content
+from apps.core.pagination import EstimatedPaginator
+from apps.core.serializers import get_fast_serializer
+from apps.loi.models import LOI
+from .expiry import expire_offers
+from .models import Offer
+from .serializers import OfferBuyerSerializer
+
+
+class OfferExpiryTestCase(TestCase):
+    """Test the batched offer expiry sweep"""
+
+    def setUp(self):
+        self.producer = User.objects.create_user(
+            username='producer',
+            email='producer@example.com',
+            password='password123',
+            role=User.Role.CREATOR,
+            company_name='Seoul Pictures'
+        )
+        self.buyer = User.objects.create_user(
+            username='buyer',
+            email='buyer@example.com',
+            password='password123',
+            role=User.Role.BUYER,
+            company_name='Tokyo Films'
+        )
+        self.offers = [
+            Offer.objects.create(
+                content=create_content(self.producer, title=f'Content {i}'),
+                buyer=self.buyer, offered_price=100 + i, currency='USD'
+            )
+            for i in range(4)
+        ]
+        Offer.objects.filter(pk__in=[offer.pk for offer in self.offers[:3]]).update(
+            expires_at=timezone.now() - timedelta(hours=1)
+        )
+        mail.outbox = []
+
+    def test_expires_due_offers_in_batches(self):
+        """Due pending offers expire in batches; others are untouched"""
+        Offer.objects.filter(pk=self.offers[2].pk).update(status='rejected')
+        out = StringIO()
+        call_command('expire_offers', '--batch-size', '1', stdout=out)
+
+        self.assertIn('Expired 2 offers', out.getvalue())
+        statuses = dict(Offer.objects.values_list('pk', 'status'))
+        self.assertEqual(
+            [statuses[offer.pk] for offer in self.offers],
+            ['expired', 'expired', 'rejected', 'pending']
+        )
+        self.assertFalse(LOI.objects.exists())
+
+    def test_returns_ids_and_notifies_buyers(self):
+        """One email per expired offer, sent from the returned ids"""
+        expired = expire_offers()
+
+        self.assertEqual(sorted(expired), sorted(offer.pk for offer in self.offers[:3]))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].to, ['buyer@example.com'])
+        self.assertIn('Has Expired', mail.outbox[0].subject)
+        self.assertEqual(expire_offers(), [])
+
+    def test_failed_email_does_not_stop_the_rest(self):
+        """An SMTP error on one buyer's email is logged; the others are still sent"""
+        send_messages = locmem.EmailBackend.send_messages
+        calls = []
+
+        def flaky_send(backend, messages):
+            calls.append(messages)
+            if len(calls) == 1:
+                raise SMTPException('Mailbox unavailable')
+            return send_messages(backend, messages)
+
+        with mock.patch.object(locmem.EmailBackend, 'send_messages', flaky_send), \
+                self.assertLogs('apps.notifications.emails', 'ERROR'):
+            expired = expire_offers()
+        self.assertEqual(len(expired), 3)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_effective_status_before_the_sweep(self):
+        """Lists read due pending offers as expired without waiting for expire_offers"""
+        self.buyer.is_onboarded = True
+        self.buyer.save(update_fields=['is_onboarded'])
+        client = APIClient()
+        client.force_authenticate(self.buyer)
+        url = reverse('offers_api:buyer_offer_list_create')
+
+        pending = client.get(url, {'status': 'pending'}).json()['data']
+        self.assertEqual([item['id'] for item in pending], [self.offers[3].pk])
+        expired = client.get(url, {'status': 'expired', 'fields': 'status,effective_status'}).json()['data']
+        self.assertEqual(len(expired), 3)
+        self.assertEqual({(item['status'], item['effective_status']) for item in expired}, {('pending', 'expired')})
+
+        # A lapsed pending offer doesn't block a new one for the same content
+        response = client.post(url, {
+            'content': self.offers[0].content_id, 'offered_price': '150.00', 'currency': 'USD'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['data']['effective_status'], 'pending')
+        self.offers[0].refresh_from_db()
+        self.assertEqual(self.offers[0].status, 'expired')
+
+    def test_list_rows_read_the_annotated_status(self):
+        """List rows show the effective status of the instant the list was filtered at"""
+        earlier = timezone.now() - timedelta(hours=2)  # Before offers[0] lapsed
+        queryset = Offer.objects.filter(pk=self.offers[0].pk).select_related(
+            'content__producer'
+        ).with_effective_status(earlier).filter(effective_status='pending')
+        fast = get_fast_serializer(OfferBuyerSerializer)
+        self.assertEqual([row['effective_status'] for row in fast.serialize(fast.prepare(queryset))], ['pending'])
+        self.assertEqual([item['effective_status'] for item in OfferBuyerSerializer(queryset, many=True).data], ['pending'])
+
+    def test_offer_lists_default_to_page_mode(self):
+        """Offer lists keep exact page-number pagination; estimated counts are opt-in"""
+        for user in (self.buyer, self.producer):
+            user.is_onboarded = True
+            user.save(update_fields=['is_onboarded'])
+        client = APIClient()
+        for user, url in ((self.buyer, reverse('offers_api:buyer_offer_list_create')),
+                          (self.producer, reverse('offers_api:producer_offer_list'))):
+            client.force_authenticate(user)
+            pagination = client.get(url).json()['pagination']
+            self.assertEqual(pagination['count'], 4)
+            self.assertNotIn('count_estimated', pagination)
+            pagination = client.get(url, {'pagination': 'estimated'}).json()['pagination']
+            self.assertEqual(pagination['mode'], 'estimated')
+
+    def test_offer_pages_default_to_exact_counts(self):
+        """The offer list pages use Django's Paginator unless estimated counts are asked for"""
+        self.buyer.is_onboarded = True
+        self.buyer.save(update_fields=['is_onboarded'])
+        self.client.force_login(self.buyer)
+        url = reverse('offers:buyer_list')
+        response = self.client.get(url, {'page': 999999})
+        self.assertIsInstance(response.context['page_obj'].paginator, Paginator)
+        self.assertEqual(response.context['page_obj'].number, 1)
+        self.assertEqual(response.context['total_count'], 4)
+        self.assertFalse(response.context['count_estimated'])
+
+        response = self.client.get(url, {'pagination': 'estimated'})
+        self.assertIsInstance(response.context['page_obj'].paginator, EstimatedPaginator)
+        self.assertContains(response, '4 total')
@@ -8,6 +8,7 @@ from django.core.paginator import Paginator
 from django.db import IntegrityError
 from .models import Offer
 from apps.contents.models import Content
+from apps.core.pagination import PAGINATION_MODE_ESTIMATED, PAGINATION_MODE_PARAM, EstimatedPaginator
 from apps.core.constants import CONTENT_STATUS_PUBLIC, OFFER_STATUS_PENDING
 
 
@@ -40,9 +41,8 @@ def offer_create_view(request, content_id):
     # Check for existing pending offer from this buyer (OFR-006)
     existing_offer = Offer.objects.filter(
         content=content,
-        buyer=request.user,
-        status=OFFER_STATUS_PENDING
-    ).first()
+        buyer=request.user
+    ).filter_effective_status(OFFER_STATUS_PENDING).first()
 
     if request.method == 'POST':
         if has_accepted_offer:
@@ -89,8 +89,9 @@ def offer_create_view(request, content_id):
             for error in errors:
                 messages.error(request, error)
         else:
-            # Create offer
+            # Create offer (storing the expiry of a lapsed pending one first)
             try:
+                Offer.objects.filter(content=content, buyer=request.user).expire_due()
                 offer = Offer.objects.create(
                     content=content,
                     buyer=request.user,
@@ -146,13 +147,15 @@ def buyer_offer_list_view(request):
         'content', 'content__producer'
     ).order_by('-created_at')
 
-    # Status filter
+    # Status filter on the effective status (pending offers past expires_at count as expired)
+    offers = offers.with_effective_status()
     status_filter = request.GET.get('status')
     if status_filter:
-        offers = offers.filter(status=status_filter)
+        offers = offers.filter(effective_status=status_filter)
 
-    # Pagination
-    paginator = Paginator(offers, 20)
+    # Pagination (exact by default; ?pagination=estimated skips COUNT(*) on large lists)
+    estimated = request.GET.get(PAGINATION_MODE_PARAM) == PAGINATION_MODE_ESTIMATED
+    paginator = (EstimatedPaginator if estimated else Paginator)(offers, 20)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -160,6 +163,8 @@ def buyer_offer_list_view(request):
         'page_obj': page_obj,
         'status_filter': status_filter,
         'total_count': paginator.count,
+        'count_estimated': estimated and paginator.count_estimated,
+        'pagination_mode': PAGINATION_MODE_ESTIMATED if estimated else '',
     }
 
     return render(request, 'offers/buyer_list.html', context)
@@ -214,13 +219,15 @@ def producer_offer_list_view(request):
         content__in=producer_contents
     ).select_related('content', 'buyer').order_by('-created_at')
 
-    # Status filter
+    # Status filter on the effective status (pending offers past expires_at count as expired)
+    offers = offers.with_effective_status()
     status_filter = request.GET.get('status')
     if status_filter:
-        offers = offers.filter(status=status_filter)
+        offers = offers.filter(effective_status=status_filter)
 
-    # Pagination
-    paginator = Paginator(offers, 20)
+    # Pagination (exact by default; ?pagination=estimated skips COUNT(*) on large lists)
+    estimated = request.GET.get(PAGINATION_MODE_PARAM) == PAGINATION_MODE_ESTIMATED
+    paginator = (EstimatedPaginator if estimated else Paginator)(offers, 20)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -228,7 +235,7 @@ def producer_offer_list_view(request):
     from apps.core.constants import OFFER_STATUS_PENDING
     summary = {
         'total': Offer.objects.filter(content__in=producer_contents).count(),
-        'pending': Offer.objects.filter(content__in=producer_contents, status=OFFER_STATUS_PENDING).count(),
+        'pending': Offer.objects.filter(content__in=producer_contents).filter_effective_status(OFFER_STATUS_PENDING).count(),
     }
 
     context = {
@@ -236,6 +243,8 @@ def producer_offer_list_view(request):
         'status_filter': status_filter,
         'summary': summary,
         'total_count': paginator.count,
+        'count_estimated': estimated and paginator.count_estimated,
+        'pagination_mode': PAGINATION_MODE_ESTIMATED if estimated else '',
     }
 
     return render(request, 'offers/producer_list.html', context)
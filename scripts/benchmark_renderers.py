@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of API renderers on a ContentPublicSerializer page
+
+Renders the paginated response envelope of a 20-row content page with
+DRF's stdlib JSONRenderer, ORJSONRenderer and MessagePackRenderer.
+No database is needed: rows are unsaved model instances.
+
+Usage: python scripts/benchmark_renderers.py [--rows 20] [--repeat 2000]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'shortdeal.settings.local')
+
+import django  # noqa: E402
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.accounts.models import User  # noqa: E402
+from apps.contents.models import Content  # noqa: E402
+from apps.contents.serializers import ContentPublicSerializer  # noqa: E402
+from apps.core.renderers import MessagePackRenderer, ORJSONRenderer  # noqa: E402
+
+
+def build_page(rows):
+    producer = User(id=1, username='producer', company_name='Seoul Pictures', booth_slug='seoul-pictures')
+    contents = [
+        Content(
+            id=i,
+            producer=producer,
+            title=f'Content {i}',
+            description='A short-form drama about a startup in Seoul. ' * 4,
+            poster=f'posters/content-{i}.jpg',
+            rating='all',
+            genre_tags=['drama', 'romance'],
+            price=Decimal('1200.00'),
+            currency='USD',
+            price_usd_normalized=Decimal('1200.00'),
+            duration_seconds=90,
+            release_target='global',
+            view_count=1000 + i,
+            created_at=datetime(2026, 1, 1, 12, 0, i % 60, 123456, tzinfo=timezone.utc),
+        )
+        for i in range(rows)
+    ]
+    return {
+        'success': True,
+        'data': ContentPublicSerializer(contents, many=True).data,
+        'message': 'Contents retrieved successfully',
+        'pagination': {
+            'count': 1000, 'next': 'http://testserver/api/v1/contents/?page=2', 'previous': None,
+            'page_size': rows, 'current_page': 1, 'total_pages': 50,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    page = build_page(args.rows)
+    renderers = [
+        ('DRF JSONRenderer', JSONRenderer()),
+        ('ORJSONRenderer', ORJSONRenderer()),
+        ('MessagePackRenderer', MessagePackRenderer()),
+    ]
+
+    print(f'{args.rows}-row ContentPublicSerializer page, {args.repeat} renders each')
+    baseline = None
+    for name, renderer in renderers:
+        size = len(renderer.render(page, renderer.media_type))
+        seconds = min(timeit.repeat(lambda: renderer.render(page, renderer.media_type), number=args.repeat, repeat=5))
+        per_render = seconds / args.repeat * 1e6
+        baseline = baseline or per_render
+        print(f'{name:<22} {per_render:8.1f} us/render  {baseline / per_render:5.1f}x  {size:6d} bytes')
+
+
+if __name__ == '__main__':
+    main()
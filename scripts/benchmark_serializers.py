@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of the fast read path on a ContentPublicSerializer page
+
+Serializes a 20-row content page with ContentPublicSerializer (model
+instances) and with its compiled FastReadSerializer (the values() rows
+the same query returns). No database is needed: rows are built in memory,
+so model instantiation, which the fast path also skips, is not counted.
+
+Usage: python scripts/benchmark_serializers.py [--rows 20] [--repeat 2000]
+"""
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'shortdeal.settings.local')
+
+import django  # noqa: E402
+
+django.setup()
+
+from apps.accounts.models import User  # noqa: E402
+from apps.contents.models import Content  # noqa: E402
+from apps.contents.serializers import ContentPublicSerializer  # noqa: E402
+from apps.core.serializers import get_fast_serializer  # noqa: E402
+
+
+def build_contents(rows):
+    producer = User(id=1, username='producer', company_name='Seoul Pictures', booth_slug='seoul-pictures')
+    return [
+        Content(
+            id=i,
+            producer=producer,
+            title=f'Content {i}',
+            description='A short-form drama about a startup in Seoul. ' * 4,
+            poster=f'posters/content-{i}.jpg',
+            rating='all',
+            genre_tags=['drama', 'romance'],
+            price=Decimal('1200.00'),
+            currency='USD',
+            price_usd_normalized=Decimal('1200.00'),
+            duration_seconds=90,
+            release_target=datetime(2026, 6, 1).date(),
+            view_count=1000 + i,
+            created_at=datetime(2026, 1, 1, 12, 0, i % 60, 123456, tzinfo=timezone.utc),
+        )
+        for i in range(rows)
+    ]
+
+
+def to_values_row(content, paths):
+    """The dict values() would return for this instance"""
+    row = {}
+    for path in paths:
+        value = content
+        for attr in path.split('__'):
+            value = getattr(value, attr)
+        row[path] = value.name if hasattr(value, 'storage') else value
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    contents = build_contents(args.rows)
+    fast = get_fast_serializer(ContentPublicSerializer)
+    rows = [to_values_row(content, fast.paths) for content in contents]
+    assert fast.serialize(rows) == ContentPublicSerializer(contents, many=True).data
+
+    paths = [
+        ('ContentPublicSerializer', lambda: ContentPublicSerializer(contents, many=True).data),
+        ('FastReadSerializer', lambda: fast.serialize(rows)),
+    ]
+
+    print(f'{args.rows}-row ContentPublicSerializer page, {args.repeat} serializations each')
+    baseline = None
+    for name, serialize in paths:
+        seconds = min(timeit.repeat(serialize, number=args.repeat, repeat=5))
+        per_page = seconds / args.repeat * 1e6
+        baseline = baseline or per_page
+        print(f'{name:<24} {per_page:8.1f} us/page  {per_page / args.rows:6.2f} us/row  {baseline / per_page:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
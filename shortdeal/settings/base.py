@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third party
     'rest_framework',
@@ -43,7 +44,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'apps.core.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'apps.core.cache_policy.PublicCacheMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -128,6 +131,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.ORJSONRenderer',
+        'apps.core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'EXCEPTION_HANDLER': 'apps.core.exceptions.custom_exception_handler',
@@ -157,6 +165,72 @@ CORS_ALLOWED_ORIGINS = [
 ]
 CORS_ALLOW_CREDENTIALS = True
 
+# Cache
+# Use a shared Redis cache in deployments with several workers so that
+# listing invalidation reaches every process; per-process memory otherwise.
+# Listing and facet results are only cached in the shared cache: catalog
+# generation bumps from other workers and cron jobs never reach a
+# per-process one (see apps.contents.result_cache)
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+    CONTENT_RESULT_CACHE_ENABLED = True
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    CONTENT_RESULT_CACHE_ENABLED = False
+
+# Public caching: anonymous responses of public pages may be stored by a
+# shared cache for PUBLIC_CACHE_MAX_AGE seconds, then served stale while
+# revalidating for PUBLIC_CACHE_STALE_WHILE_REVALIDATE more
+PUBLIC_CACHE_MAX_AGE = int(os.getenv('PUBLIC_CACHE_MAX_AGE', '60'))
+PUBLIC_CACHE_STALE_WHILE_REVALIDATE = int(os.getenv('PUBLIC_CACHE_STALE_WHILE_REVALIDATE', '300'))
+
+# Response compression (brotli when installed, else gzip) for dynamic
+# responses of at least COMPRESSION_MIN_SIZE bytes
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '5'))
+
+# Estimated pagination in template views (?pagination=estimated) counts
+# exactly when the planner expects fewer rows than this
+PAGINATION_EXACT_COUNT_THRESHOLD = int(os.getenv('PAGINATION_EXACT_COUNT_THRESHOLD', '1000'))
+
+# View counters: a background thread writes buffered page views in one
+# batched UPDATE every VIEW_COUNTER_FLUSH_INTERVAL seconds (0 writes every
+# view in the request)
+VIEW_COUNTER_FLUSH_INTERVAL = float(os.getenv('VIEW_COUNTER_FLUSH_INTERVAL', '5'))
+VIEW_COUNTER_MAX_PENDING = int(os.getenv('VIEW_COUNTER_MAX_PENDING', '1000'))
+
+# Content search
+# Minimum pg_trgm word similarity for fuzzy search and "did you mean" suggestions
+CONTENT_SEARCH_SIMILARITY_THRESHOLD = float(os.getenv('CONTENT_SEARCH_SIMILARITY_THRESHOLD', '0.4'))
+# Seconds browse facet counts are cached per filter set
+CONTENT_FACETS_CACHE_TIMEOUT = int(os.getenv('CONTENT_FACETS_CACHE_TIMEOUT', '300'))
+# Seconds public listing pages are cached (invalidated early on catalog writes)
+CONTENT_RESULT_CACHE_TIMEOUT = int(os.getenv('CONTENT_RESULT_CACHE_TIMEOUT', '60'))
+# Typeahead: serve from an in-process prefix index (falls back to the database
+# when disabled or when the catalog exceeds the entry limit)
+CONTENT_SUGGEST_USE_INDEX = os.getenv('CONTENT_SUGGEST_USE_INDEX', 'True') == 'True'
+CONTENT_SUGGEST_INDEX_MAX_ENTRIES = int(os.getenv('CONTENT_SUGGEST_INDEX_MAX_ENTRIES', '200000'))
+# Minimum seconds between background index rebuilds triggered by other
+# processes' writes (without the shared cache, which shows those writes,
+# the index is rebuilt this often)
+CONTENT_SUGGEST_REBUILD_INTERVAL = int(os.getenv('CONTENT_SUGGEST_REBUILD_INTERVAL', '10'))
+# Trending scores (compute_trending): activity loses half its weight every half-life
+TRENDING_HALF_LIFE_HOURS = float(os.getenv('TRENDING_HALF_LIFE_HOURS', '24'))
+TRENDING_VIEW_WEIGHT = float(os.getenv('TRENDING_VIEW_WEIGHT', '1'))
+TRENDING_OFFER_WEIGHT = float(os.getenv('TRENDING_OFFER_WEIGHT', '10'))
+
+# Offer expiry (expire_offers): due pending offers expired per UPDATE statement
+OFFER_EXPIRY_BATCH_SIZE = int(os.getenv('OFFER_EXPIRY_BATCH_SIZE', '5000'))
+
 # DRF Spectacular (API Documentation)
 SPECTACULAR_SETTINGS = {
     'TITLE': 'ShortDeal API',
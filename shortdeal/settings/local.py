@@ -23,7 +23,11 @@ DATABASES = {
 
 # Debug Toolbar
 INSTALLED_APPS += ['debug_toolbar']
-MIDDLEWARE = ['debug_toolbar.middleware.DebugToolbarMiddleware'] + MIDDLEWARE
+# The toolbar must run after response compression
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('apps.core.middleware.CompressionMiddleware') + 1,
+    'debug_toolbar.middleware.DebugToolbarMiddleware'
+)
 INTERNAL_IPS = ['127.0.0.1', '0.0.0.0']
 
 # Email - 콘솔 출력 (개발용)
@@ -2,17 +2,21 @@ from django.contrib import admin
 from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
-from django.views.generic import TemplateView
 from django.views.static import serve
 from django.views.i18n import set_language
 
+from apps.core.views import csrf_token_view, home_view
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', TemplateView.as_view(template_name='home.html'), name='home'),
+    path('', home_view, name='home'),
 
     # Language switcher
+    # Public pages render no CSRF token (so they stay cacheable); the navbar
+    # form fetches one from i18n/csrf/ right before posting
     path('i18n/setlang/', set_language, name='set_language'),
+    path('i18n/csrf/', csrf_token_view, name='csrf_token'),
 
     # API URLs (JWT-based)
     path('api/v1/auth/', include('apps.accounts.api_urls')),